@@ -12,69 +12,35 @@ TWO MERIT SCORES:
 Requirements:
     pip install dash dash-bootstrap-components pandas numpy websocket-client requests scipy
 
-"""
-
-import time
-import threading
-import numpy as np
-from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from collections import deque
-import webbrowser
-from enum import Enum
-import copy
-import json
-
-import dash
-from dash import dcc, html, Input, Output, State, callback_context, dash_table
-import dash_bootstrap_components as dbc
-import pandas as pd
-
-import websocket
-import ssl
-import requests
-
-# ============================================================================
-# API KEY
-# ============================================================================
-
-POLYGON_API_KEY = "PnzhJOXEJO7tSpHr0ct2zjFKi6XO0yGi"
-
-# ============================================================================
-# CONFIGURATION
-# ============================================================================
-
-# -*- coding: utf-8 -*-
-"""
-Beyond Price and Time
-Copyright © 2026 Truth Communications LLC. All Rights Reserved.
-
-Top 1000 stocks with historical backfill for immediate trading signals
-True R:R based on price position within stasis bands
-TWO MERIT SCORES: 
-  - Stasis Merit Score (SMS): Based on stasis patterns
-  - Fundamental Merit Score (FMS): Based on fundamental growth SLOPES
-
-Requirements:
-    pip install dash dash-bootstrap-components pandas numpy websocket-client requests scipy
+Run:
+    python app.py                                   (engine + dev server)
+    gunicorn app:server --config gunicorn.conf.py   (engine started in post_fork)
 
 """
 
 import time
 import threading
 import numpy as np
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Set, Tuple, Optional, Callable, Iterable, Mapping, Any
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from collections import deque
+from array import array
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import webbrowser
 from enum import Enum
-import copy
 import json
+import bisect
+import os
+import sys
+import types
+import uuid
+import socket
+import sqlite3
 
 import dash
 from dash import dcc, html, Input, Output, State, callback_context, dash_table
+from flask import jsonify
 import dash_bootstrap_components as dbc
 import pandas as pd
 
@@ -384,17 +350,119 @@ class Config:
     polygon_ws_url: str = "wss://delayed.polygon.io/stocks"
     polygon_rest_url: str = "https://api.polygon.io"
     
+    # Local on-disk caches (fundamentals, ...)
+    cache_dir: str = "cache"
+    fundamental_quarters: int = 24
+    
+    # REST ingestion (shared by every startup fetcher)
+    rest_max_workers: int = 16
+    rest_requests_per_second: float = 25.0
+    rest_burst: int = 25
+    http_pool_maxsize: int = 32
+    
     volumes: Dict[str, float] = field(default_factory=dict)
     week52_data: Dict[str, Dict] = field(default_factory=dict)
+    daily_bars: Dict[str, Dict[str, np.ndarray]] = field(default_factory=dict)
+    # 'per_symbol' = one daily-bar request per symbol
+    # 'grouped'    = one grouped-daily request per trading date for the whole market
+    daily_data_mode: str = 'per_symbol'
     
     # Fundamental data storage
     fundamental_data: Dict[str, Dict] = field(default_factory=dict)
     fundamental_slopes: Dict[str, Dict] = field(default_factory=dict)
     
     min_tradable_stasis: int = 3
+    
+    # Bitstream warm-start checkpoints (seconds between saves)
+    checkpoint_interval: float = 60.0
+    
+    # 'streams' = one Bitstream object per (symbol, threshold)
+    # 'bank'    = every stream as a row of one struct-of-arrays BitstreamBank
+    stream_engine: str = 'streams'
+
+
+# ============================================================================
+# ENGINE REGISTRY (EXACTLY ONE ENGINE PER PROCESS)
+# ============================================================================
+
+class EngineRegistry:
+    """
+    Process-wide home of the engine components (config, REST clients, price
+    feed, bitstream manager). It is kept in sys.modules, so if this file is
+    executed more than once in a process (run as __main__ and imported as
+    app) every copy attaches to the same engine instead of starting another.
+    """
+    MODULE_NAME = "_beyond_price_time_engine"
+    
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.pid = os.getpid()
+        self.engine_id = f"{socket.gethostname()}:{self.pid}:{uuid.uuid4().hex[:8]}"
+        self.created_at = datetime.now()
+        self.components: Dict[str, Any] = {}
+        self.init_thread: Optional[threading.Thread] = None
+        self.started = False
+        self.attached_apps: List[str] = []
+    
+    @classmethod
+    def get(cls) -> 'EngineRegistry':
+        holder = sys.modules.get(cls.MODULE_NAME)
+        if holder is None:
+            candidate = types.ModuleType(cls.MODULE_NAME)
+            candidate.registry = cls()
+            holder = sys.modules.setdefault(cls.MODULE_NAME, candidate)
+        return holder.registry
+    
+    def get_or_create(self, name: str, factory: Callable[[], Any]) -> Any:
+        """Return the registered component, creating it on first use."""
+        with self.lock:
+            if name not in self.components:
+                self.components.setdefault(name, factory())
+            return self.components[name]
+    
+    def claim(self, name: str, instance: Any):
+        """Register a component from its constructor; refuses a second live instance."""
+        with self.lock:
+            existing = self.components.get(name)
+            if existing is not None and existing is not instance:
+                raise RuntimeError(
+                    f"{type(instance).__name__} already exists in engine {self.engine_id}; "
+                    f"use the registered '{name}' instead of creating another"
+                )
+            self.components[name] = instance
+    
+    def attach_app(self, server) -> str:
+        """Bind a Flask server to this engine and return the engine id."""
+        server.config['ENGINE_ID'] = self.engine_id
+        with self.lock:
+            self.attached_apps.append(server.import_name)
+        return self.engine_id
+    
+    def describe(self) -> Dict:
+        with self.lock:
+            return {
+                'engine_id': self.engine_id,
+                'pid': self.pid,
+                'created_at': self.created_at.isoformat(timespec='seconds'),
+                'started': self.started,
+                'components': {
+                    name: f"{type(component).__name__}@{id(component):#x}"
+                    for name, component in self.components.items()
+                },
+                'attached_apps': list(self.attached_apps),
+            }
+
+
+engine_registry = EngineRegistry.get()
+
+
+def _create_config() -> Config:
+    new_config = Config()
+    new_config.symbols = list(dict.fromkeys(new_config.symbols))
+    return new_config
 
-config = Config()
-config.symbols = list(dict.fromkeys(config.symbols))
+
+config = engine_registry.get_or_create('config', _create_config)
 
 # ============================================================================
 # ENUMS
@@ -410,23 +478,303 @@ class SignalStrength(Enum):
     STRONG = "STRONG"
     VERY_STRONG = "VERY_STRONG"
 
+# ============================================================================
+# REST INGESTION ENGINE (SHARED THREAD POOL + TOKEN BUCKET)
+# ============================================================================
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. Every Polygon REST request takes one token,
+    so total request rate is bounded by the plan quota, not by fixed sleeps.
+    """
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self, tokens: float = 1.0):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class IngestionEngine:
+    """
+    One thread pool shared by all startup stages (52-week, volume,
+    fundamentals, backfill). Stages submit per-symbol jobs with map();
+    results are handed back on the calling thread as they complete.
+    """
+    def __init__(self, max_workers: int, rate: float, burst: int):
+        self.max_workers = max_workers
+        self.limiter = TokenBucket(rate, burst)
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.lock = threading.Lock()
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="ingest"
+                )
+            return self.executor
+    
+    def map(self, fn: Callable[[str], Any], keys: List[str],
+            on_result: Optional[Callable[[str, Any, int], None]] = None) -> Dict[str, Any]:
+        """
+        Run fn(key) for every key (a symbol, or a date for grouped loads) on the pool.
+        on_result(key, result, completed_count) is called in completion order.
+        A job that raises yields None; an on_result that raises is logged and
+        skipped for that key, so one bad result never aborts the stage.
+        """
+        executor = self._get_executor()
+        futures = {executor.submit(fn, key): key for key in keys}
+        results = {}
+        
+        for completed, future in enumerate(as_completed(futures), start=1):
+            key = futures[future]
+            try:
+                result = future.result()
+            except Exception:
+                result = None
+            results[key] = result
+            if on_result is not None:
+                try:
+                    on_result(key, result, completed)
+                except Exception as e:
+                    print(f"❌ Ingestion result error for {key}: {e}")
+        
+        return results
+    
+    def throttle(self):
+        """Block until the rate limit allows one more REST request."""
+        self.limiter.acquire()
+
+
+ingestion = engine_registry.get_or_create('ingestion', lambda: IngestionEngine(
+    config.rest_max_workers, config.rest_requests_per_second, config.rest_burst
+))
+
+
+# ============================================================================
+# POLYGON HTTP SESSION (POOLED KEEP-ALIVE CONNECTIONS)
+# ============================================================================
+
+class PolygonSession:
+    """
+    One pooled requests.Session for every Polygon REST call: keep-alive
+    connections are reused across symbols instead of a new TLS handshake
+    per request. Records per-endpoint latency.
+    """
+    def __init__(self, pool_maxsize: int):
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_maxsize,
+            pool_block=True,
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'Accept-Encoding': 'gzip',
+            'Connection': 'keep-alive',
+        })
+        
+        self.lock = threading.Lock()
+        self.latency: Dict[str, Dict] = {}
+    
+    def get(self, url: str, endpoint: str, timeout: float = 10, **kwargs) -> requests.Response:
+        """Rate-limited GET through the shared pool, timed under `endpoint`."""
+        ingestion.throttle()
+        start = time.perf_counter()
+        ok = False
+        try:
+            response = self.session.get(url, timeout=timeout, **kwargs)
+            ok = response.status_code == 200
+            return response
+        finally:
+            self._record(endpoint, (time.perf_counter() - start) * 1000, ok)
+    
+    def _record(self, endpoint: str, elapsed_ms: float, ok: bool):
+        with self.lock:
+            stats = self.latency.get(endpoint)
+            if stats is None:
+                stats = {'count': 0, 'errors': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+                         'samples': deque(maxlen=2000)}
+                self.latency[endpoint] = stats
+            stats['count'] += 1
+            stats['total_ms'] += elapsed_ms
+            stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+            stats['samples'].append(elapsed_ms)
+            if not ok:
+                stats['errors'] += 1
+    
+    def get_latency_report(self) -> Dict[str, Dict]:
+        report = {}
+        with self.lock:
+            for endpoint, stats in self.latency.items():
+                samples = np.array(stats['samples']) if stats['samples'] else np.zeros(1)
+                report[endpoint] = {
+                    'count': stats['count'],
+                    'errors': stats['errors'],
+                    'avg_ms': stats['total_ms'] / stats['count'] if stats['count'] else 0.0,
+                    'p50_ms': float(np.percentile(samples, 50)),
+                    'p95_ms': float(np.percentile(samples, 95)),
+                    'max_ms': stats['max_ms'],
+                }
+        return report
+    
+    def print_latency_report(self):
+        report = self.get_latency_report()
+        if not report:
+            return
+        print("\n⏱️  REST LATENCY BY ENDPOINT")
+        for endpoint, r in sorted(report.items()):
+            print(f"   {endpoint:<18} n={r['count']:<5} err={r['errors']:<4} "
+                  f"avg={r['avg_ms']:.0f}ms p50={r['p50_ms']:.0f}ms p95={r['p95_ms']:.0f}ms max={r['max_ms']:.0f}ms")
+
+
+polygon_session = engine_registry.get_or_create('polygon_session', lambda: PolygonSession(config.http_pool_maxsize))
+
+
+# ============================================================================
+# FUNDAMENTALS CACHE (SQLITE, KEYED BY SYMBOL + FILING DATE)
+# ============================================================================
+
+FUNDAMENTAL_METRICS = [
+    'revenue', 'net_income', 'operating_cash_flow', 'capex', 'fcf',
+    'total_assets', 'total_liabilities', 'shareholders_equity',
+    'current_assets', 'current_liabilities', 'total_debt', 'eps',
+]
+
+
+class FundamentalsCache:
+    """
+    Quarterly filings persisted per (symbol, filing_date), plus the slopes
+    computed from them. Filings only change quarterly, so a restart loads
+    from here and asks Polygon only for filings newer than the latest cached one.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn: Optional[sqlite3.Connection] = None
+    
+    def _connect(self) -> sqlite3.Connection:
+        if self.conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self.conn = sqlite3.connect(self.path, check_same_thread=False)
+            columns = ", ".join(f"{m} REAL" for m in FUNDAMENTAL_METRICS)
+            self.conn.execute(
+                f"CREATE TABLE IF NOT EXISTS filings ("
+                f"symbol TEXT NOT NULL, filing_date TEXT NOT NULL, {columns}, "
+                f"PRIMARY KEY (symbol, filing_date))"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS slopes ("
+                "symbol TEXT PRIMARY KEY, latest_filing TEXT, slopes TEXT)"
+            )
+            self.conn.commit()
+        return self.conn
+    
+    def load_fundamentals(self, quarters: int) -> Dict[str, Dict]:
+        """Latest `quarters` filings per symbol, oldest first, in fetch_fundamental_data_polygon's shape."""
+        with self.lock:
+            rows = self._connect().execute(
+                f"SELECT symbol, filing_date, {', '.join(FUNDAMENTAL_METRICS)} "
+                f"FROM filings ORDER BY symbol, filing_date"
+            ).fetchall()
+        
+        fundamentals = {}
+        for row in rows:
+            symbol = row[0]
+            f = fundamentals.get(symbol)
+            if f is None:
+                f = {'dates': []}
+                f.update({m: [] for m in FUNDAMENTAL_METRICS})
+                fundamentals[symbol] = f
+            f['dates'].append(row[1])
+            for m, value in zip(FUNDAMENTAL_METRICS, row[2:]):
+                f[m].append(value if value is not None else 0)
+        
+        for f in fundamentals.values():
+            for key in f:
+                f[key] = f[key][-quarters:]
+        
+        return fundamentals
+    
+    def load_slopes(self) -> Dict[str, Dict]:
+        with self.lock:
+            rows = self._connect().execute("SELECT symbol, slopes FROM slopes").fetchall()
+        return {symbol: json.loads(payload) for symbol, payload in rows}
+    
+    def save(self, symbol: str, fundamentals: Dict, slopes: Optional[Dict]):
+        """Upsert a symbol's filings and, when given, replace its slopes."""
+        rows = [
+            (symbol, date, *[fundamentals[m][i] for m in FUNDAMENTAL_METRICS])
+            for i, date in enumerate(fundamentals['dates']) if date
+        ]
+        placeholders = ", ".join("?" * (2 + len(FUNDAMENTAL_METRICS)))
+        latest = max((r[1] for r in rows), default='')
+        
+        with self.lock:
+            conn = self._connect()
+            conn.executemany(f"INSERT OR REPLACE INTO filings VALUES ({placeholders})", rows)
+            if slopes is not None:
+                conn.execute(
+                    "INSERT OR REPLACE INTO slopes VALUES (?, ?, ?)",
+                    (symbol, latest, json.dumps(slopes)),
+                )
+            conn.commit()
+
+
+def merge_fundamentals(cached: Optional[Dict], new: Optional[Dict], quarters: int) -> Dict:
+    """Union of cached and new filings by filing date, oldest first, trimmed to `quarters`."""
+    by_date = {}
+    for source in (cached, new):
+        if not source:
+            continue
+        for i, date in enumerate(source['dates']):
+            by_date[date] = i, source
+    
+    ordered = sorted(by_date.items())[-quarters:]
+    merged = {'dates': [date for date, _ in ordered]}
+    for m in FUNDAMENTAL_METRICS:
+        merged[m] = [source[m][i] for _, (i, source) in ordered]
+    return merged
+
+
+fundamentals_cache = engine_registry.get_or_create('fundamentals_cache', lambda: FundamentalsCache(
+    os.path.join(config.cache_dir, "fundamentals.sqlite")
+))
+
 # ============================================================================
 # FUNDAMENTAL DATA FETCHER (POLYGON FINANCIALS API)
 # ============================================================================
 
-def fetch_fundamental_data_polygon(symbol: str) -> Optional[Dict]:
+def fetch_fundamental_data_polygon(symbol: str, filed_after: Optional[str] = None) -> Optional[Dict]:
     """
     Fetch quarterly financial data from Polygon's Financials API.
     Returns dict with lists of quarterly values for each metric.
+    With filed_after, only filings strictly newer than that filing date are requested.
     """
     try:
         url = (
             f"{config.polygon_rest_url}/vX/reference/financials"
-            f"?ticker={symbol}&timeframe=quarterly&limit=24&sort=filing_date"
+            f"?ticker={symbol}&timeframe=quarterly&limit={config.fundamental_quarters}&sort=filing_date"
             f"&order=desc&apiKey={config.polygon_api_key}"
         )
+        if filed_after:
+            url += f"&filing_date.gt={filed_after}"
         
-        response = requests.get(url, timeout=30)
+        response = polygon_session.get(url, endpoint='financials', timeout=30)
         
         if response.status_code != 200:
             return None
@@ -516,88 +864,101 @@ def fetch_fundamental_data_polygon(symbol: str) -> Optional[Dict]:
         return None
 
 
-def calculate_financial_ratios(fundamentals: Dict, current_price: float, market_cap: float) -> Dict:
+class FundamentalsPanel:
     """
-    Calculate financial ratios from raw fundamental data.
+    Filings for many symbols as one symbol x quarter x metric float64 panel
+    (oldest quarter first, NaN-padded past each symbol's history), with a
+    presence mask for values that are actually there. Ratios for the whole
+    universe come from masked array arithmetic over the panel, so repricing
+    every symbol is a handful of array operations.
     """
-    ratios = {
-        'pe_ratio': [],
-        'current_ratio': [],
-        'roe': [],
-        'roa': [],
-        'net_profit_margin': [],
-        'debt_to_equity': [],
-        'price_to_book': [],
-        'price_to_sales': [],
-        'asset_turnover': [],
-        'fcfy': [],
-    }
-    
-    n = len(fundamentals.get('revenue', []))
-    
-    for i in range(n):
-        try:
-            revenue = fundamentals['revenue'][i]
-            net_income = fundamentals['net_income'][i]
-            total_assets = fundamentals['total_assets'][i]
-            equity = fundamentals['shareholders_equity'][i]
-            current_assets = fundamentals['current_assets'][i]
-            current_liabilities = fundamentals['current_liabilities'][i]
-            total_debt = fundamentals['total_debt'][i]
-            eps = fundamentals['eps'][i]
-            fcf = fundamentals['fcf'][i]
-            
-            # P/E Ratio
-            pe = current_price / eps if eps and eps > 0 else None
-            ratios['pe_ratio'].append(pe)
-            
-            # Current Ratio
-            cr = current_assets / current_liabilities if current_liabilities else None
-            ratios['current_ratio'].append(cr)
-            
-            # ROE
-            roe = net_income / equity if equity and equity > 0 else None
-            ratios['roe'].append(roe)
-            
-            # ROA
-            roa = net_income / total_assets if total_assets else None
-            ratios['roa'].append(roa)
-            
-            # Net Profit Margin
-            npm = net_income / revenue if revenue else None
-            ratios['net_profit_margin'].append(npm)
-            
-            # Debt to Equity
-            de = total_debt / equity if equity and equity > 0 else None
-            ratios['debt_to_equity'].append(de)
-            
-            # Price to Book (using most recent price for all)
-            book_value_per_share = equity / (market_cap / current_price) if current_price and market_cap else None
-            pb = current_price / book_value_per_share if book_value_per_share and book_value_per_share > 0 else None
-            ratios['price_to_book'].append(pb)
-            
-            # Price to Sales (annualized)
+    RATIO_INPUTS = [
+        'revenue', 'net_income', 'total_assets', 'shareholders_equity',
+        'current_assets', 'current_liabilities', 'total_debt', 'eps', 'fcf',
+    ]
+    
+    def __init__(self, symbols: List[str], fundamentals_by_symbol: Dict[str, Dict]):
+        self.symbols = list(symbols)
+        self.lengths = np.array([len(fundamentals_by_symbol.get(s, {}).get('revenue') or []) for s in self.symbols],
+                                dtype=np.int64)
+        quarters = int(self.lengths.max()) if len(self.symbols) else 0
+        
+        shape = (len(self.symbols), quarters, len(self.RATIO_INPUTS))
+        self.values = np.full(shape, np.nan)
+        self.present = np.zeros(shape, dtype=bool)
+        for i, symbol in enumerate(self.symbols):
+            fundamentals = fundamentals_by_symbol.get(symbol, {})
+            for m, metric in enumerate(self.RATIO_INPUTS):
+                series = (fundamentals.get(metric) or [])[:self.lengths[i]]
+                self.values[i, :len(series), m] = [np.nan if value is None else value for value in series]
+                self.present[i, :len(series), m] = [value is not None for value in series]
+    
+    def metric(self, name: str) -> np.ndarray:
+        return self.values[:, :, self.RATIO_INPUTS.index(name)]
+    
+    def ratios(self, prices: np.ndarray, market_caps: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Per-quarter ratios (symbol x quarter, NaN where undefined) for one
+        price and market cap per symbol. A quarter with any input missing
+        gets no ratios at all, and FCFY needs four present quarters of FCF.
+        """
+        revenue, net_income = self.metric('revenue'), self.metric('net_income')
+        total_assets, equity = self.metric('total_assets'), self.metric('shareholders_equity')
+        current_assets, current_liabilities = self.metric('current_assets'), self.metric('current_liabilities')
+        total_debt, eps, fcf = self.metric('total_debt'), self.metric('eps'), self.metric('fcf')
+        
+        quarters = self.values.shape[1]
+        price = prices[:, None]
+        market_cap = market_caps[:, None]
+        priced = (price != 0) & (market_cap != 0)
+        
+        # Trailing 4-quarter FCF, summed oldest first
+        fcf_present = self.present[:, :, self.RATIO_INPUTS.index('fcf')]
+        annual_fcf = np.full(fcf.shape, np.nan)
+        window_present = np.zeros(fcf.shape, dtype=bool)
+        if quarters >= 4:
+            annual_fcf[:, 3:] = fcf[:, :-3] + fcf[:, 1:-2] + fcf[:, 2:-1] + fcf[:, 3:]
+            window_present[:, 3:] = fcf_present[:, :-3] & fcf_present[:, 1:-2] & fcf_present[:, 2:-1] & fcf_present[:, 3:]
+        
+        in_history = np.arange(quarters)[None, :] < self.lengths[:, None]
+        complete = in_history & self.present.all(axis=2)
+        complete[:, 3:] &= window_present[:, 3:]
+        
+        def masked(condition, values):
+            return np.where(complete & condition, values, np.nan)
+        
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            book_value_per_share = masked(priced, equity / (market_cap / price))
             annual_revenue = revenue * 4  # Quarterly to annual
-            ps = market_cap / annual_revenue if annual_revenue else None
-            ratios['price_to_sales'].append(ps)
-            
-            # Asset Turnover
-            at = revenue / total_assets if total_assets else None
-            ratios['asset_turnover'].append(at)
-            
-            # FCFY (using trailing 4 quarters)
-            if i >= 3:
-                annual_fcf = sum(fundamentals['fcf'][max(0, i-3):i+1])
-                fcfy = annual_fcf / market_cap if market_cap else None
-            else:
-                fcfy = None
-            ratios['fcfy'].append(fcfy)
-            
-        except Exception as e:
-            for key in ratios:
-                ratios[key].append(None)
+            return {
+                'pe_ratio': masked(eps > 0, price / eps),
+                'current_ratio': masked(current_liabilities != 0, current_assets / current_liabilities),
+                'roe': masked(equity > 0, net_income / equity),
+                'roa': masked(total_assets != 0, net_income / total_assets),
+                'net_profit_margin': masked(revenue != 0, net_income / revenue),
+                'debt_to_equity': masked(equity > 0, total_debt / equity),
+                'price_to_book': masked(book_value_per_share > 0, price / book_value_per_share),
+                'price_to_sales': masked(annual_revenue != 0, market_cap / annual_revenue),
+                'asset_turnover': masked(total_assets != 0, revenue / total_assets),
+                'fcfy': masked((market_cap != 0) & window_present, annual_fcf / market_cap),
+            }
     
-    return ratios
+    def ratio_lists(self, ratios: Dict[str, np.ndarray], row: int) -> Dict[str, List[Optional[float]]]:
+        """One symbol's ratios as per-quarter lists (None where undefined)."""
+        n = int(self.lengths[row])
+        return {
+            name: [None if value != value else value for value in values[row, :n].tolist()]
+            for name, values in ratios.items()
+        }
+
+
+def calculate_financial_ratios(fundamentals: Dict, current_price: float, market_cap: float) -> Dict:
+    """
+    Calculate financial ratios from raw fundamental data.
+    """
+    panel = FundamentalsPanel([''], {'': fundamentals})
+    ratios = panel.ratios(np.array([current_price], dtype=np.float64), np.array([market_cap], dtype=np.float64))
+    return panel.ratio_lists(ratios, 0)
 
 
 def calculate_slopes(series: List, span_short: int = 4, span_long: int = 20) -> Tuple[Optional[float], Optional[float]]:
@@ -670,86 +1031,212 @@ def calculate_all_slopes(fundamentals: Dict, ratios: Dict) -> Dict:
     return slopes
 
 
+def estimate_price_and_market_cap(symbol: str, fundamentals: Dict) -> Tuple[float, float]:
+    """
+    Price and market cap the symbol's ratios are computed against.
+    """
+    # Get current price and market cap from week52 data
+    current_price = None
+    market_cap = None
+    
+    if symbol in config.week52_data:
+        w52 = config.week52_data[symbol]
+        if w52.get('high') and w52.get('low'):
+            # Estimate current price from percentile
+            current_price = (w52['high'] + w52['low']) / 2
+    
+    # Last known close for an accurate price
+    last_close = price_reference.get(symbol)
+    if last_close is not None:
+        current_price = last_close
+    
+    # Estimate market cap (shares outstanding * price)
+    # For now, use a rough estimate from fundamentals
+    if fundamentals.get('shareholders_equity') and current_price:
+        # Very rough estimate
+        latest_equity = fundamentals['shareholders_equity'][-1]
+        if latest_equity and latest_equity > 0:
+            market_cap = latest_equity * 2  # Rough multiplier
+        else:
+            market_cap = 1e9  # Default 1B
+    else:
+        market_cap = 1e9
+    
+    if current_price is None:
+        current_price = 100  # Default
+    
+    return current_price, market_cap
+
+
+def price_fundamentals_panel(panel: FundamentalsPanel) -> Tuple[np.ndarray, np.ndarray]:
+    """Price and market-cap vectors for panel.ratios(), one entry per panel symbol."""
+    priced = [estimate_price_and_market_cap(symbol, config.fundamental_data.get(symbol, {}))
+              for symbol in panel.symbols]
+    prices = np.array([price for price, _ in priced], dtype=np.float64)
+    market_caps = np.array([market_cap for _, market_cap in priced], dtype=np.float64)
+    return prices, market_caps
+
+
+def fetch_symbol_fundamentals(symbol: str, cached: Optional[Dict]) -> Optional[Dict]:
+    """
+    Fetch filings newer than the latest cached one and merge them into the
+    cached history. Returns the merged fundamentals for a changed symbol, or
+    None if unchanged. Runs on the ingestion pool.
+    """
+    try:
+        filed_after = cached['dates'][-1] if cached and cached['dates'] else None
+        
+        # Fetch raw fundamental data
+        new_filings = fetch_fundamental_data_polygon(symbol, filed_after)
+        
+        if not new_filings or not new_filings.get('revenue'):
+            return None
+        
+        return merge_fundamentals(cached, new_filings, config.fundamental_quarters)
+        
+    except Exception as e:
+        return None
+
+
 def fetch_all_fundamental_data():
     """
-    Fetch fundamental data for all symbols and calculate slopes.
+    Load cached fundamentals, fetch only filings newer than the cache and
+    recalculate slopes for the symbols that changed. Their ratios come from
+    one panel over the changed symbols with at least 4 quarters, priced in a
+    single ratios() call. Returns the set of changed symbols.
     """
     print("\n📊 FETCHING FUNDAMENTAL DATA...")
     
-    success_count = 0
-    fail_count = 0
+    # Serve cached filings and slopes immediately
+    cached_fundamentals = fundamentals_cache.load_fundamentals(config.fundamental_quarters)
+    cached_slopes = fundamentals_cache.load_slopes()
+    
+    for symbol in config.symbols:
+        if symbol in cached_fundamentals and symbol in cached_slopes:
+            config.fundamental_data[symbol] = cached_fundamentals[symbol]
+            config.fundamental_slopes[symbol] = cached_slopes[symbol]
+    fms_cache.invalidate(cached_slopes)
+    
+    print(f"   💾 Loaded {len(config.fundamental_slopes)} symbols from cache")
     
-    for i, symbol in enumerate(config.symbols):
+    # Closes for pricing the ratios come from data already fetched;
+    # one bulk refresh covers any symbol the daily stage missed
+    if price_reference.missing(config.symbols):
+        price_reference.refresh_all()
+    
+    changed = set()
+    
+    def on_result(symbol: str, fundamentals: Optional[Dict], completed: int):
+        if fundamentals is not None:
+            config.fundamental_data[symbol] = fundamentals
+            changed.add(symbol)
+        
+        if completed % 25 == 0:
+            print(f"   📈 Fundamentals: {completed}/{len(config.symbols)} (Δ{len(changed)} changed)")
+    
+    ingestion.map(
+        lambda s: fetch_symbol_fundamentals(s, cached_fundamentals.get(s)),
+        config.symbols, on_result
+    )
+    
+    # One panel for every changed symbol, priced in one pass
+    panel = FundamentalsPanel(
+        [s for s in config.symbols if s in changed and len(config.fundamental_data[s]['revenue']) >= 4],
+        config.fundamental_data
+    )
+    ratios = panel.ratios(*price_fundamentals_panel(panel))
+    
+    for row, symbol in enumerate(panel.symbols):
+        config.fundamental_slopes[symbol] = calculate_all_slopes(
+            config.fundamental_data[symbol], panel.ratio_lists(ratios, row)
+        )
+    fms_cache.invalidate(changed)
+    
+    for symbol in changed:
         try:
-            # Fetch raw fundamental data
-            fundamentals = fetch_fundamental_data_polygon(symbol)
-            
-            if fundamentals and len(fundamentals.get('revenue', [])) >= 4:
-                # Get current price and market cap from week52 data
-                current_price = None
-                market_cap = None
-                
-                if symbol in config.week52_data:
-                    w52 = config.week52_data[symbol]
-                    if w52.get('high') and w52.get('low'):
-                        # Estimate current price from percentile
-                        current_price = (w52['high'] + w52['low']) / 2
-                
-                # Fetch current quote for accurate price
-                try:
-                    quote_url = f"{config.polygon_rest_url}/v2/aggs/ticker/{symbol}/prev?adjusted=true&apiKey={config.polygon_api_key}"
-                    quote_resp = requests.get(quote_url, timeout=10)
-                    if quote_resp.status_code == 200:
-                        quote_data = quote_resp.json()
-                        if quote_data.get('results') and len(quote_data['results']) > 0:
-                            current_price = quote_data['results'][0].get('c', current_price)
-                except:
-                    pass
-                
-                # Estimate market cap (shares outstanding * price)
-                # For now, use a rough estimate from fundamentals
-                if fundamentals.get('shareholders_equity') and current_price:
-                    # Very rough estimate
-                    latest_equity = fundamentals['shareholders_equity'][-1]
-                    if latest_equity and latest_equity > 0:
-                        market_cap = latest_equity * 2  # Rough multiplier
-                    else:
-                        market_cap = 1e9  # Default 1B
-                else:
-                    market_cap = 1e9
-                
-                if current_price is None:
-                    current_price = 100  # Default
-                
-                # Calculate ratios
-                ratios = calculate_financial_ratios(fundamentals, current_price, market_cap)
-                
-                # Calculate all slopes
-                slopes = calculate_all_slopes(fundamentals, ratios)
-                
-                # Store
-                config.fundamental_data[symbol] = fundamentals
-                config.fundamental_slopes[symbol] = slopes
-                
-                success_count += 1
-            else:
-                fail_count += 1
-                
+            fundamentals_cache.save(symbol, config.fundamental_data[symbol], config.fundamental_slopes.get(symbol))
         except Exception as e:
-            fail_count += 1
-        
-        if (i + 1) % 25 == 0:
-            print(f"   📈 Fundamentals: {i + 1}/{len(config.symbols)} (✓{success_count} ✗{fail_count})")
-        
-        time.sleep(0.15)  # Rate limiting
+            print(f"❌ Fundamentals cache error for {symbol}: {e}")
     
-    print(f"✅ Fundamental data: {success_count} success, {fail_count} failed\n")
+    success_count = sum(1 for s in config.symbols if s in config.fundamental_slopes)
+    print(f"✅ Fundamental data: {success_count} success, {len(config.symbols) - success_count} failed, "
+          f"{len(changed)} refreshed\n")
+    return changed
 
 
 # ============================================================================
 # MERIT SCORE CALCULATIONS
 # ============================================================================
 
+# Scoring rules as breakpoint tables. A rule awards points[i], where i is the
+# number of edges the value has reached: edges <= value when higher is better,
+# edges < value when lower is better. Missing values score 0.
+
+@dataclass(frozen=True)
+class BreakpointRule:
+    field: str
+    edges: Tuple[float, ...]
+    points: Tuple[int, ...]  # len(edges) + 1 entries
+    higher_is_better: bool = True
+    
+    def score(self, value: Optional[float]) -> int:
+        if value is None or value != value:
+            return 0
+        if self.higher_is_better:
+            return self.points[bisect.bisect_right(self.edges, value)]
+        return self.points[bisect.bisect_left(self.edges, value)]
+    
+    def score_array(self, values: np.ndarray) -> np.ndarray:
+        """Vectorized score(); NaN marks a missing value."""
+        side = 'right' if self.higher_is_better else 'left'
+        scores = np.asarray(self.points)[np.searchsorted(self.edges, values, side=side)]
+        return np.where(np.isnan(values), 0, scores)
+
+
+# STASIS MERIT (max 22): stasis 0-10, R:R 0-5, strength 0-4, duration 0-3
+DURATION_RULE = BreakpointRule('duration_seconds', (900, 1800, 3600), (0, 1, 2, 3))
+STASIS_MERIT_RULES = [
+    BreakpointRule('stasis', (2, 3, 4, 5, 6, 7, 8, 10, 12, 15), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10)),
+    BreakpointRule('risk_reward', (1, 1.5, 2, 2.5, 3), (0, 1, 2, 3, 4, 5)),
+    DURATION_RULE,
+]
+STRENGTH_POINTS = {'VERY_STRONG': 4, 'STRONG': 3, 'MODERATE': 2, 'WEAK': 1}
+
+# FUNDAMENTAL MERIT (~55): growth slopes (positive = good), valuation
+# slopes (negative = getting cheaper), FCFY, then the 52W percentile
+FUNDAMENTAL_MERIT_RULES = [
+    BreakpointRule('Rev_Slope_5', (0.05, 0.10, 0.20, 0.30), (0, 1, 2, 3, 4)),
+    BreakpointRule('Rev_Slope_20', (0.05, 0.10, 0.20), (0, 1, 2, 3)),
+    BreakpointRule('FCF_Slope_5', (0.05, 0.10, 0.25, 0.40), (0, 1, 2, 3, 4)),
+    BreakpointRule('FCF_Slope_20', (0.05, 0.15, 0.25), (0, 1, 2, 3)),
+    BreakpointRule('Return on Equity_Slope_5', (0.10, 0.20), (0, 1, 2)),
+    BreakpointRule('Return on Equity_Slope_20', (0.08, 0.15), (0, 1, 2)),
+    BreakpointRule('Return on Assets_Slope_5', (0.08, 0.15), (0, 1, 2)),
+    BreakpointRule('Net Profit Margin_Slope_5', (0.10, 0.20), (0, 1, 2)),
+    BreakpointRule('Net Profit Margin_Slope_20', (0.08, 0.15), (0, 1, 2)),
+    BreakpointRule('Asset Turnover_Slope_5', (0.10,), (0, 1)),
+    BreakpointRule('Current Ratio_Slope_5', (0.10,), (0, 1)),
+    BreakpointRule('P/E Ratio_Slope_5', (-0.25, -0.15, -0.05), (3, 2, 1, 0), higher_is_better=False),
+    BreakpointRule('P/E Ratio_Slope_20', (-0.20, -0.10), (2, 1, 0), higher_is_better=False),
+    BreakpointRule('Debt to Equity Ratio_Slope_5', (-0.20, -0.10), (2, 1, 0), higher_is_better=False),
+    BreakpointRule('Debt to Equity Ratio_Slope_20', (-0.15, -0.08), (2, 1, 0), higher_is_better=False),
+    BreakpointRule('Price to Book Ratio_Slope_5', (-0.20,), (1, 0), higher_is_better=False),
+    BreakpointRule('Price to Sales Ratio_Slope_5', (-0.20,), (1, 0), higher_is_better=False),
+    BreakpointRule('FCFY', (0.05, 0.10, 0.15), (0, 1, 2, 3)),
+]
+WEEK52_RULE = BreakpointRule('week52_percentile', (5, 15, 25, 35, 45, 55, 65, 75),
+                             (8, 7, 6, 5, 4, 3, 2, 1, 0), higher_is_better=False)
+
+# slope_details key -> fundamental_slopes key
+SLOPE_DETAIL_KEYS = {
+    'Rev_5': 'Rev_Slope_5', 'Rev_20': 'Rev_Slope_20',
+    'FCF_5': 'FCF_Slope_5', 'FCF_20': 'FCF_Slope_20',
+    'ROE_5': 'Return on Equity_Slope_5', 'ROA_5': 'Return on Assets_Slope_5',
+    'NPM_5': 'Net Profit Margin_Slope_5', 'PE_5': 'P/E Ratio_Slope_5',
+    'DE_5': 'Debt to Equity Ratio_Slope_5', 'FCFY': 'FCFY',
+}
+
+
 def calculate_stasis_merit_score(snapshot: Dict) -> int:
     """
     Calculate Stasis Merit Score (SMS) based on:
@@ -760,66 +1247,8 @@ def calculate_stasis_merit_score(snapshot: Dict) -> int:
     
     Max Score: 22 points
     """
-    merit_score = 0
-    
-    # Stasis count scoring (0-10 points)
-    stasis = snapshot.get('stasis', 0)
-    if stasis >= 15:
-        merit_score += 10
-    elif stasis >= 12:
-        merit_score += 9
-    elif stasis >= 10:
-        merit_score += 8
-    elif stasis >= 8:
-        merit_score += 7
-    elif stasis >= 7:
-        merit_score += 6
-    elif stasis >= 6:
-        merit_score += 5
-    elif stasis >= 5:
-        merit_score += 4
-    elif stasis >= 4:
-        merit_score += 3
-    elif stasis >= 3:
-        merit_score += 2
-    elif stasis >= 2:
-        merit_score += 1
-    
-    # Risk:Reward scoring (0-5 points)
-    rr = snapshot.get('risk_reward')
-    if rr is not None:
-        if rr >= 3:
-            merit_score += 5
-        elif rr >= 2.5:
-            merit_score += 4
-        elif rr >= 2:
-            merit_score += 3
-        elif rr >= 1.5:
-            merit_score += 2
-        elif rr >= 1:
-            merit_score += 1
-    
-    # Signal strength scoring (0-4 points)
-    strength = snapshot.get('signal_strength')
-    if strength == 'VERY_STRONG':
-        merit_score += 4
-    elif strength == 'STRONG':
-        merit_score += 3
-    elif strength == 'MODERATE':
-        merit_score += 2
-    elif strength == 'WEAK':
-        merit_score += 1
-    
-    # Duration scoring (0-3 points)
-    duration_seconds = snapshot.get('duration_seconds', 0)
-    if duration_seconds >= 3600:
-        merit_score += 3
-    elif duration_seconds >= 1800:
-        merit_score += 2
-    elif duration_seconds >= 900:
-        merit_score += 1
-    
-    return merit_score
+    merit_score = sum(rule.score(snapshot.get(rule.field)) for rule in STASIS_MERIT_RULES)
+    return merit_score + STRENGTH_POINTS.get(snapshot.get('signal_strength'), 0)
 
 
 def calculate_fundamental_merit_score(symbol: str, week52_percentile: Optional[float]) -> Tuple[int, Dict]:
@@ -833,2125 +1262,501 @@ def calculate_fundamental_merit_score(symbol: str, week52_percentile: Optional[f
     
     Returns: (score, slope_details_dict)
     """
-    merit_score = 0
-    slope_details = {}
-    
     slopes = config.fundamental_slopes.get(symbol, {})
+    merit_score = WEEK52_RULE.score(week52_percentile)
     
     if not slopes:
-        # No fundamental data available - return with just 52W percentile scoring
-        if week52_percentile is not None:
-            if week52_percentile <= 5: merit_score += 8
-            elif week52_percentile <= 15: merit_score += 7
-            elif week52_percentile <= 25: merit_score += 6
-            elif week52_percentile <= 35: merit_score += 5
-            elif week52_percentile <= 45: merit_score += 4
-            elif week52_percentile <= 55: merit_score += 3
-            elif week52_percentile <= 65: merit_score += 2
-            elif week52_percentile <= 75: merit_score += 1
-        return merit_score, slope_details
-    
-    # ========================================
-    # GROWTH METRICS - Positive slope = GOOD
-    # ========================================
-    
-    # REVENUE SLOPES (critical growth indicator)
-    rev_slope_5 = slopes.get('Rev_Slope_5')
-    rev_slope_20 = slopes.get('Rev_Slope_20')
-    slope_details['Rev_5'] = rev_slope_5
-    slope_details['Rev_20'] = rev_slope_20
-    
-    if rev_slope_5 is not None:
-        if rev_slope_5 >= 0.30: merit_score += 4      # 30%+ = exceptional growth
-        elif rev_slope_5 >= 0.20: merit_score += 3    # 20%+ = strong
-        elif rev_slope_5 >= 0.10: merit_score += 2    # 10%+ = solid
-        elif rev_slope_5 >= 0.05: merit_score += 1    # 5%+ = positive
-    
-    if rev_slope_20 is not None:
-        if rev_slope_20 >= 0.20: merit_score += 3
-        elif rev_slope_20 >= 0.10: merit_score += 2
-        elif rev_slope_20 >= 0.05: merit_score += 1
-    
-    # FCF SLOPES (cash generation acceleration)
-    fcf_slope_5 = slopes.get('FCF_Slope_5')
-    fcf_slope_20 = slopes.get('FCF_Slope_20')
-    slope_details['FCF_5'] = fcf_slope_5
-    slope_details['FCF_20'] = fcf_slope_20
-    
-    if fcf_slope_5 is not None:
-        if fcf_slope_5 >= 0.40: merit_score += 4
-        elif fcf_slope_5 >= 0.25: merit_score += 3
-        elif fcf_slope_5 >= 0.10: merit_score += 2
-        elif fcf_slope_5 >= 0.05: merit_score += 1
-    
-    if fcf_slope_20 is not None:
-        if fcf_slope_20 >= 0.25: merit_score += 3
-        elif fcf_slope_20 >= 0.15: merit_score += 2
-        elif fcf_slope_20 >= 0.05: merit_score += 1
-    
-    # ROE SLOPES (profitability improvement)
-    roe_slope_5 = slopes.get('Return on Equity_Slope_5')
-    roe_slope_20 = slopes.get('Return on Equity_Slope_20')
-    slope_details['ROE_5'] = roe_slope_5
-    
-    if roe_slope_5 is not None:
-        if roe_slope_5 >= 0.20: merit_score += 2
-        elif roe_slope_5 >= 0.10: merit_score += 1
-    
-    if roe_slope_20 is not None:
-        if roe_slope_20 >= 0.15: merit_score += 2
-        elif roe_slope_20 >= 0.08: merit_score += 1
-    
-    # ROA SLOPES
-    roa_slope_5 = slopes.get('Return on Assets_Slope_5')
-    slope_details['ROA_5'] = roa_slope_5
-    
-    if roa_slope_5 is not None:
-        if roa_slope_5 >= 0.15: merit_score += 2
-        elif roa_slope_5 >= 0.08: merit_score += 1
-    
-    # NET PROFIT MARGIN SLOPES (margin expansion)
-    npm_slope_5 = slopes.get('Net Profit Margin_Slope_5')
-    npm_slope_20 = slopes.get('Net Profit Margin_Slope_20')
-    slope_details['NPM_5'] = npm_slope_5
-    
-    if npm_slope_5 is not None:
-        if npm_slope_5 >= 0.20: merit_score += 2
-        elif npm_slope_5 >= 0.10: merit_score += 1
-    
-    if npm_slope_20 is not None:
-        if npm_slope_20 >= 0.15: merit_score += 2
-        elif npm_slope_20 >= 0.08: merit_score += 1
-    
-    # ASSET TURNOVER & CURRENT RATIO
-    at_slope_5 = slopes.get('Asset Turnover_Slope_5')
-    cr_slope_5 = slopes.get('Current Ratio_Slope_5')
-    
-    if at_slope_5 is not None and at_slope_5 >= 0.10: merit_score += 1
-    if cr_slope_5 is not None and cr_slope_5 >= 0.10: merit_score += 1
-    
-    # ========================================
-    # VALUATION METRICS - Negative slope = GOOD
-    # (Stock getting CHEAPER relative to fundamentals)
-    # ========================================
-    
-    # P/E RATIO SLOPES (declining = getting cheaper)
-    pe_slope_5 = slopes.get('P/E Ratio_Slope_5')
-    pe_slope_20 = slopes.get('P/E Ratio_Slope_20')
-    slope_details['PE_5'] = pe_slope_5
-    
-    if pe_slope_5 is not None:
-        if pe_slope_5 <= -0.25: merit_score += 3
-        elif pe_slope_5 <= -0.15: merit_score += 2
-        elif pe_slope_5 <= -0.05: merit_score += 1
-    
-    if pe_slope_20 is not None:
-        if pe_slope_20 <= -0.20: merit_score += 2
-        elif pe_slope_20 <= -0.10: merit_score += 1
-    
-    # DEBT TO EQUITY SLOPES (declining = deleveraging)
-    de_slope_5 = slopes.get('Debt to Equity Ratio_Slope_5')
-    de_slope_20 = slopes.get('Debt to Equity Ratio_Slope_20')
-    slope_details['DE_5'] = de_slope_5
-    
-    if de_slope_5 is not None:
-        if de_slope_5 <= -0.20: merit_score += 2
-        elif de_slope_5 <= -0.10: merit_score += 1
-    
-    if de_slope_20 is not None:
-        if de_slope_20 <= -0.15: merit_score += 2
-        elif de_slope_20 <= -0.08: merit_score += 1
-    
-    # PRICE TO BOOK & PRICE TO SALES SLOPES
-    pb_slope_5 = slopes.get('Price to Book Ratio_Slope_5')
-    ps_slope_5 = slopes.get('Price to Sales Ratio_Slope_5')
-    
-    if pb_slope_5 is not None and pb_slope_5 <= -0.20: merit_score += 1
-    if ps_slope_5 is not None and ps_slope_5 <= -0.20: merit_score += 1
-    
-    # ========================================
-    # 52-WEEK PERCENTILE (Lower = buying at value)
-    # ========================================
-    if week52_percentile is not None:
-        if week52_percentile <= 5: merit_score += 8
-        elif week52_percentile <= 15: merit_score += 7
-        elif week52_percentile <= 25: merit_score += 6
-        elif week52_percentile <= 35: merit_score += 5
-        elif week52_percentile <= 45: merit_score += 4
-        elif week52_percentile <= 55: merit_score += 3
-        elif week52_percentile <= 65: merit_score += 2
-        elif week52_percentile <= 75: merit_score += 1
-    
-    # ========================================
-    # FCFY - Free Cash Flow Yield (Higher = value)
-    # ========================================
-    fcfy = slopes.get('FCFY')
-    slope_details['FCFY'] = fcfy
-    
-    if fcfy is not None:
-        if fcfy >= 0.15: merit_score += 3      # 15%+ FCFY = exceptional
-        elif fcfy >= 0.10: merit_score += 2    # 10%+ = strong
-        elif fcfy >= 0.05: merit_score += 1    # 5%+ = solid
-    
-    return merit_score, slope_details
-
-
-def calculate_combined_merit_score(snapshot: Dict) -> Tuple[int, int, int, Dict]:
-    """
-    Calculate both merit scores.
-    Returns: (stasis_merit, fundamental_merit, combined_total, slope_details)
-    """
-    sms = calculate_stasis_merit_score(snapshot)
-    fms, slope_details = calculate_fundamental_merit_score(
-        snapshot.get('symbol', ''),
-        snapshot.get('week52_percentile')
-    )
-    return sms, fms, sms + fms, slope_details
+        # No fundamental data available - just 52W percentile scoring
+        return merit_score, {}
+    
+    merit_score += sum(rule.score(slopes.get(rule.field)) for rule in FUNDAMENTAL_MERIT_RULES)
+    return merit_score, get_slope_details(slopes)
 
 
-# ============================================================================
-# DATA FETCHERS
-# ============================================================================
+def get_slope_details(slopes: Mapping) -> Dict:
+    """The headline slopes shown with a snapshot ({} without fundamentals)."""
+    if not slopes:
+        return {}
+    return {detail: slopes.get(key) for detail, key in SLOPE_DETAIL_KEYS.items()}
 
-def fetch_52_week_data() -> Dict[str, Dict]:
-    print("📊 Fetching 52-week high/low data...")
-    week52_data = {}
-    
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=365)
-    
-    success_count = 0
-    fail_count = 0
-    
-    for i, symbol in enumerate(config.symbols):
-        try:
-            url = (
-                f"{config.polygon_rest_url}/v2/aggs/ticker/{symbol}/range/1/day/"
-                f"{start_date.strftime('%Y-%m-%d')}/{end_date.strftime('%Y-%m-%d')}"
-                f"?adjusted=true&sort=asc&limit=365&apiKey={config.polygon_api_key}"
-            )
-            
-            response = requests.get(url, timeout=15)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('results') and len(data['results']) > 0:
-                    highs = [bar['h'] for bar in data['results']]
-                    lows = [bar['l'] for bar in data['results']]
-                    closes = [bar['c'] for bar in data['results']]
-                    
-                    high_val = max(highs)
-                    low_val = min(lows)
-                    current_close = closes[-1] if closes else None
-                    
-                    week52_data[symbol] = {
-                        'high': high_val,
-                        'low': low_val,
-                        'range': high_val - low_val,
-                        'current': current_close,
-                    }
-                    success_count += 1
-                else:
-                    week52_data[symbol] = {'high': None, 'low': None, 'range': None, 'current': None}
-                    fail_count += 1
-            else:
-                week52_data[symbol] = {'high': None, 'low': None, 'range': None, 'current': None}
-                fail_count += 1
-            
-            if (i + 1) % 50 == 0:
-                print(f"   📈 Processed {i + 1}/{len(config.symbols)} (✓{success_count} ✗{fail_count})...")
-            
-            time.sleep(0.12)
-        except:
-            week52_data[symbol] = {'high': None, 'low': None, 'range': None, 'current': None}
-            fail_count += 1
-    
-    print(f"✅ 52-week data: {success_count} success, {fail_count} failed\n")
-    return week52_data
 
+def _float_column(values: Iterable[Optional[float]]) -> np.ndarray:
+    return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
 
-def fetch_volume_data() -> Dict[str, float]:
-    print("📊 Fetching volume data...")
-    volumes = {}
-    
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=45)
-    
-    for i, symbol in enumerate(config.symbols):
-        try:
-            url = (
-                f"{config.polygon_rest_url}/v2/aggs/ticker/{symbol}/range/1/day/"
-                f"{start_date.strftime('%Y-%m-%d')}/{end_date.strftime('%Y-%m-%d')}"
-                f"?adjusted=true&sort=desc&limit=30&apiKey={config.polygon_api_key}"
-            )
-            
-            response = requests.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('results') and len(data['results']) > 0:
-                    total_volume = sum(bar['v'] for bar in data['results'])
-                    volumes[symbol] = (total_volume / len(data['results'])) / 1_000_000
-                else:
-                    volumes[symbol] = 10.0
-            else:
-                volumes[symbol] = 10.0
-            
-            if (i + 1) % 50 == 0:
-                print(f"   📈 Processed {i + 1}/{len(config.symbols)}...")
-            
-            time.sleep(0.12)
-        except:
-            volumes[symbol] = 10.0
-    
-    print(f"✅ Volume data: {len(volumes)} symbols\n")
-    return volumes
-
-
-def fetch_historical_bars(symbol: str, days: int = 5) -> List[Dict]:
-    bars = []
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=days)
-    
-    try:
-        url = (
-            f"{config.polygon_rest_url}/v2/aggs/ticker/{symbol}/range/1/minute/"
-            f"{start_date.strftime('%Y-%m-%d')}/{end_date.strftime('%Y-%m-%d')}"
-            f"?adjusted=true&sort=asc&limit=50000&apiKey={config.polygon_api_key}"
-        )
-        
-        response = requests.get(url, timeout=30)
-        
-        if response.status_code == 200:
-            data = response.json()
-            if data.get('results'):
-                for bar in data['results']:
-                    bars.append({
-                        'timestamp': datetime.fromtimestamp(bar['t'] / 1000),
-                        'close': bar['c'],
-                    })
-    except:
-        pass
-    
-    return bars
-
-
-def calculate_52week_percentile(price: float, symbol: str) -> Optional[float]:
-    if symbol not in config.week52_data:
-        return None
-    data = config.week52_data[symbol]
-    if data is None:
-        return None
-    high = data.get('high')
-    low = data.get('low')
-    range_val = data.get('range')
-    if high is None or low is None or range_val is None or range_val <= 0:
-        return None
-    percentile = ((price - low) / range_val) * 100
-    return max(0.0, min(100.0, percentile))
-
-
-# ============================================================================
-# STASIS INFO
-# ============================================================================
-
-@dataclass
-class StasisInfo:
-    start_time: datetime
-    start_price: float
-    peak_stasis: int = 1
-    
-    def get_duration(self) -> timedelta:
-        return datetime.now() - self.start_time
-    
-    def get_duration_str(self) -> str:
-        duration = self.get_duration()
-        total_seconds = int(duration.total_seconds())
-        if total_seconds < 60:
-            return f"{total_seconds}s"
-        elif total_seconds < 3600:
-            return f"{total_seconds // 60}m {total_seconds % 60}s"
-        else:
-            return f"{total_seconds // 3600}h {(total_seconds % 3600) // 60}m"
-    
-    def get_start_date_str(self) -> str:
-        return self.start_time.strftime("%m/%d %H:%M")
-    
-    def get_price_change_pct(self, current_price: float) -> float:
-        if self.start_price == 0:
-            return 0.0
-        return (current_price - self.start_price) / self.start_price * 100
-
-
-# ============================================================================
-# BITSTREAM
-# ============================================================================
-
-@dataclass
-class BitEntry:
-    bit: int
-    price: float
-    timestamp: datetime
-
-
-class Bitstream:
-    def __init__(self, symbol: str, threshold: float, initial_price: float, volume: float):
-        self.symbol = symbol
-        self.threshold = threshold
-        self.initial_price = initial_price
-        self.volume = volume
-        
-        self.reference_price = initial_price
-        self.current_live_price = initial_price
-        self.last_price_update = datetime.now()
-        
-        self._update_bands()
-        
-        self.bits: deque = deque(maxlen=500)
-        
-        self.current_stasis = 0
-        self.last_bit = None
-        self.direction = None
-        self.signal_strength = None
-        
-        self.stasis_info: Optional[StasisInfo] = None
-        
-        self.total_bits = 0
-        self._lock = threading.Lock()
-    
-    def _update_bands(self):
-        self.band_width = self.threshold * self.reference_price
-        self.upper_band = self.reference_price + self.band_width
-        self.lower_band = self.reference_price - self.band_width
-    
-    def process_price(self, price: float, timestamp: datetime) -> List[int]:
-        with self._lock:
-            self.current_live_price = price
-            self.last_price_update = timestamp
-            
-            generated_bits = []
-            
-            if self.lower_band < price < self.upper_band:
-                return generated_bits
-            
-            if self.band_width <= 0:
-                return generated_bits
-            
-            x = int((price - self.reference_price) / self.band_width)
-            
-            if x > 0:
-                for _ in range(x):
-                    self.bits.append(BitEntry(1, price, timestamp))
-                    generated_bits.append(1)
-                    self.total_bits += 1
-                self.reference_price = price
-                self._update_bands()
-            elif x < 0:
-                for _ in range(abs(x)):
-                    self.bits.append(BitEntry(0, price, timestamp))
-                    generated_bits.append(0)
-                    self.total_bits += 1
-                self.reference_price = price
-                self._update_bands()
-            
-            if generated_bits:
-                self._update_stasis(timestamp)
-            
-            return generated_bits
-    
-    def _update_stasis(self, timestamp: datetime):
-        if len(self.bits) < 2:
-            self.current_stasis = len(self.bits)
-            self.last_bit = self.bits[-1].bit if self.bits else None
-            self.direction = None
-            self.signal_strength = None
-            return
-        
-        bits_list = list(self.bits)
-        
-        stasis_count = 1
-        stasis_start_idx = len(bits_list) - 1
-        
-        for i in range(len(bits_list) - 1, 0, -1):
-            if bits_list[i].bit != bits_list[i-1].bit:
-                stasis_count += 1
-                stasis_start_idx = i - 1
-            else:
-                break
-        
-        prev_stasis = self.current_stasis
-        self.current_stasis = stasis_count
-        self.last_bit = bits_list[-1].bit
-        
-        if prev_stasis < 2 and stasis_count >= 2:
-            if 0 <= stasis_start_idx < len(bits_list):
-                first_bit = bits_list[stasis_start_idx]
-                self.stasis_info = StasisInfo(
-                    start_time=first_bit.timestamp,
-                    start_price=first_bit.price,
-                    peak_stasis=stasis_count,
-                )
-        elif stasis_count >= 2 and self.stasis_info is not None:
-            if stasis_count > self.stasis_info.peak_stasis:
-                self.stasis_info.peak_stasis = stasis_count
-        elif prev_stasis >= 2 and stasis_count < 2:
-            self.stasis_info = None
-        
-        if self.current_stasis >= 2:
-            self.direction = Direction.LONG if self.last_bit == 0 else Direction.SHORT
-            if self.current_stasis >= 10:
-                self.signal_strength = SignalStrength.VERY_STRONG
-            elif self.current_stasis >= 7:
-                self.signal_strength = SignalStrength.STRONG
-            elif self.current_stasis >= 5:
-                self.signal_strength = SignalStrength.MODERATE
-            elif self.current_stasis >= 3:
-                self.signal_strength = SignalStrength.WEAK
-            else:
-                self.signal_strength = None
-        else:
-            self.direction = None
-            self.signal_strength = None
-    
-    def is_tradable(self) -> bool:
-        with self._lock:
-            return (
-                self.current_stasis >= config.min_tradable_stasis and
-                self.direction is not None and
-                self.volume > 1.0
-            )
-    
-    def get_snapshot(self, live_price: Optional[float] = None) -> Dict:
-        with self._lock:
-            current_price = live_price if live_price is not None else self.current_live_price
-            
-            anchor_price = None
-            stasis_start_str = "—"
-            stasis_duration_str = "—"
-            duration_seconds = 0
-            stasis_price_change_pct = None
-            
-            if self.stasis_info is not None:
-                anchor_price = self.stasis_info.start_price
-                stasis_start_str = self.stasis_info.get_start_date_str()
-                stasis_duration_str = self.stasis_info.get_duration_str()
-                duration_seconds = self.stasis_info.get_duration().total_seconds()
-                stasis_price_change_pct = self.stasis_info.get_price_change_pct(current_price)
-            
-            take_profit = None
-            stop_loss = None
-            risk_reward = None
-            distance_to_tp_pct = None
-            distance_to_sl_pct = None
-            
-            if self.direction is not None and self.current_stasis >= 2:
-                if self.direction == Direction.LONG:
-                    take_profit = self.upper_band
-                    stop_loss = self.lower_band
-                    reward = take_profit - current_price
-                    risk = current_price - stop_loss
-                else:
-                    take_profit = self.lower_band
-                    stop_loss = self.upper_band
-                    reward = current_price - take_profit
-                    risk = stop_loss - current_price
-                
-                if risk > 0 and reward > 0:
-                    risk_reward = reward / risk
-                elif risk > 0 and reward <= 0:
-                    risk_reward = 0.0
-                else:
-                    risk_reward = None
-                
-                if current_price > 0:
-                    distance_to_tp_pct = (abs(take_profit - current_price) / current_price) * 100
-                    distance_to_sl_pct = (abs(stop_loss - current_price) / current_price) * 100
-            
-            week52_percentile = calculate_52week_percentile(current_price, self.symbol)
-            recent_bits = [b.bit for b in list(self.bits)[-15:]]
-            
-            # Build base snapshot
-            snapshot = {
-                'symbol': self.symbol,
-                'threshold': self.threshold,
-                'threshold_pct': self.threshold * 100,
-                'stasis': self.current_stasis,
-                'total_bits': self.total_bits,
-                'recent_bits': recent_bits,
-                'current_price': current_price,
-                'anchor_price': anchor_price,
-                'direction': self.direction.value if self.direction else None,
-                'signal_strength': self.signal_strength.value if self.signal_strength else None,
-                'is_tradable': (
-                    self.current_stasis >= config.min_tradable_stasis and
-                    self.direction is not None and
-                    self.volume > 1.0
-                ),
-                'stasis_start_str': stasis_start_str,
-                'stasis_duration_str': stasis_duration_str,
-                'duration_seconds': duration_seconds,
-                'stasis_price_change_pct': stasis_price_change_pct,
-                'take_profit': take_profit,
-                'stop_loss': stop_loss,
-                'risk_reward': risk_reward,
-                'distance_to_tp_pct': distance_to_tp_pct,
-                'distance_to_sl_pct': distance_to_sl_pct,
-                'week52_percentile': week52_percentile,
-                'volume': self.volume,
-            }
-            
-            # Calculate merit scores
-            sms, fms, combined, slope_details = calculate_combined_merit_score(snapshot)
-            snapshot['stasis_merit_score'] = sms
-            snapshot['fundamental_merit_score'] = fms
-            snapshot['combined_merit_score'] = combined
-            snapshot['slope_details'] = slope_details
-            
-            return snapshot
-
-
-# ============================================================================
-# PRICE FEED
-# ============================================================================
-
-class PolygonPriceFeed:
-    def __init__(self):
-        self.lock = threading.Lock()
-        self.current_prices: Dict[str, float] = {}
-        self.is_running = False
-        self.ws = None
-        self.ws_thread = None
-        self.message_count = 0
-        
-        for symbol in config.symbols:
-            self.current_prices[symbol] = None
-    
-    def start(self):
-        self.is_running = True
-        self.ws_thread = threading.Thread(target=self._ws_loop, daemon=True)
-        self.ws_thread.start()
-        print("✅ WebSocket starting...")
-        return True
-    
-    def stop(self):
-        self.is_running = False
-        if self.ws:
-            self.ws.close()
-    
-    def _ws_loop(self):
-        while self.is_running:
-            try:
-                self._connect()
-            except Exception as e:
-                print(f"❌ WebSocket error: {e}")
-                if self.is_running:
-                    time.sleep(5)
-    
-    def _connect(self):
-        def on_message(ws, message):
-            try:
-                data = json.loads(message)
-                if isinstance(data, list):
-                    for msg in data:
-                        self._process(msg)
-                else:
-                    self._process(data)
-            except:
-                pass
-        
-        def on_open(ws):
-            print("✅ WebSocket connected!")
-            ws.send(json.dumps({"action": "auth", "params": config.polygon_api_key}))
-        
-        def on_close(ws, code, msg):
-            print(f"WebSocket closed: {code}")
-        
-        def on_error(ws, error):
-            print(f"WebSocket error: {error}")
-        
-        self.ws = websocket.WebSocketApp(
-            config.polygon_ws_url,
-            on_open=on_open,
-            on_message=on_message,
-            on_close=on_close,
-            on_error=on_error
-        )
-        self.ws.run_forever(sslopt={"cert_reqs": ssl.CERT_NONE})
-    
-    def _process(self, msg: Dict):
-        if msg.get('ev') == 'status':
-            status = msg.get('status')
-            print(f"📊 Status: {status} - {msg.get('message', '')}")
-            if status == 'auth_success':
-                self._subscribe()
-        elif msg.get('ev') == 'A':
-            symbol = msg.get('sym', '')
-            price = msg.get('c') or msg.get('vw')
-            if price and symbol in config.symbols:
-                with self.lock:
-                    self.current_prices[symbol] = float(price)
-                    self.message_count += 1
-    
-    def _subscribe(self):
-        if self.ws:
-            for i in range(0, len(config.symbols), 50):
-                batch = config.symbols[i:i+50]
-                self.ws.send(json.dumps({
-                    "action": "subscribe",
-                    "params": ",".join([f"A.{s}" for s in batch])
-                }))
-                time.sleep(0.1)
-            print(f"📡 Subscribed to {len(config.symbols)} stocks")
-    
-    def get_all_prices(self) -> Dict[str, float]:
-        with self.lock:
-            return {k: v for k, v in self.current_prices.items() if v is not None}
-    
-    def get_status(self) -> Dict:
-        with self.lock:
-            connected = sum(1 for v in self.current_prices.values() if v is not None)
-            return {
-                'total': len(config.symbols),
-                'connected': connected,
-                'message_count': self.message_count
-            }
-
-
-price_feed = PolygonPriceFeed()
-
-
-# ============================================================================
-# BITSTREAM MANAGER
-# ============================================================================
-
-class BitstreamManager:
-    def __init__(self):
-        self.lock = threading.Lock()
-        self.streams: Dict[Tuple[str, float], Bitstream] = {}
-        self.is_running = False
-        
-        self.cached_data: List[Dict] = []
-        self.cache_lock = threading.Lock()
-        
-        self.initialized = False
-        self.backfill_complete = False
-        self.backfill_progress = 0
-    
-    def backfill(self):
-        print("\n" + "=" * 60)
-        print("📜 BACKFILLING HISTORICAL DATA")
-        print("=" * 60)
-        
-        historical_data = {}
-        
-        for i, symbol in enumerate(config.symbols):
-            bars = fetch_historical_bars(symbol, config.history_days)
-            if bars:
-                historical_data[symbol] = bars
-            
-            self.backfill_progress = int((i + 1) / len(config.symbols) * 100)
-            
-            if (i + 1) % 25 == 0:
-                print(f"   📊 {i + 1}/{len(config.symbols)} ({self.backfill_progress}%)")
-            
-            time.sleep(0.12)
-        
-        print(f"\n✅ Historical data: {len(historical_data)} symbols")
-        
-        with self.lock:
-            for symbol, bars in historical_data.items():
-                if not bars:
-                    continue
-                
-                initial_price = bars[0]['close']
-                volume = config.volumes.get(symbol, 10.0)
-                
-                for threshold in config.thresholds:
-                    key = (symbol, threshold)
-                    self.streams[key] = Bitstream(symbol, threshold, initial_price, volume)
-                    
-                    for bar in bars:
-                        self.streams[key].process_price(bar['close'], bar['timestamp'])
-        
-        self.initialized = True
-        self.backfill_complete = True
-        
-        tradable = sum(1 for s in self.streams.values() if s.is_tradable())
-        print(f"✅ Bitstreams: {len(self.streams)} | Tradable: {tradable}")
-        print("=" * 60 + "\n")
-    
-    def start(self):
-        self.is_running = True
-        threading.Thread(target=self._process_loop, daemon=True).start()
-        threading.Thread(target=self._cache_loop, daemon=True).start()
-    
-    def _process_loop(self):
-        while self.is_running:
-            time.sleep(0.1)
-            if not self.backfill_complete:
-                continue
-            
-            prices = price_feed.get_all_prices()
-            timestamp = datetime.now()
-            
-            with self.lock:
-                for symbol, price in prices.items():
-                    for threshold in config.thresholds:
-                        key = (symbol, threshold)
-                        if key in self.streams:
-                            self.streams[key].process_price(price, timestamp)
-    
-    def _cache_loop(self):
-        while self.is_running:
-            time.sleep(config.cache_refresh_interval)
-            if not self.initialized:
-                continue
-            
-            live_prices = price_feed.get_all_prices()
-            snapshots = []
-            
-            with self.lock:
-                for stream in self.streams.values():
-                    live_price = live_prices.get(stream.symbol)
-                    snapshots.append(stream.get_snapshot(live_price))
-            
-            with self.cache_lock:
-                self.cached_data = snapshots
-    
-    def get_data(self) -> List[Dict]:
-        with self.cache_lock:
-            return copy.deepcopy(self.cached_data)
-
-
-manager = BitstreamManager()
-
-
-# ============================================================================
-# HELPER FUNCTIONS
-# ============================================================================
-
-def format_bits(bits: List[int]) -> str:
-    return "".join(str(b) for b in bits) if bits else "—"
-
-
-def format_rr(rr: Optional[float]) -> str:
-    if rr is None:
-        return "—"
-    if rr <= 0:
-        return "0:1"
-    return f"{rr:.2f}:1" if rr < 10 else f"{rr:.0f}:1"
-
-
-def format_slope(slope: Optional[float]) -> str:
-    if slope is None:
-        return "—"
-    sign = "+" if slope >= 0 else ""
-    return f"{sign}{slope*100:.1f}%"
-
-
-def get_table_data() -> pd.DataFrame:
-    data = manager.get_data()
-    if not data:
-        return pd.DataFrame()
-    
-    rows = []
-    for d in data:
-        chg_str = "—"
-        if d['stasis_price_change_pct'] is not None:
-            sign = "+" if d['stasis_price_change_pct'] >= 0 else ""
-            chg_str = f"{sign}{d['stasis_price_change_pct']:.2f}%"
-        
-        w52_str = "—"
-        if d['week52_percentile'] is not None:
-            w52_str = f"{d['week52_percentile']:.0f}%"
-        
-        # Get slope details
-        slopes = d.get('slope_details', {})
-        
-        rows.append({
-            'Symbol': d['symbol'],
-            'Band': f"{d['threshold_pct']:.2f}%",
-            'Band_Val': d['threshold'],
-            'Stasis': d['stasis'],
-            'Dir': d['direction'] or '—',
-            'Str': d['signal_strength'] or '—',
-            'Current': f"${d['current_price']:.2f}" if d['current_price'] else "—",
-            'Current_Val': d['current_price'] or 0,
-            'Anchor': f"${d['anchor_price']:.2f}" if d['anchor_price'] else "—",
-            'TP': f"${d['take_profit']:.2f}" if d['take_profit'] else "—",
-            'SL': f"${d['stop_loss']:.2f}" if d['stop_loss'] else "—",
-            'R:R': format_rr(d['risk_reward']),
-            'RR_Val': d['risk_reward'] if d['risk_reward'] is not None else -1,
-            'Started': d['stasis_start_str'],
-            'Duration': d['stasis_duration_str'],
-            'Dur_Val': d['duration_seconds'],
-            'Chg': chg_str,
-            '52W': w52_str,
-            '52W_Val': d['week52_percentile'] if d['week52_percentile'] is not None else -1,
-            # Merit Scores
-            'SMS': d.get('stasis_merit_score', 0),
-            'FMS': d.get('fundamental_merit_score', 0),
-            'TMS': d.get('combined_merit_score', 0),
-            # Key Slopes for display
-            'Rev5': format_slope(slopes.get('Rev_5')),
-            'Rev5_Val': slopes.get('Rev_5') if slopes.get('Rev_5') is not None else -999,
-            'FCF5': format_slope(slopes.get('FCF_5')),
-            'FCF5_Val': slopes.get('FCF_5') if slopes.get('FCF_5') is not None else -999,
-            'ROE5': format_slope(slopes.get('ROE_5')),
-            'FCFY': f"{slopes.get('FCFY', 0)*100:.1f}%" if slopes.get('FCFY') else "—",
-            'Tradable': '✅' if d['is_tradable'] else '',
-            'Is_Tradable': d['is_tradable'],
-        })
-    
-    return pd.DataFrame(rows)
-
-
-# ============================================================================
-# DASH APP
-# ============================================================================
-
-CUSTOM_CSS = """
-@import url('https://fonts.googleapis.com/css2?family=Orbitron:wght@400;500;600;700;800;900&display=swap');
-@import url('https://fonts.googleapis.com/css2?family=Roboto+Mono:wght@400;500;600;700&display=swap');
-
-body { 
-    background-color: #0a0a0a !important; 
-}
-
-.title-font {
-    font-family: 'Orbitron', sans-serif !important;
-}
-
-.data-font {
-    font-family: 'Roboto Mono', monospace !important;
-}
-
-h1, h2, h3, h4, h5, h6, .btn, label, .nav-link, .card-header {
-    font-family: 'Orbitron', sans-serif !important;
-}
-
-td, input, .form-control, pre, code {
-    font-family: 'Roboto Mono', monospace !important;
-}
-
-.Select-control, .Select-menu-outer, .Select-option, .Select-value-label {
-    font-family: 'Roboto Mono', monospace !important;
-    font-size: 11px !important;
-}
-"""
-
-app = dash.Dash(__name__, external_stylesheets=[dbc.themes.CYBORG])
-app.title = "Beyond Price & Time"
-server = app.server
-
-app.index_string = '''
-<!DOCTYPE html>
-<html>
-    <head>
-        {%metas%}
-        <title>{%title%}</title>
-        {%favicon%}
-        {%css%}
-        <style>''' + CUSTOM_CSS + '''</style>
-    </head>
-    <body>
-        {%app_entry%}
-        <footer>
-            {%config%}
-            {%scripts%}
-            {%renderer%}
-        </footer>
-    </body>
-</html>
-'''
-
-app.layout = dbc.Container([
-    # Header
-    dbc.Row([
-        dbc.Col([
-            html.Div([
-                html.Img(src='/assets/logo.png', style={'height': '50px', 'marginRight': '15px'}),
-                html.Div([
-                    html.H2("BEYOND PRICE AND TIME", className="text-success mb-0 title-font",
-                           style={'fontSize': '24px', 'fontWeight': '700', 'letterSpacing': '3px'}),
-                    html.P("STASIS + FUNDAMENTAL SLOPE MERIT SCORING", className="text-muted title-font",
-                          style={'fontSize': '10px', 'letterSpacing': '2px', 'marginBottom': '0'}),
-                ], style={'display': 'inline-block', 'verticalAlign': 'middle'}),
-            ], style={'display': 'flex', 'alignItems': 'center'})
-        ], width=8),
-        dbc.Col([
-            html.Div(id='connection-status', className="text-end title-font")
-        ], width=4)
-    ], className="mb-2 mt-2"),
-    
-    # Stats
-    dbc.Row([
-        dbc.Col([
-            dbc.Card([
-                dbc.CardBody([
-                    html.Div(id='stats-display', className="text-center")
-                ], style={'padding': '8px'})
-            ], style={'backgroundColor': '#1a2a3a', 'border': '1px solid #00ff88'})
-        ])
-    ], className="mb-2"),
-    
-    # Filters
-    dbc.Row([
-        dbc.Col([
-            dbc.ButtonGroup([
-                dbc.Button("ALL", id="btn-all", color="secondary", outline=True, size="sm", 
-                          className="title-font", style={'letterSpacing': '1px'}),
-                dbc.Button("TRADABLE", id="btn-tradable", color="success", outline=True, size="sm", 
-                          active=True, className="title-font", style={'letterSpacing': '1px'}),
-            ])
-        ], width=1),
-        dbc.Col([
-            dcc.Dropdown(id='filter-symbol', 
-                        options=[{'label': 'ALL', 'value': 'ALL'}] + 
-                        [{'label': s, 'value': s} for s in config.symbols],
-                        value='ALL', clearable=False, style={'fontSize': '10px'})
-        ], width=1),
-        dbc.Col([
-            dcc.Input(id='filter-stasis', type='number', value=3, min=0,
-                     placeholder="Min Stasis",
-                     style={'width': '100%', 'fontSize': '11px', 'fontFamily': 'Roboto Mono'})
-        ], width=1),
-        dbc.Col([
-            dcc.Dropdown(id='filter-direction',
-                        options=[{'label': 'ALL', 'value': 'ALL'}, 
-                                {'label': 'LONG', 'value': 'LONG'},
-                                {'label': 'SHORT', 'value': 'SHORT'}],
-                        value='ALL', clearable=False, style={'fontSize': '10px'})
-        ], width=1),
-        dbc.Col([
-            dcc.Dropdown(id='filter-fms',
-                        options=[{'label': 'ANY FMS', 'value': -1},
-                                {'label': 'FMS ≥30', 'value': 30},
-                                {'label': 'FMS ≥25', 'value': 25},
-                                {'label': 'FMS ≥20', 'value': 20},
-                                {'label': 'FMS ≥15', 'value': 15},
-                                {'label': 'FMS ≥10', 'value': 10}],
-                        value=-1, clearable=False, style={'fontSize': '10px'})
-        ], width=1),
-        dbc.Col([
-            dcc.Dropdown(id='filter-tms',
-                        options=[{'label': 'ANY TMS', 'value': -1},
-                                {'label': 'TMS ≥50', 'value': 50},
-                                {'label': 'TMS ≥40', 'value': 40},
-                                {'label': 'TMS ≥30', 'value': 30},
-                                {'label': 'TMS ≥20', 'value': 20}],
-                        value=-1, clearable=False, style={'fontSize': '10px'})
-        ], width=1),
-        dbc.Col([
-            dcc.Dropdown(id='filter-52w',
-                        options=[{'label': 'ANY 52W', 'value': 'ALL'},
-                                {'label': '0-20%', 'value': '0-20'}, 
-                                {'label': '20-40%', 'value': '20-40'},
-                                {'label': '40-60%', 'value': '40-60'}],
-                        value='ALL', clearable=False, style={'fontSize': '10px'})
-        ], width=1),
-        dbc.Col([
-            dcc.Dropdown(id='filter-rows',
-                        options=[{'label': '50', 'value': 50}, 
-                                {'label': '100', 'value': 100},
-                                {'label': '250', 'value': 250},
-                                {'label': 'ALL', 'value': 10000}],
-                        value=100, clearable=False, style={'fontSize': '10px'})
-        ], width=1),
-        dbc.Col([
-            dcc.Dropdown(id='filter-sort',
-                        options=[{'label': 'TMS ↓', 'value': 'tms'},
-                                {'label': 'FMS ↓', 'value': 'fms'},
-                                {'label': 'SMS ↓', 'value': 'sms'},
-                                {'label': 'REV SLOPE ↓', 'value': 'rev'},
-                                {'label': 'FCF SLOPE ↓', 'value': 'fcf'},
-                                {'label': 'STASIS ↓', 'value': 'stasis'}, 
-                                {'label': '52W ↑', 'value': '52w'}],
-                        value='tms', clearable=False, style={'fontSize': '10px'})
-        ], width=1),
-    ], className="mb-2 g-1"),
-    
-    # Table
-    dbc.Row([
-        dbc.Col([
-            dash_table.DataTable(
-                id='main-table',
-                columns=[
-                    {'name': '✓', 'id': 'Tradable'},
-                    {'name': 'SYM', 'id': 'Symbol'},
-                    {'name': 'BAND', 'id': 'Band'},
-                    {'name': 'STS', 'id': 'Stasis'},
-                    {'name': 'DIR', 'id': 'Dir'},
-                    {'name': 'SMS', 'id': 'SMS'},
-                    {'name': 'FMS', 'id': 'FMS'},
-                    {'name': 'TMS', 'id': 'TMS'},
-                    {'name': 'REV5', 'id': 'Rev5'},
-                    {'name': 'FCF5', 'id': 'FCF5'},
-                    {'name': 'ROE5', 'id': 'ROE5'},
-                    {'name': 'FCFY', 'id': 'FCFY'},
-                    {'name': '52W', 'id': '52W'},
-                    {'name': 'PRICE', 'id': 'Current'},
-                    {'name': 'TP', 'id': 'TP'},
-                    {'name': 'SL', 'id': 'SL'},
-                    {'name': 'R:R', 'id': 'R:R'},
-                    {'name': 'DUR', 'id': 'Duration'},
-                    {'name': 'CHG', 'id': 'Chg'},
-                ],
-                sort_action='native',
-                sort_mode='multi',
-                sort_by=[{'column_id': 'TMS', 'direction': 'desc'}],
-                style_table={'height': '62vh', 'overflowY': 'auto'},
-                style_cell={
-                    'backgroundColor': '#1a1a2e', 
-                    'color': 'white',
-                    'padding': '4px 6px', 
-                    'fontSize': '11px',
-                    'fontFamily': 'Roboto Mono, monospace', 
-                    'whiteSpace': 'nowrap',
-                    'textAlign': 'right',
-                    'minWidth': '40px',
-                },
-                style_cell_conditional=[
-                    {'if': {'column_id': 'Symbol'}, 'textAlign': 'left', 'fontWeight': '600'},
-                    {'if': {'column_id': 'Dir'}, 'textAlign': 'center'},
-                    {'if': {'column_id': 'Tradable'}, 'textAlign': 'center'},
-                ],
-                style_header={
-                    'backgroundColor': '#2a2a4e', 
-                    'color': '#00ff88',
-                    'fontWeight': '700', 
-                    'fontSize': '10px',
-                    'fontFamily': 'Orbitron, sans-serif',
-                    'borderBottom': '2px solid #00ff88',
-                    'textAlign': 'center',
-                },
-                style_data_conditional=[
-                    {'if': {'filter_query': '{Stasis} >= 10'}, 'backgroundColor': '#2d4a2d'},
-                    {'if': {'filter_query': '{Stasis} >= 7 && {Stasis} < 10'}, 'backgroundColor': '#2a3a2a'},
-                    {'if': {'filter_query': '{Dir} = "LONG"', 'column_id': 'Dir'}, 'color': '#00ff00', 'fontWeight': 'bold'},
-                    {'if': {'filter_query': '{Dir} = "SHORT"', 'column_id': 'Dir'}, 'color': '#ff4444', 'fontWeight': 'bold'},
-                    {'if': {'column_id': 'Current'}, 'color': '#00ffff', 'fontWeight': '600'},
-                    {'if': {'column_id': 'TP'}, 'color': '#00ff00'},
-                    {'if': {'column_id': 'SL'}, 'color': '#ff4444'},
-                    # TMS coloring
-                    {'if': {'filter_query': '{TMS} >= 50', 'column_id': 'TMS'}, 'backgroundColor': '#00ff00', 'color': '#000'},
-                    {'if': {'filter_query': '{TMS} >= 40 && {TMS} < 50', 'column_id': 'TMS'}, 'backgroundColor': '#44ff44', 'color': '#000'},
-                    {'if': {'filter_query': '{TMS} >= 30 && {TMS} < 40', 'column_id': 'TMS'}, 'backgroundColor': '#88ff00', 'color': '#000'},
-                    {'if': {'filter_query': '{TMS} >= 20 && {TMS} < 30', 'column_id': 'TMS'}, 'color': '#aaff00'},
-                    # FMS coloring
-                    {'if': {'filter_query': '{FMS} >= 30', 'column_id': 'FMS'}, 'backgroundColor': '#ffaa00', 'color': '#000'},
-                    {'if': {'filter_query': '{FMS} >= 20 && {FMS} < 30', 'column_id': 'FMS'}, 'color': '#ffaa00'},
-                    # Slope coloring (positive = green)
-                    {'if': {'filter_query': '{Rev5} contains "+"', 'column_id': 'Rev5'}, 'color': '#00ff00'},
-                    {'if': {'filter_query': '{Rev5} contains "-"', 'column_id': 'Rev5'}, 'color': '#ff4444'},
-                    {'if': {'filter_query': '{FCF5} contains "+"', 'column_id': 'FCF5'}, 'color': '#00ff00'},
-                    {'if': {'filter_query': '{FCF5} contains "-"', 'column_id': 'FCF5'}, 'color': '#ff4444'},
-                    {'if': {'filter_query': '{ROE5} contains "+"', 'column_id': 'ROE5'}, 'color': '#00ff00'},
-                    {'if': {'filter_query': '{ROE5} contains "-"', 'column_id': 'ROE5'}, 'color': '#ff4444'},
-                    # 52W coloring
-                    {'if': {'filter_query': '{52W_Val} >= 0 && {52W_Val} <= 20', 'column_id': '52W'}, 'color': '#00ff00'},
-                    {'if': {'filter_query': '{52W_Val} >= 80', 'column_id': '52W'}, 'color': '#ff4444'},
-                    # Chg coloring
-                    {'if': {'filter_query': '{Chg} contains "+"', 'column_id': 'Chg'}, 'color': '#00ff00'},
-                    {'if': {'filter_query': '{Chg} contains "-"', 'column_id': 'Chg'}, 'color': '#ff4444'},
-                    {'if': {'row_index': 'odd'}, 'backgroundColor': '#151520'},
-                ]
-            )
-        ])
-    ]),
-    
-    # Footer
-    dbc.Row([
-        dbc.Col([
-            html.Div([
-                html.Span("SMS", style={'color': '#00ffff', 'fontSize': '9px', 'fontWeight': 'bold'}),
-                html.Span(" = Stasis Merit | ", style={'fontSize': '9px'}),
-                html.Span("FMS", style={'color': '#ffaa00', 'fontSize': '9px', 'fontWeight': 'bold'}),
-                html.Span(" = Fundamental Merit (Slopes+52W+FCFY) | ", style={'fontSize': '9px'}),
-                html.Span("REV5/FCF5/ROE5", style={'color': '#00ff00', 'fontSize': '9px', 'fontWeight': 'bold'}),
-                html.Span(" = 5Q Growth Slopes", style={'fontSize': '9px'}),
-            ], className="text-center text-muted mt-1"),
-            html.Hr(style={'borderColor': '#333', 'margin': '8px 0'}),
-            html.P("© 2026 TRUTH COMMUNICATIONS LLC",
-                  className="text-muted text-center mb-0 title-font",
-                  style={'fontSize': '9px', 'letterSpacing': '2px'}),
-        ])
-    ]),
-    
-    dcc.Store(id='view-mode', data='tradable'),
-    dcc.Interval(id='refresh-interval', interval=config.update_interval_ms, n_intervals=0)
-    
-], fluid=True, className="p-2", style={'backgroundColor': '#0a0a0a'})
-
-
-# ============================================================================
-# CALLBACKS
-# ============================================================================
-
-@app.callback(
-    [Output('btn-all', 'active'), Output('btn-tradable', 'active'), Output('view-mode', 'data')],
-    [Input('btn-all', 'n_clicks'), Input('btn-tradable', 'n_clicks')],
-    [State('view-mode', 'data')]
-)
-def toggle_view(n1, n2, current):
-    ctx = callback_context
-    if not ctx.triggered:
-        return False, True, 'tradable'
-    btn = ctx.triggered[0]['prop_id'].split('.')[0]
-    if btn == 'btn-all':
-        return True, False, 'all'
-    return False, True, 'tradable'
-
-
-@app.callback(
-    Output('connection-status', 'children'),
-    Input('refresh-interval', 'n_intervals')
-)
-def update_status(n):
-    if not manager.backfill_complete:
-        return html.Span(f"⏳ LOADING... {manager.backfill_progress}%", className="text-warning")
-    
-    status = price_feed.get_status()
-    fund_count = len(config.fundamental_slopes)
-    
-    if status['connected'] == 0:
-        return html.Span(f"🔴 CONNECTING... | 📊 {fund_count} fundamentals", className="text-warning")
-    return html.Span(f"🟢 LIVE {status['connected']}/{status['total']} | 📊 {fund_count} fundamentals", 
-                    className="text-success data-font")
-
-
-@app.callback(
-    Output('stats-display', 'children'),
-    Input('refresh-interval', 'n_intervals')
-)
-def update_stats(n):
-    if not manager.backfill_complete:
-        return html.Span(f"⏳ LOADING... {manager.backfill_progress}%", className="text-warning title-font")
-    
-    data = manager.get_data()
-    if not data:
-        return html.Span("LOADING...", className="text-muted title-font")
-    
-    tradable = [d for d in data if d['is_tradable']]
-    long_count = sum(1 for d in tradable if d['direction'] == 'LONG')
-    short_count = sum(1 for d in tradable if d['direction'] == 'SHORT')
-    
-    avg_fms = np.mean([d.get('fundamental_merit_score', 0) for d in tradable]) if tradable else 0
-    avg_tms = np.mean([d.get('combined_merit_score', 0) for d in tradable]) if tradable else 0
-    max_tms = max([d.get('combined_merit_score', 0) for d in tradable]) if tradable else 0
-    
-    return html.Div([
-        html.Span("🎯 TRADABLE: ", className="title-font", style={'fontSize': '11px'}),
-        html.Span(f"{len(tradable)}", className="data-font text-success", style={'fontSize': '12px', 'fontWeight': '600'}),
-        html.Span("  📈 LONG: ", className="title-font ms-2", style={'fontSize': '11px'}),
-        html.Span(f"{long_count}", className="data-font text-success", style={'fontSize': '12px'}),
-        html.Span("  📉 SHORT: ", className="title-font ms-2", style={'fontSize': '11px'}),
-        html.Span(f"{short_count}", className="data-font text-danger", style={'fontSize': '12px'}),
-        html.Span("  📊 AVG FMS: ", className="title-font ms-2", style={'fontSize': '11px'}),
-        html.Span(f"{avg_fms:.1f}", className="data-font text-warning", style={'fontSize': '12px'}),
-        html.Span("  🏆 AVG TMS: ", className="title-font ms-2", style={'fontSize': '11px'}),
-        html.Span(f"{avg_tms:.1f}", className="data-font text-success", style={'fontSize': '12px'}),
-        html.Span("  🥇 MAX TMS: ", className="title-font ms-2", style={'fontSize': '11px'}),
-        html.Span(f"{max_tms}", className="data-font text-warning", style={'fontSize': '12px', 'fontWeight': '600'}),
-    ])
-
-
-@app.callback(
-    Output('main-table', 'data'),
-    [Input('refresh-interval', 'n_intervals'),
-     Input('view-mode', 'data'),
-     Input('filter-symbol', 'value'),
-     Input('filter-stasis', 'value'),
-     Input('filter-direction', 'value'),
-     Input('filter-fms', 'value'),
-     Input('filter-tms', 'value'),
-     Input('filter-52w', 'value'),
-     Input('filter-rows', 'value'),
-     Input('filter-sort', 'value')]
-)
-def update_table(n, view_mode, sym, stasis, direction, fms_min, tms_min, w52, rows, sort):
-    df = get_table_data()
-    if df.empty:
-        return []
-    
-    if view_mode == 'tradable':
-        df = df[df['Is_Tradable'] == True]
-    
-    if sym != 'ALL':
-        df = df[df['Symbol'] == sym]
-    if stasis and stasis > 0:
-        df = df[df['Stasis'] >= stasis]
-    if direction != 'ALL':
-        df = df[df['Dir'] == direction]
-    if fms_min is not None and fms_min >= 0:
-        df = df[df['FMS'] >= fms_min]
-    if tms_min is not None and tms_min >= 0:
-        df = df[df['TMS'] >= tms_min]
-    if w52 != 'ALL':
-        ranges = {'0-20': (0, 20), '20-40': (20, 40), '40-60': (40, 60)}
-        if w52 in ranges:
-            lo, hi = ranges[w52]
-            df = df[(df['52W_Val'] >= lo) & (df['52W_Val'] <= hi)]
-    
-    # Sorting
-    if sort == 'tms':
-        df = df.sort_values(['TMS', 'FMS'], ascending=[False, False])
-    elif sort == 'fms':
-        df = df.sort_values(['FMS', 'TMS'], ascending=[False, False])
-    elif sort == 'sms':
-        df = df.sort_values(['SMS', 'TMS'], ascending=[False, False])
-    elif sort == 'rev':
-        df = df.sort_values(['Rev5_Val', 'TMS'], ascending=[False, False])
-    elif sort == 'fcf':
-        df = df.sort_values(['FCF5_Val', 'TMS'], ascending=[False, False])
-    elif sort == 'stasis':
-        df = df.sort_values(['Stasis', 'TMS'], ascending=[False, False])
-    elif sort == '52w':
-        df = df.sort_values(['52W_Val', 'TMS'], ascending=[True, False], na_position='last')
-    
-    df = df.head(rows)
-    
-    drop_cols = ['Band_Val', 'Current_Val', 'RR_Val', 'Dur_Val', '52W_Val', 
-                 'Is_Tradable', 'Rev5_Val', 'FCF5_Val', 'Anchor']
-    df = df.drop(columns=drop_cols, errors='ignore')
-    
-    return df.to_dict('records')
-
-
-# ============================================================================
-# INITIALIZATION
-# ============================================================================
-
-_initialized = False
-_init_lock = threading.Lock()
-
-
-def initialize_app():
-    global _initialized
-    
-    with _init_lock:
-        if _initialized:
-            return
-        
-        print("=" * 70)
-        print("  BEYOND PRICE AND TIME")
-        print("  WITH FUNDAMENTAL SLOPE MERIT SCORING")
-        print("  © 2026 Truth Communications LLC")
-        print("=" * 70)
-        
-        print(f"\n🎯 Stocks: {len(config.symbols)}")
-        
-        # Fetch 52-week data
-        print("\n📅 FETCHING 52-WEEK DATA...")
-        config.week52_data = fetch_52_week_data()
-        
-        # Fetch volume data
-        print("📊 FETCHING VOLUME DATA...")
-        config.volumes = fetch_volume_data()
-        
-        # Fetch fundamental data and calculate slopes
-        fetch_all_fundamental_data()
-        
-        # Backfill historical price data
-        manager.backfill()
-        
-        # Start price feed and manager
-        price_feed.start()
-        manager.start()
-        
-        print("\n✅ Initialization complete!")
-        print(f"📊 Fundamental slopes calculated for {len(config.fundamental_slopes)} symbols")
-        print("=" * 70)
-        
-        _initialized = True
-
-
-_init_thread = threading.Thread(target=initialize_app, daemon=True)
-_init_thread.start()
-
-
-# ============================================================================
-# MAIN
-# ============================================================================
-
-if __name__ == '__main__':
-    import os
-    
-    _init_thread.join()
-    
-    print("\n✅ Server: http://127.0.0.1:8050")
-    
-    threading.Thread(
-        target=lambda: (time.sleep(2), webbrowser.open('http://127.0.0.1:8050')), 
-        daemon=True
-    ).start()
-    
-    port = int(os.environ.get('PORT', 8050))
-    app.run(debug=False, host='0.0.0.0', port=port)
-    
-    thresholds: List[float] = field(default_factory=lambda: [
-        0.005, 0.0075, 0.01, 0.0125, 0.015, 0.02, 0.025, 0.03, 0.04, 0.05
-    ])
-    
-    display_bits: int = 20
-    update_interval_ms: int = 1000
-    cache_refresh_interval: float = 0.5
-    history_days: int = 5
-    
-    polygon_api_key: str = POLYGON_API_KEY
-    polygon_ws_url: str = "wss://delayed.polygon.io/stocks"
-    polygon_rest_url: str = "https://api.polygon.io"
-    
-    volumes: Dict[str, float] = field(default_factory=dict)
-    week52_data: Dict[str, Dict] = field(default_factory=dict)
-    
-    # Fundamental data storage
-    fundamental_data: Dict[str, Dict] = field(default_factory=dict)
-    fundamental_slopes: Dict[str, Dict] = field(default_factory=dict)
-    
-    min_tradable_stasis: int = 3
-
-config = Config()
-config.symbols = list(dict.fromkeys(config.symbols))
-
-# ============================================================================
-# ENUMS
-# ============================================================================
-
-class Direction(Enum):
-    LONG = "LONG"
-    SHORT = "SHORT"
-
-class SignalStrength(Enum):
-    WEAK = "WEAK"
-    MODERATE = "MODERATE"
-    STRONG = "STRONG"
-    VERY_STRONG = "VERY_STRONG"
-
-# ============================================================================
-# FUNDAMENTAL DATA FETCHER (POLYGON FINANCIALS API)
-# ============================================================================
-
-def fetch_fundamental_data_polygon(symbol: str) -> Optional[Dict]:
-    """
-    Fetch quarterly financial data from Polygon's Financials API.
-    Returns dict with lists of quarterly values for each metric.
-    """
-    try:
-        url = (
-            f"{config.polygon_rest_url}/vX/reference/financials"
-            f"?ticker={symbol}&timeframe=quarterly&limit=24&sort=filing_date"
-            f"&order=desc&apiKey={config.polygon_api_key}"
-        )
-        
-        response = requests.get(url, timeout=30)
-        
-        if response.status_code != 200:
-            return None
-        
-        data = response.json()
-        results = data.get('results', [])
-        
-        if not results:
-            return None
-        
-        # Initialize lists for each metric
-        fundamentals = {
-            'dates': [],
-            'revenue': [],
-            'net_income': [],
-            'operating_cash_flow': [],
-            'capex': [],
-            'fcf': [],
-            'total_assets': [],
-            'total_liabilities': [],
-            'shareholders_equity': [],
-            'current_assets': [],
-            'current_liabilities': [],
-            'total_debt': [],
-            'eps': [],
-        }
-        
-        for result in results:
-            try:
-                financials = result.get('financials', {})
-                
-                # Income Statement
-                income = financials.get('income_statement', {})
-                revenue = income.get('revenues', {}).get('value', 0) or 0
-                net_income = income.get('net_income_loss', {}).get('value', 0) or 0
-                eps = income.get('basic_earnings_per_share', {}).get('value', 0) or 0
-                
-                # Cash Flow Statement
-                cash_flow = financials.get('cash_flow_statement', {})
-                operating_cf = cash_flow.get('net_cash_flow_from_operating_activities', {}).get('value', 0) or 0
-                # CapEx is usually negative, so we take absolute value
-                capex_raw = cash_flow.get('net_cash_flow_from_investing_activities', {}).get('value', 0) or 0
-                
-                # Balance Sheet
-                balance = financials.get('balance_sheet', {})
-                total_assets = balance.get('assets', {}).get('value', 0) or 0
-                total_liabilities = balance.get('liabilities', {}).get('value', 0) or 0
-                equity = balance.get('equity', {}).get('value', 0) or 0
-                current_assets = balance.get('current_assets', {}).get('value', 0) or 0
-                current_liabilities = balance.get('current_liabilities', {}).get('value', 0) or 0
-                
-                # Calculate FCF (Operating Cash Flow - CapEx)
-                # Note: capex from investing activities is usually negative
-                fcf = operating_cf + capex_raw  # Adding because capex is negative
-                
-                # Get debt
-                total_debt = balance.get('long_term_debt', {}).get('value', 0) or 0
-                short_term_debt = balance.get('short_term_debt', {}).get('value', 0) or 0
-                total_debt += short_term_debt
-                
-                # Append to lists
-                fundamentals['dates'].append(result.get('filing_date', ''))
-                fundamentals['revenue'].append(revenue)
-                fundamentals['net_income'].append(net_income)
-                fundamentals['operating_cash_flow'].append(operating_cf)
-                fundamentals['capex'].append(abs(capex_raw))
-                fundamentals['fcf'].append(fcf)
-                fundamentals['total_assets'].append(total_assets)
-                fundamentals['total_liabilities'].append(total_liabilities)
-                fundamentals['shareholders_equity'].append(equity)
-                fundamentals['current_assets'].append(current_assets)
-                fundamentals['current_liabilities'].append(current_liabilities)
-                fundamentals['total_debt'].append(total_debt)
-                fundamentals['eps'].append(eps)
-                
-            except Exception as e:
-                continue
-        
-        # Reverse to chronological order (oldest first)
-        for key in fundamentals:
-            fundamentals[key] = fundamentals[key][::-1]
-        
-        return fundamentals
-        
-    except Exception as e:
-        print(f"Error fetching fundamentals for {symbol}: {e}")
-        return None
 
-
-def calculate_financial_ratios(fundamentals: Dict, current_price: float, market_cap: float) -> Dict:
+def score_stasis_columns(columns: Mapping[str, np.ndarray]) -> np.ndarray:
     """
-    Calculate financial ratios from raw fundamental data.
+    Vectorized SMS for many rows at once. `columns` holds the snapshot fields
+    the stasis rules read (NaN for missing) plus 'signal_strength' (values or None).
     """
-    ratios = {
-        'pe_ratio': [],
-        'current_ratio': [],
-        'roe': [],
-        'roa': [],
-        'net_profit_margin': [],
-        'debt_to_equity': [],
-        'price_to_book': [],
-        'price_to_sales': [],
-        'asset_turnover': [],
-        'fcfy': [],
-    }
-    
-    n = len(fundamentals.get('revenue', []))
-    
-    for i in range(n):
-        try:
-            revenue = fundamentals['revenue'][i]
-            net_income = fundamentals['net_income'][i]
-            total_assets = fundamentals['total_assets'][i]
-            equity = fundamentals['shareholders_equity'][i]
-            current_assets = fundamentals['current_assets'][i]
-            current_liabilities = fundamentals['current_liabilities'][i]
-            total_debt = fundamentals['total_debt'][i]
-            eps = fundamentals['eps'][i]
-            fcf = fundamentals['fcf'][i]
-            
-            # P/E Ratio
-            pe = current_price / eps if eps and eps > 0 else None
-            ratios['pe_ratio'].append(pe)
-            
-            # Current Ratio
-            cr = current_assets / current_liabilities if current_liabilities else None
-            ratios['current_ratio'].append(cr)
-            
-            # ROE
-            roe = net_income / equity if equity and equity > 0 else None
-            ratios['roe'].append(roe)
-            
-            # ROA
-            roa = net_income / total_assets if total_assets else None
-            ratios['roa'].append(roa)
-            
-            # Net Profit Margin
-            npm = net_income / revenue if revenue else None
-            ratios['net_profit_margin'].append(npm)
-            
-            # Debt to Equity
-            de = total_debt / equity if equity and equity > 0 else None
-            ratios['debt_to_equity'].append(de)
-            
-            # Price to Book (using most recent price for all)
-            book_value_per_share = equity / (market_cap / current_price) if current_price and market_cap else None
-            pb = current_price / book_value_per_share if book_value_per_share and book_value_per_share > 0 else None
-            ratios['price_to_book'].append(pb)
-            
-            # Price to Sales (annualized)
-            annual_revenue = revenue * 4  # Quarterly to annual
-            ps = market_cap / annual_revenue if annual_revenue else None
-            ratios['price_to_sales'].append(ps)
-            
-            # Asset Turnover
-            at = revenue / total_assets if total_assets else None
-            ratios['asset_turnover'].append(at)
-            
-            # FCFY (using trailing 4 quarters)
-            if i >= 3:
-                annual_fcf = sum(fundamentals['fcf'][max(0, i-3):i+1])
-                fcfy = annual_fcf / market_cap if market_cap else None
-            else:
-                fcfy = None
-            ratios['fcfy'].append(fcfy)
-            
-        except Exception as e:
-            for key in ratios:
-                ratios[key].append(None)
-    
-    return ratios
+    sms = sum(rule.score_array(columns[rule.field]) for rule in STASIS_MERIT_RULES)
+    strength = columns['signal_strength']
+    for value, points in STRENGTH_POINTS.items():
+        sms = sms + np.where(strength == value, points, 0)
+    return sms.astype(np.int32)
 
 
-def calculate_slopes(series: List, span_short: int = 4, span_long: int = 20) -> Tuple[Optional[float], Optional[float]]:
-    """
-    Calculate EMA-based slopes for 5-quarter and 20-quarter periods.
-    Returns (slope_5, slope_20)
-    """
-    if not series or len(series) < 5:
-        return None, None
-    
-    # Convert to pandas series, handling None values
-    s = pd.Series(series)
-    s = s.replace([np.inf, -np.inf], np.nan)
-    
-    # 5-Quarter slope (using span=4)
-    slope_5 = None
-    if len(s.dropna()) >= 5:
-        try:
-            ema_short = s.ewm(span=span_short, adjust=False).mean()
-            if len(ema_short) >= 5 and pd.notna(ema_short.iloc[-1]) and pd.notna(ema_short.iloc[-5]):
-                if abs(ema_short.iloc[-5]) > 0.0001:
-                    slope_5 = (ema_short.iloc[-1] - ema_short.iloc[-5]) / abs(ema_short.iloc[-5])
-        except:
-            pass
-    
-    # 20-Quarter slope
-    slope_20 = None
-    if len(s.dropna()) >= 21:
-        try:
-            ema_long = s.ewm(span=span_long, adjust=False).mean()
-            if len(ema_long) >= 21 and pd.notna(ema_long.iloc[-1]) and pd.notna(ema_long.iloc[-21]):
-                if abs(ema_long.iloc[-21]) > 0.0001:
-                    slope_20 = (ema_long.iloc[-1] - ema_long.iloc[-21]) / abs(ema_long.iloc[-21])
-        except:
-            pass
-    
-    return slope_5, slope_20
+def score_fundamental_columns(slopes: Mapping[str, np.ndarray], has_slopes: np.ndarray,
+                              week52_percentile: np.ndarray) -> np.ndarray:
+    """Vectorized FMS: one column per fundamental rule field, NaN for missing values."""
+    fms = sum(rule.score_array(slopes[rule.field]) for rule in FUNDAMENTAL_MERIT_RULES)
+    fms = np.where(has_slopes, fms, 0) + WEEK52_RULE.score_array(week52_percentile)
+    return fms.astype(np.int32)
 
 
-def calculate_all_slopes(fundamentals: Dict, ratios: Dict) -> Dict:
+def week52_buckets(week52_percentile: np.ndarray) -> np.ndarray:
+    """Index of each row's 52W scoring bucket (percentile <= edge); -1 when unknown."""
+    buckets = np.searchsorted(WEEK52_RULE.edges, week52_percentile, side='left')
+    return np.where(np.isnan(week52_percentile), -1, buckets)
+
+
+class FundamentalScoreCache:
     """
-    Calculate all fundamental slopes for merit scoring.
+    FMS and slope details per (symbol, 52W bucket). They depend only on the
+    symbol's fundamental slopes and that bucket, so every threshold's stream
+    shares one entry until the fundamentals refresh (invalidate). Misses are
+    scored together as columns.
     """
-    slopes = {}
-    
-    # Revenue slopes
-    slopes['Rev_Slope_5'], slopes['Rev_Slope_20'] = calculate_slopes(fundamentals.get('revenue', []))
-    
-    # FCF slopes
-    slopes['FCF_Slope_5'], slopes['FCF_Slope_20'] = calculate_slopes(fundamentals.get('fcf', []))
-    
-    # Net Income slopes (as proxy for EPS/Deps)
-    slopes['Deps_Slope_5'], slopes['Deps_Slope_20'] = calculate_slopes(fundamentals.get('net_income', []))
-    
-    # Ratio slopes
-    slopes['P/E Ratio_Slope_5'], slopes['P/E Ratio_Slope_20'] = calculate_slopes(ratios.get('pe_ratio', []))
-    slopes['Current Ratio_Slope_5'], slopes['Current Ratio_Slope_20'] = calculate_slopes(ratios.get('current_ratio', []))
-    slopes['Return on Equity_Slope_5'], slopes['Return on Equity_Slope_20'] = calculate_slopes(ratios.get('roe', []))
-    slopes['Return on Assets_Slope_5'], slopes['Return on Assets_Slope_20'] = calculate_slopes(ratios.get('roa', []))
-    slopes['Net Profit Margin_Slope_5'], slopes['Net Profit Margin_Slope_20'] = calculate_slopes(ratios.get('net_profit_margin', []))
-    slopes['Debt to Equity Ratio_Slope_5'], slopes['Debt to Equity Ratio_Slope_20'] = calculate_slopes(ratios.get('debt_to_equity', []))
-    slopes['Price to Book Ratio_Slope_5'], slopes['Price to Book Ratio_Slope_20'] = calculate_slopes(ratios.get('price_to_book', []))
-    slopes['Price to Sales Ratio_Slope_5'], slopes['Price to Sales Ratio_Slope_20'] = calculate_slopes(ratios.get('price_to_sales', []))
-    slopes['Asset Turnover_Slope_5'], slopes['Asset Turnover_Slope_20'] = calculate_slopes(ratios.get('asset_turnover', []))
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries: Dict[str, Dict[int, Tuple[int, Dict]]] = {}
+        # Bumped by invalidate() so a score computed from replaced slopes is not stored
+        self.generation = 0
     
-    # Get latest FCFY
-    fcfy_list = ratios.get('fcfy', [])
-    slopes['FCFY'] = fcfy_list[-1] if fcfy_list and fcfy_list[-1] is not None else None
+    def get_many(self, symbols: List[str], week52_percentile: np.ndarray) -> Tuple[np.ndarray, List[Dict]]:
+        """(FMS, slope details) per row; week52_percentile uses NaN when unknown."""
+        keys = list(zip(symbols, week52_buckets(week52_percentile).tolist()))
+        first_row = {}
+        for row, key in enumerate(keys):
+            first_row.setdefault(key, row)
+        
+        with self.lock:
+            generation = self.generation
+            found = {key: self.entries.get(key[0], {}).get(key[1]) for key in first_row}
+        
+        missing = [key for key, entry in found.items() if entry is None]
+        if missing:
+            symbol_slopes = [config.fundamental_slopes.get(symbol, {}) for symbol, _ in missing]
+            slopes = {rule.field: _float_column(s.get(rule.field) for s in symbol_slopes)
+                      for rule in FUNDAMENTAL_MERIT_RULES}
+            has_slopes = np.array([bool(s) for s in symbol_slopes], dtype=bool)
+            percentiles = week52_percentile[[first_row[key] for key in missing]]
+            scores = score_fundamental_columns(slopes, has_slopes, percentiles).tolist()
+            
+            for key, fms, s in zip(missing, scores, symbol_slopes):
+                found[key] = (fms, get_slope_details(s))
+            with self.lock:
+                if generation == self.generation:
+                    for key in missing:
+                        self.entries.setdefault(key[0], {})[key[1]] = found[key]
+        
+        fms = np.array([found[key][0] for key in keys], dtype=np.int32)
+        return fms, [found[key][1] for key in keys]
     
-    return slopes
+    def invalidate(self, symbols: Optional[Iterable[str]] = None):
+        with self.lock:
+            self.generation += 1
+            if symbols is None:
+                self.entries.clear()
+            else:
+                for symbol in symbols:
+                    self.entries.pop(symbol, None)
 
 
-def fetch_all_fundamental_data():
+fms_cache = engine_registry.get_or_create('fms_cache', FundamentalScoreCache)
+
+
+def score_snapshots(snapshots: List[Mapping]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[Dict]]:
     """
-    Fetch fundamental data for all symbols and calculate slopes.
+    (SMS, FMS, combined, slope details) for a list of snapshots. SMS is
+    scored as columns; FMS comes from the per-(symbol, 52W bucket) cache.
     """
-    print("\n📊 FETCHING FUNDAMENTAL DATA...")
-    
-    success_count = 0
-    fail_count = 0
-    
-    for i, symbol in enumerate(config.symbols):
-        try:
-            # Fetch raw fundamental data
-            fundamentals = fetch_fundamental_data_polygon(symbol)
-            
-            if fundamentals and len(fundamentals.get('revenue', [])) >= 4:
-                # Get current price and market cap from week52 data
-                current_price = None
-                market_cap = None
-                
-                if symbol in config.week52_data:
-                    w52 = config.week52_data[symbol]
-                    if w52.get('high') and w52.get('low'):
-                        # Estimate current price from percentile
-                        current_price = (w52['high'] + w52['low']) / 2
-                
-                # Fetch current quote for accurate price
-                try:
-                    quote_url = f"{config.polygon_rest_url}/v2/aggs/ticker/{symbol}/prev?adjusted=true&apiKey={config.polygon_api_key}"
-                    quote_resp = requests.get(quote_url, timeout=10)
-                    if quote_resp.status_code == 200:
-                        quote_data = quote_resp.json()
-                        if quote_data.get('results') and len(quote_data['results']) > 0:
-                            current_price = quote_data['results'][0].get('c', current_price)
-                except:
-                    pass
-                
-                # Estimate market cap (shares outstanding * price)
-                # For now, use a rough estimate from fundamentals
-                if fundamentals.get('shareholders_equity') and current_price:
-                    # Very rough estimate
-                    latest_equity = fundamentals['shareholders_equity'][-1]
-                    if latest_equity and latest_equity > 0:
-                        market_cap = latest_equity * 2  # Rough multiplier
-                    else:
-                        market_cap = 1e9  # Default 1B
-                else:
-                    market_cap = 1e9
-                
-                if current_price is None:
-                    current_price = 100  # Default
-                
-                # Calculate ratios
-                ratios = calculate_financial_ratios(fundamentals, current_price, market_cap)
-                
-                # Calculate all slopes
-                slopes = calculate_all_slopes(fundamentals, ratios)
-                
-                # Store
-                config.fundamental_data[symbol] = fundamentals
-                config.fundamental_slopes[symbol] = slopes
-                
-                success_count += 1
-            else:
-                fail_count += 1
-                
-        except Exception as e:
-            fail_count += 1
-        
-        if (i + 1) % 25 == 0:
-            print(f"   📈 Fundamentals: {i + 1}/{len(config.symbols)} (✓{success_count} ✗{fail_count})")
-        
-        time.sleep(0.15)  # Rate limiting
+    columns = {rule.field: _float_column(d.get(rule.field) for d in snapshots) for rule in STASIS_MERIT_RULES}
+    columns['signal_strength'] = np.array([d.get('signal_strength') for d in snapshots], dtype=object)
+    sms = score_stasis_columns(columns)
     
-    print(f"✅ Fundamental data: {success_count} success, {fail_count} failed\n")
+    fms, slope_details = fms_cache.get_many(
+        [d.get('symbol', '') for d in snapshots],
+        _float_column(d.get('week52_percentile') for d in snapshots)
+    )
+    return sms, fms, sms + fms, slope_details
+
+
+def apply_merit_scores(snapshots: List[Dict]):
+    """Score a batch of snapshots in place with score_snapshots."""
+    sms, fms, combined, slope_details = score_snapshots(snapshots)
+    for snapshot, s, f, c, details in zip(snapshots, sms.tolist(), fms.tolist(), combined.tolist(), slope_details):
+        snapshot['stasis_merit_score'] = s
+        snapshot['fundamental_merit_score'] = f
+        snapshot['combined_merit_score'] = c
+        snapshot['slope_details'] = details
 
 
 # ============================================================================
-# MERIT SCORE CALCULATIONS
+# DATA FETCHERS
 # ============================================================================
 
-def calculate_stasis_merit_score(snapshot: Dict) -> int:
+def fetch_daily_bars(symbol: str, start_date: datetime, end_date: datetime) -> Optional[Dict[str, np.ndarray]]:
     """
-    Calculate Stasis Merit Score (SMS) based on:
-    - Stasis count (pattern strength)
-    - Risk:Reward ratio
-    - Signal strength
-    - Duration (confirmation)
-    
-    Max Score: 22 points
+    Fetch one year of daily aggregates for a symbol (oldest first).
+    Returns column arrays: t (epoch ms), h, l, c, v.
     """
-    merit_score = 0
-    
-    # Stasis count scoring (0-10 points)
-    stasis = snapshot.get('stasis', 0)
-    if stasis >= 15:
-        merit_score += 10
-    elif stasis >= 12:
-        merit_score += 9
-    elif stasis >= 10:
-        merit_score += 8
-    elif stasis >= 8:
-        merit_score += 7
-    elif stasis >= 7:
-        merit_score += 6
-    elif stasis >= 6:
-        merit_score += 5
-    elif stasis >= 5:
-        merit_score += 4
-    elif stasis >= 4:
-        merit_score += 3
-    elif stasis >= 3:
-        merit_score += 2
-    elif stasis >= 2:
-        merit_score += 1
-    
-    # Risk:Reward scoring (0-5 points)
-    rr = snapshot.get('risk_reward')
-    if rr is not None:
-        if rr >= 3:
-            merit_score += 5
-        elif rr >= 2.5:
-            merit_score += 4
-        elif rr >= 2:
-            merit_score += 3
-        elif rr >= 1.5:
-            merit_score += 2
-        elif rr >= 1:
-            merit_score += 1
-    
-    # Signal strength scoring (0-4 points)
-    strength = snapshot.get('signal_strength')
-    if strength == 'VERY_STRONG':
-        merit_score += 4
-    elif strength == 'STRONG':
-        merit_score += 3
-    elif strength == 'MODERATE':
-        merit_score += 2
-    elif strength == 'WEAK':
-        merit_score += 1
-    
-    # Duration scoring (0-3 points)
-    duration_seconds = snapshot.get('duration_seconds', 0)
-    if duration_seconds >= 3600:
-        merit_score += 3
-    elif duration_seconds >= 1800:
-        merit_score += 2
-    elif duration_seconds >= 900:
-        merit_score += 1
-    
-    return merit_score
+    try:
+        url = (
+            f"{config.polygon_rest_url}/v2/aggs/ticker/{symbol}/range/1/day/"
+            f"{start_date.strftime('%Y-%m-%d')}/{end_date.strftime('%Y-%m-%d')}"
+            f"?adjusted=true&sort=asc&limit=365&apiKey={config.polygon_api_key}"
+        )
+        
+        response = polygon_session.get(url, endpoint='daily_aggs', timeout=15)
+        
+        if response.status_code == 200:
+            data = response.json()
+            results = data.get('results')
+            if results:
+                return {
+                    't': np.fromiter((bar['t'] for bar in results), dtype=np.int64, count=len(results)),
+                    'h': np.fromiter((bar['h'] for bar in results), dtype=np.float64, count=len(results)),
+                    'l': np.fromiter((bar['l'] for bar in results), dtype=np.float64, count=len(results)),
+                    'c': np.fromiter((bar['c'] for bar in results), dtype=np.float64, count=len(results)),
+                    'v': np.fromiter((bar['v'] for bar in results), dtype=np.float64, count=len(results)),
+                }
+    except:
+        pass
+    
+    return None
 
 
-def calculate_fundamental_merit_score(symbol: str, week52_percentile: Optional[float]) -> Tuple[int, Dict]:
+def summarize_daily_bars(bars: Dict[str, np.ndarray], end_date: datetime) -> Tuple[Dict, float]:
     """
-    Calculate Fundamental Merit Score (FMS) based on:
-    - Fundamental growth SLOPES (steepness)
-    - 52-week percentile (value position)
-    - FCFY (cash yield)
-    
-    Max Score: ~55 points
-    
-    Returns: (score, slope_details_dict)
+    Derive the 52-week high/low/current and the average volume
+    (last 30 sessions within 45 days, in millions) from one set of daily bars.
     """
-    merit_score = 0
-    slope_details = {}
+    high_val = float(bars['h'].max())
+    low_val = float(bars['l'].min())
+    week52 = {
+        'high': high_val,
+        'low': low_val,
+        'range': high_val - low_val,
+        'current': float(bars['c'][-1]),
+    }
     
-    slopes = config.fundamental_slopes.get(symbol, {})
+    volume_cutoff_ms = int((end_date - timedelta(days=45)).timestamp() * 1000)
+    recent_volume = bars['v'][bars['t'] >= volume_cutoff_ms][-30:]
+    volume = float(recent_volume.mean()) / 1_000_000 if len(recent_volume) > 0 else 10.0
     
-    if not slopes:
-        # No fundamental data available - return with just 52W percentile scoring
-        if week52_percentile is not None:
-            if week52_percentile <= 5: merit_score += 8
-            elif week52_percentile <= 15: merit_score += 7
-            elif week52_percentile <= 25: merit_score += 6
-            elif week52_percentile <= 35: merit_score += 5
-            elif week52_percentile <= 45: merit_score += 4
-            elif week52_percentile <= 55: merit_score += 3
-            elif week52_percentile <= 65: merit_score += 2
-            elif week52_percentile <= 75: merit_score += 1
-        return merit_score, slope_details
-    
-    # ========================================
-    # GROWTH METRICS - Positive slope = GOOD
-    # ========================================
-    
-    # REVENUE SLOPES (critical growth indicator)
-    rev_slope_5 = slopes.get('Rev_Slope_5')
-    rev_slope_20 = slopes.get('Rev_Slope_20')
-    slope_details['Rev_5'] = rev_slope_5
-    slope_details['Rev_20'] = rev_slope_20
-    
-    if rev_slope_5 is not None:
-        if rev_slope_5 >= 0.30: merit_score += 4      # 30%+ = exceptional growth
-        elif rev_slope_5 >= 0.20: merit_score += 3    # 20%+ = strong
-        elif rev_slope_5 >= 0.10: merit_score += 2    # 10%+ = solid
-        elif rev_slope_5 >= 0.05: merit_score += 1    # 5%+ = positive
-    
-    if rev_slope_20 is not None:
-        if rev_slope_20 >= 0.20: merit_score += 3
-        elif rev_slope_20 >= 0.10: merit_score += 2
-        elif rev_slope_20 >= 0.05: merit_score += 1
-    
-    # FCF SLOPES (cash generation acceleration)
-    fcf_slope_5 = slopes.get('FCF_Slope_5')
-    fcf_slope_20 = slopes.get('FCF_Slope_20')
-    slope_details['FCF_5'] = fcf_slope_5
-    slope_details['FCF_20'] = fcf_slope_20
-    
-    if fcf_slope_5 is not None:
-        if fcf_slope_5 >= 0.40: merit_score += 4
-        elif fcf_slope_5 >= 0.25: merit_score += 3
-        elif fcf_slope_5 >= 0.10: merit_score += 2
-        elif fcf_slope_5 >= 0.05: merit_score += 1
-    
-    if fcf_slope_20 is not None:
-        if fcf_slope_20 >= 0.25: merit_score += 3
-        elif fcf_slope_20 >= 0.15: merit_score += 2
-        elif fcf_slope_20 >= 0.05: merit_score += 1
-    
-    # ROE SLOPES (profitability improvement)
-    roe_slope_5 = slopes.get('Return on Equity_Slope_5')
-    roe_slope_20 = slopes.get('Return on Equity_Slope_20')
-    slope_details['ROE_5'] = roe_slope_5
-    
-    if roe_slope_5 is not None:
-        if roe_slope_5 >= 0.20: merit_score += 2
-        elif roe_slope_5 >= 0.10: merit_score += 1
-    
-    if roe_slope_20 is not None:
-        if roe_slope_20 >= 0.15: merit_score += 2
-        elif roe_slope_20 >= 0.08: merit_score += 1
-    
-    # ROA SLOPES
-    roa_slope_5 = slopes.get('Return on Assets_Slope_5')
-    slope_details['ROA_5'] = roa_slope_5
-    
-    if roa_slope_5 is not None:
-        if roa_slope_5 >= 0.15: merit_score += 2
-        elif roa_slope_5 >= 0.08: merit_score += 1
-    
-    # NET PROFIT MARGIN SLOPES (margin expansion)
-    npm_slope_5 = slopes.get('Net Profit Margin_Slope_5')
-    npm_slope_20 = slopes.get('Net Profit Margin_Slope_20')
-    slope_details['NPM_5'] = npm_slope_5
-    
-    if npm_slope_5 is not None:
-        if npm_slope_5 >= 0.20: merit_score += 2
-        elif npm_slope_5 >= 0.10: merit_score += 1
-    
-    if npm_slope_20 is not None:
-        if npm_slope_20 >= 0.15: merit_score += 2
-        elif npm_slope_20 >= 0.08: merit_score += 1
-    
-    # ASSET TURNOVER & CURRENT RATIO
-    at_slope_5 = slopes.get('Asset Turnover_Slope_5')
-    cr_slope_5 = slopes.get('Current Ratio_Slope_5')
-    
-    if at_slope_5 is not None and at_slope_5 >= 0.10: merit_score += 1
-    if cr_slope_5 is not None and cr_slope_5 >= 0.10: merit_score += 1
-    
-    # ========================================
-    # VALUATION METRICS - Negative slope = GOOD
-    # (Stock getting CHEAPER relative to fundamentals)
-    # ========================================
-    
-    # P/E RATIO SLOPES (declining = getting cheaper)
-    pe_slope_5 = slopes.get('P/E Ratio_Slope_5')
-    pe_slope_20 = slopes.get('P/E Ratio_Slope_20')
-    slope_details['PE_5'] = pe_slope_5
-    
-    if pe_slope_5 is not None:
-        if pe_slope_5 <= -0.25: merit_score += 3
-        elif pe_slope_5 <= -0.15: merit_score += 2
-        elif pe_slope_5 <= -0.05: merit_score += 1
-    
-    if pe_slope_20 is not None:
-        if pe_slope_20 <= -0.20: merit_score += 2
-        elif pe_slope_20 <= -0.10: merit_score += 1
-    
-    # DEBT TO EQUITY SLOPES (declining = deleveraging)
-    de_slope_5 = slopes.get('Debt to Equity Ratio_Slope_5')
-    de_slope_20 = slopes.get('Debt to Equity Ratio_Slope_20')
-    slope_details['DE_5'] = de_slope_5
-    
-    if de_slope_5 is not None:
-        if de_slope_5 <= -0.20: merit_score += 2
-        elif de_slope_5 <= -0.10: merit_score += 1
-    
-    if de_slope_20 is not None:
-        if de_slope_20 <= -0.15: merit_score += 2
-        elif de_slope_20 <= -0.08: merit_score += 1
-    
-    # PRICE TO BOOK & PRICE TO SALES SLOPES
-    pb_slope_5 = slopes.get('Price to Book Ratio_Slope_5')
-    ps_slope_5 = slopes.get('Price to Sales Ratio_Slope_5')
-    
-    if pb_slope_5 is not None and pb_slope_5 <= -0.20: merit_score += 1
-    if ps_slope_5 is not None and ps_slope_5 <= -0.20: merit_score += 1
-    
-    # ========================================
-    # 52-WEEK PERCENTILE (Lower = buying at value)
-    # ========================================
-    if week52_percentile is not None:
-        if week52_percentile <= 5: merit_score += 8
-        elif week52_percentile <= 15: merit_score += 7
-        elif week52_percentile <= 25: merit_score += 6
-        elif week52_percentile <= 35: merit_score += 5
-        elif week52_percentile <= 45: merit_score += 4
-        elif week52_percentile <= 55: merit_score += 3
-        elif week52_percentile <= 65: merit_score += 2
-        elif week52_percentile <= 75: merit_score += 1
-    
-    # ========================================
-    # FCFY - Free Cash Flow Yield (Higher = value)
-    # ========================================
-    fcfy = slopes.get('FCFY')
-    slope_details['FCFY'] = fcfy
-    
-    if fcfy is not None:
-        if fcfy >= 0.15: merit_score += 3      # 15%+ FCFY = exceptional
-        elif fcfy >= 0.10: merit_score += 2    # 10%+ = strong
-        elif fcfy >= 0.05: merit_score += 1    # 5%+ = solid
-    
-    return merit_score, slope_details
-
-
-def calculate_combined_merit_score(snapshot: Dict) -> Tuple[int, int, int, Dict]:
-    """
-    Calculate both merit scores.
-    Returns: (stasis_merit, fundamental_merit, combined_total, slope_details)
-    """
-    sms = calculate_stasis_merit_score(snapshot)
-    fms, slope_details = calculate_fundamental_merit_score(
-        snapshot.get('symbol', ''),
-        snapshot.get('week52_percentile')
-    )
-    return sms, fms, sms + fms, slope_details
+    return week52, volume
 
 
-# ============================================================================
-# DATA FETCHERS
-# ============================================================================
-
-def fetch_52_week_data() -> Dict[str, Dict]:
-    print("📊 Fetching 52-week high/low data...")
+def fetch_daily_data() -> Tuple[Dict[str, Dict], Dict[str, float]]:
+    """
+    One daily-bar fetch per symbol feeds both the 52-week table and the
+    volume table. The bars are kept in config.daily_bars for reuse.
+    """
+    print("📊 Fetching daily bars (52-week range + volume)...")
     week52_data = {}
+    volumes = {}
     
     end_date = datetime.now()
     start_date = end_date - timedelta(days=365)
     
-    success_count = 0
-    fail_count = 0
+    counts = {'success': 0, 'fail': 0}
     
-    for i, symbol in enumerate(config.symbols):
-        try:
-            url = (
-                f"{config.polygon_rest_url}/v2/aggs/ticker/{symbol}/range/1/day/"
-                f"{start_date.strftime('%Y-%m-%d')}/{end_date.strftime('%Y-%m-%d')}"
-                f"?adjusted=true&sort=asc&limit=365&apiKey={config.polygon_api_key}"
-            )
-            
-            response = requests.get(url, timeout=15)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('results') and len(data['results']) > 0:
-                    highs = [bar['h'] for bar in data['results']]
-                    lows = [bar['l'] for bar in data['results']]
-                    closes = [bar['c'] for bar in data['results']]
-                    
-                    high_val = max(highs)
-                    low_val = min(lows)
-                    current_close = closes[-1] if closes else None
-                    
-                    week52_data[symbol] = {
-                        'high': high_val,
-                        'low': low_val,
-                        'range': high_val - low_val,
-                        'current': current_close,
-                    }
-                    success_count += 1
-                else:
-                    week52_data[symbol] = {'high': None, 'low': None, 'range': None, 'current': None}
-                    fail_count += 1
-            else:
-                week52_data[symbol] = {'high': None, 'low': None, 'range': None, 'current': None}
-                fail_count += 1
-            
-            if (i + 1) % 50 == 0:
-                print(f"   📈 Processed {i + 1}/{len(config.symbols)} (✓{success_count} ✗{fail_count})...")
-            
-            time.sleep(0.12)
-        except:
+    def on_result(symbol: str, bars: Optional[Dict[str, np.ndarray]], completed: int):
+        if bars is not None and len(bars['c']) > 0:
+            config.daily_bars[symbol] = bars
+            week52_data[symbol], volumes[symbol] = summarize_daily_bars(bars, end_date)
+            counts['success'] += 1
+        else:
             week52_data[symbol] = {'high': None, 'low': None, 'range': None, 'current': None}
-            fail_count += 1
+            volumes[symbol] = 10.0
+            counts['fail'] += 1
+        
+        if completed % 50 == 0:
+            print(f"   📈 Processed {completed}/{len(config.symbols)} (✓{counts['success']} ✗{counts['fail']})...")
+    
+    ingestion.map(lambda s: fetch_daily_bars(s, start_date, end_date), config.symbols, on_result)
     
-    print(f"✅ 52-week data: {success_count} success, {fail_count} failed\n")
-    return week52_data
+    print(f"✅ Daily data: {counts['success']} success, {counts['fail']} failed\n")
+    return week52_data, volumes
 
 
-def fetch_volume_data() -> Dict[str, float]:
-    print("📊 Fetching volume data...")
-    volumes = {}
+def fetch_grouped_daily(date_str: str) -> Optional[List[Dict]]:
+    """Fetch Polygon's grouped daily aggregates (every US ticker) for one date."""
+    try:
+        url = (
+            f"{config.polygon_rest_url}/v2/aggs/grouped/locale/us/market/stocks/{date_str}"
+            f"?adjusted=true&apiKey={config.polygon_api_key}"
+        )
+        
+        response = polygon_session.get(url, endpoint='grouped_daily', timeout=30)
+        
+        if response.status_code == 200:
+            return response.json().get('results') or []
+    except:
+        pass
+    
+    return None
+
+
+def fetch_daily_data_grouped() -> Tuple[Dict[str, Dict], Dict[str, float]]:
+    """
+    Bulk alternative to fetch_daily_data: one grouped-daily request per
+    weekday of the last year (~260 requests regardless of universe size).
+    Bars are assembled into date x symbol matrices and reduced column-wise.
+    """
+    print("📊 Fetching grouped daily bars (52-week range + volume)...")
     
     end_date = datetime.now()
-    start_date = end_date - timedelta(days=45)
+    start_date = end_date - timedelta(days=365)
     
-    for i, symbol in enumerate(config.symbols):
-        try:
-            url = (
-                f"{config.polygon_rest_url}/v2/aggs/ticker/{symbol}/range/1/day/"
-                f"{start_date.strftime('%Y-%m-%d')}/{end_date.strftime('%Y-%m-%d')}"
-                f"?adjusted=true&sort=desc&limit=30&apiKey={config.polygon_api_key}"
-            )
-            
-            response = requests.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('results') and len(data['results']) > 0:
-                    total_volume = sum(bar['v'] for bar in data['results'])
-                    volumes[symbol] = (total_volume / len(data['results'])) / 1_000_000
-                else:
-                    volumes[symbol] = 10.0
-            else:
-                volumes[symbol] = 10.0
-            
-            if (i + 1) % 50 == 0:
-                print(f"   📈 Processed {i + 1}/{len(config.symbols)}...")
-            
-            time.sleep(0.12)
-        except:
-            volumes[symbol] = 10.0
+    dates = []
+    day = start_date
+    while day <= end_date:
+        if day.weekday() < 5:
+            dates.append(day.strftime('%Y-%m-%d'))
+        day += timedelta(days=1)
+    
+    symbol_index = pd.Index(config.symbols)
+    n_dates, n_symbols = len(dates), len(config.symbols)
+    row_of = {d: i for i, d in enumerate(dates)}
+    
+    highs = np.full((n_dates, n_symbols), np.nan)
+    lows = np.full((n_dates, n_symbols), np.nan)
+    closes = np.full((n_dates, n_symbols), np.nan)
+    volumes_m = np.full((n_dates, n_symbols), np.nan)
+    times = np.zeros(n_dates, dtype=np.int64)
+    
+    def on_result(date_str: str, results: Optional[List[Dict]], completed: int):
+        if results:
+            row = row_of[date_str]
+            cols = symbol_index.get_indexer([r.get('T') for r in results])
+            keep = np.flatnonzero(cols >= 0)
+            if len(keep) > 0:
+                matched = [results[k] for k in keep]
+                cols = cols[keep]
+                highs[row, cols] = [r['h'] for r in matched]
+                lows[row, cols] = [r['l'] for r in matched]
+                closes[row, cols] = [r['c'] for r in matched]
+                volumes_m[row, cols] = [r['v'] for r in matched]
+                times[row] = matched[0]['t']
+        
+        if completed % 50 == 0:
+            print(f"   📈 Processed {completed}/{n_dates} dates...")
+    
+    ingestion.map(fetch_grouped_daily, dates, on_result)
+    
+    # Drop dates with no bars (holidays) so "last N sessions" counts trading days
+    traded = times > 0
+    highs, lows, closes, volumes_m, times = (
+        highs[traded], lows[traded], closes[traded], volumes_m[traded], times[traded]
+    )
+    
+    valid = ~np.isnan(closes)
+    has_data = valid.any(axis=0)
+    
+    high_vals = np.where(valid, highs, -np.inf).max(axis=0)
+    low_vals = np.where(valid, lows, np.inf).min(axis=0)
+    last_row = len(closes) - 1 - np.argmax(valid[::-1], axis=0)
+    current_vals = closes[last_row, np.arange(n_symbols)] if len(closes) > 0 else np.full(n_symbols, np.nan)
+    
+    # Average volume over each symbol's last 30 sessions inside the 45-day window
+    volume_cutoff_ms = int((end_date - timedelta(days=45)).timestamp() * 1000)
+    in_window = valid & (times >= volume_cutoff_ms)[:, None]
+    sessions_from_end = np.cumsum(in_window[::-1], axis=0)[::-1]
+    use = in_window & (sessions_from_end <= 30)
+    session_counts = use.sum(axis=0)
+    volume_sums = np.where(use, volumes_m, 0.0).sum(axis=0)
+    avg_volumes = np.divide(volume_sums, session_counts, out=np.zeros(n_symbols), where=session_counts > 0) / 1_000_000
+    
+    week52_data = {}
+    volumes = {}
+    
+    for j, symbol in enumerate(config.symbols):
+        if has_data[j]:
+            week52_data[symbol] = {
+                'high': float(high_vals[j]),
+                'low': float(low_vals[j]),
+                'range': float(high_vals[j] - low_vals[j]),
+                'current': float(current_vals[j]),
+            }
+            rows = valid[:, j]
+            config.daily_bars[symbol] = {
+                't': times[rows],
+                'h': highs[rows, j],
+                'l': lows[rows, j],
+                'c': closes[rows, j],
+                'v': volumes_m[rows, j],
+            }
+        else:
+            week52_data[symbol] = {'high': None, 'low': None, 'range': None, 'current': None}
+        volumes[symbol] = float(avg_volumes[j]) if session_counts[j] > 0 else 10.0
     
-    print(f"✅ Volume data: {len(volumes)} symbols\n")
-    return volumes
+    print(f"✅ Grouped daily data: {int(has_data.sum())} symbols from {len(times)} sessions\n")
+    return week52_data, volumes
+
 
+def parse_minute_bars(content: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Decode an aggregates response body into (int64 epoch-ms timestamps,
+    float64 closes). Only the columns the engine uses are kept; the decoded
+    bar dicts are dropped as soon as the arrays are filled.
+    """
+    results = json.loads(content).get('results') or []
+    return (np.fromiter((bar['t'] for bar in results), dtype=np.int64, count=len(results)),
+            np.fromiter((bar['c'] for bar in results), dtype=np.float64, count=len(results)))
 
-def fetch_historical_bars(symbol: str, days: int = 5) -> List[Dict]:
-    bars = []
+
+def fetch_historical_bars(symbol: str, days: int = 5, after_ms: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fetch 1-minute bars as (epoch-ms int64 timestamps, float64 closes).
+    With after_ms, only bars strictly after that timestamp are requested.
+    """
     end_date = datetime.now()
     start_date = end_date - timedelta(days=days)
+    range_start = str(after_ms + 1) if after_ms is not None else start_date.strftime('%Y-%m-%d')
     
     try:
         url = (
             f"{config.polygon_rest_url}/v2/aggs/ticker/{symbol}/range/1/minute/"
-            f"{start_date.strftime('%Y-%m-%d')}/{end_date.strftime('%Y-%m-%d')}"
+            f"{range_start}/{end_date.strftime('%Y-%m-%d')}"
             f"?adjusted=true&sort=asc&limit=50000&apiKey={config.polygon_api_key}"
         )
         
-        response = requests.get(url, timeout=30)
+        response = polygon_session.get(url, endpoint='minute_aggs', timeout=30)
         
         if response.status_code == 200:
-            data = response.json()
-            if data.get('results'):
-                for bar in data['results']:
-                    bars.append({
-                        'timestamp': datetime.fromtimestamp(bar['t'] / 1000),
-                        'close': bar['c'],
-                    })
+            return parse_minute_bars(response.content)
     except:
         pass
     
-    return bars
+    return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+
+# ============================================================================
+# PRICE REFERENCE (LAST KNOWN CLOSES FROM DATA ALREADY FETCHED)
+# ============================================================================
+
+class PriceReference:
+    """
+    Last known close per symbol, served from data already in memory (the
+    daily bars behind config.week52_data) instead of a per-symbol prev-close
+    request. refresh_all() fills the whole universe from one grouped-daily
+    response for the most recent session.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.closes: Dict[str, float] = {}
+    
+    def update_from_week52(self, week52_data: Dict[str, Dict]):
+        with self.lock:
+            for symbol, data in week52_data.items():
+                if data and data.get('current'):
+                    self.closes[symbol] = data['current']
+    
+    def refresh_all(self, lookback_days: int = 7) -> int:
+        """Bulk-load closes from the latest session with grouped data. Returns symbols updated."""
+        universe = set(config.symbols)
+        day = datetime.now()
+        for _ in range(lookback_days):
+            if day.weekday() < 5:
+                results = fetch_grouped_daily(day.strftime('%Y-%m-%d'))
+                if results:
+                    closes = {r['T']: r['c'] for r in results if r.get('T') in universe and r.get('c')}
+                    with self.lock:
+                        self.closes.update(closes)
+                    return len(closes)
+            day -= timedelta(days=1)
+        return 0
+    
+    def get(self, symbol: str) -> Optional[float]:
+        with self.lock:
+            return self.closes.get(symbol)
+    
+    def missing(self, symbols: List[str]) -> List[str]:
+        with self.lock:
+            return [s for s in symbols if s not in self.closes]
+
+
+price_reference = engine_registry.get_or_create('price_reference', PriceReference)
+
+
+# ============================================================================
+# MINUTE BAR STORE (MEMORY-MAPPED NUMPY FILES)
+# ============================================================================
+
+class MinuteBarStore:
+    """
+    Per-symbol 1-minute history on disk: {SYMBOL}.t.npy (int64 epoch ms)
+    and {SYMBOL}.c.npy (float32 closes). Reads are memory-mapped; the
+    backfill window is copied out so no file stays open once it returns.
+    Restarts only fetch the gap after the last stored bar.
+    """
+    def __init__(self, root: str):
+        self.root = root
+    
+    def _paths(self, symbol: str) -> Tuple[str, str]:
+        return (os.path.join(self.root, f"{symbol}.t.npy"),
+                os.path.join(self.root, f"{symbol}.c.npy"))
+    
+    def load(self, symbol: str) -> Tuple[np.ndarray, np.ndarray]:
+        t_path, c_path = self._paths(symbol)
+        try:
+            return np.load(t_path, mmap_mode='r'), np.load(c_path, mmap_mode='r')
+        except (OSError, ValueError):
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+    
+    def append(self, symbol: str, timestamps: np.ndarray, closes: np.ndarray, keep_from_ms: int):
+        """Append bars newer than the stored ones and drop bars older than keep_from_ms."""
+        old_t, old_c = self.load(symbol)
+        if len(old_t) > 0:
+            newer = timestamps > old_t[-1]
+            timestamps, closes = timestamps[newer], closes[newer]
+        
+        start = int(np.searchsorted(old_t, keep_from_ms)) if len(old_t) > 0 else 0
+        if len(timestamps) == 0 and start == 0:
+            return
+        
+        all_t = np.concatenate([old_t[start:], timestamps.astype(np.int64)])
+        all_c = np.concatenate([old_c[start:], closes.astype(np.float32)])
+        
+        os.makedirs(self.root, exist_ok=True)
+        for path, array in zip(self._paths(symbol), (all_t, all_c)):
+            tmp_path = path + ".tmp.npy"
+            np.save(tmp_path, array)
+            os.replace(tmp_path, path)
+    
+    def window(self, symbol: str, start_ms: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (timestamps, closes) of the stored bars at or after start_ms, copied
+        into memory: a mapped slice would hold the file open for as long as
+        the caller keeps it (the whole backfill stage, for ingestion results).
+        """
+        timestamps, closes = self.load(symbol)
+        start = int(np.searchsorted(timestamps, start_ms))
+        return np.array(timestamps[start:]), np.array(closes[start:])
+
+
+minute_store = engine_registry.get_or_create('minute_store', lambda: MinuteBarStore(
+    os.path.join(config.cache_dir, "minute")
+))
+
+
+def sync_minute_bars(symbol: str, days: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bring the symbol's stored minute bars up to date (fetching only the gap
+    after the last stored bar) and return the last `days` of them from disk.
+    """
+    start_date = datetime.now() - timedelta(days=days)
+    window_start_ms = int(datetime(start_date.year, start_date.month, start_date.day).timestamp() * 1000)
+    
+    stored_t, _ = minute_store.load(symbol)
+    last_ms = int(stored_t[-1]) if len(stored_t) > 0 and stored_t[-1] >= window_start_ms else None
+    
+    timestamps, closes = fetch_historical_bars(symbol, days, after_ms=last_ms)
+    minute_store.append(symbol, timestamps, closes, window_start_ms)
+    
+    return minute_store.window(symbol, window_start_ms)
 
 
 def calculate_52week_percentile(price: float, symbol: str) -> Optional[float]:
@@ -2975,16 +1780,16 @@ def calculate_52week_percentile(price: float, symbol: str) -> Optional[float]:
 
 @dataclass
 class StasisInfo:
-    start_time: datetime
+    start_ms: int
     start_price: float
     peak_stasis: int = 1
     
-    def get_duration(self) -> timedelta:
-        return datetime.now() - self.start_time
+    def get_duration(self, now_ms: int) -> float:
+        """Seconds from the stasis start to `now_ms` (both exchange event time)."""
+        return max(0, now_ms - self.start_ms) / 1000
     
-    def get_duration_str(self) -> str:
-        duration = self.get_duration()
-        total_seconds = int(duration.total_seconds())
+    def get_duration_str(self, now_ms: int) -> str:
+        total_seconds = int(self.get_duration(now_ms))
         if total_seconds < 60:
             return f"{total_seconds}s"
         elif total_seconds < 3600:
@@ -2993,7 +1798,7 @@ class StasisInfo:
             return f"{total_seconds // 3600}h {(total_seconds % 3600) // 60}m"
     
     def get_start_date_str(self) -> str:
-        return self.start_time.strftime("%m/%d %H:%M")
+        return from_epoch_ms(self.start_ms).strftime("%m/%d %H:%M")
     
     def get_price_change_pct(self, current_price: float) -> float:
         if self.start_price == 0:
@@ -3005,11 +1810,112 @@ class StasisInfo:
 # BITSTREAM
 # ============================================================================
 
-@dataclass
-class BitEntry:
-    bit: int
-    price: float
-    timestamp: datetime
+BIT_HISTORY_MAXLEN = 500
+
+
+class BitHistory:
+    """
+    Ring buffer of the last `maxlen` bits with the price and epoch-ms time
+    each was emitted at: bits packed 8 per byte, prices as float64 and times
+    as int64. Capacity grows lazily (doubling) up to maxlen, so quiet streams
+    stay small. Index -1 is the newest entry.
+    """
+    def __init__(self, maxlen: int = BIT_HISTORY_MAXLEN):
+        self.maxlen = maxlen
+        self._capacity = 0
+        self._start = 0
+        self._len = 0
+        self._bits = bytearray()
+        self._prices = array('d')
+        self._ms = array('q')
+    
+    def __len__(self) -> int:
+        return self._len
+    
+    def _grow(self):
+        bits, prices, ms = self.to_arrays()
+        self._capacity = min(max(self._capacity * 2, 16), self.maxlen)
+        self._bits = bytearray(np.packbits(bits).tobytes()) + bytearray((self._capacity + 7) // 8 - (self._len + 7) // 8)
+        self._prices = array('d', prices.tobytes()) + array('d', bytes(8 * (self._capacity - self._len)))
+        self._ms = array('q', ms.tobytes()) + array('q', bytes(8 * (self._capacity - self._len)))
+        self._start = 0
+    
+    def _slot(self, index: int) -> int:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("bit history index out of range")
+        return (self._start + index) % self._capacity
+    
+    def append(self, bit: int, price: float, epoch_ms: int, count: int = 1):
+        """Append `count` copies of one bit; the oldest entries drop off past maxlen."""
+        for _ in range(min(count, self.maxlen)):
+            if self._len == self._capacity and self._capacity < self.maxlen:
+                self._grow()
+            if self._len < self._capacity:
+                slot = (self._start + self._len) % self._capacity
+                self._len += 1
+            else:
+                slot = self._start
+                self._start = (self._start + 1) % self._capacity
+            mask = 0x80 >> (slot & 7)
+            if bit:
+                self._bits[slot >> 3] |= mask
+            else:
+                self._bits[slot >> 3] &= ~mask & 0xFF
+            self._prices[slot] = price
+            self._ms[slot] = epoch_ms
+    
+    def bit(self, index: int) -> int:
+        slot = self._slot(index)
+        return (self._bits[slot >> 3] >> (7 - (slot & 7))) & 1
+    
+    def price(self, index: int) -> float:
+        return self._prices[self._slot(index)]
+    
+    def epoch_ms(self, index: int) -> int:
+        return self._ms[self._slot(index)]
+    
+    def recent_bits(self, n: int) -> List[int]:
+        """The last n bits, oldest first."""
+        n = min(n, self._len)
+        return [self.bit(i) for i in range(-n, 0)]
+    
+    def to_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(uint8 bits, float64 prices, int64 epoch ms), oldest first."""
+        if self._len == 0:
+            return np.empty(0, dtype=np.uint8), np.empty(0, dtype=np.float64), np.empty(0, dtype=np.int64)
+        order = (self._start + np.arange(self._len)) % self._capacity
+        bits = np.unpackbits(np.frombuffer(bytes(self._bits), dtype=np.uint8), count=self._capacity)
+        return (bits[order],
+                np.frombuffer(self._prices, dtype=np.float64)[order],
+                np.frombuffer(self._ms, dtype=np.int64)[order])
+    
+    def extend(self, bits: np.ndarray, prices: np.ndarray, epoch_ms: np.ndarray):
+        """Append entries given as arrays, oldest first (bulk copy when empty)."""
+        if self._len > 0:
+            for bit, price, ms in zip(bits.tolist(), prices.tolist(), epoch_ms.tolist()):
+                self.append(bit, price, ms)
+            return
+        
+        bits = np.asarray(bits, dtype=np.uint8)[-self.maxlen:]
+        n = len(bits)
+        if n == 0:
+            return
+        self._capacity = min(max(n, 16), self.maxlen)
+        self._bits = bytearray(np.packbits(bits).tobytes()) + bytearray((self._capacity + 7) // 8 - (n + 7) // 8)
+        self._prices = array('d', np.asarray(prices, dtype=np.float64)[-n:].tobytes()) + array('d', bytes(8 * (self._capacity - n)))
+        self._ms = array('q', np.asarray(epoch_ms, dtype=np.int64)[-n:].tobytes()) + array('q', bytes(8 * (self._capacity - n)))
+        self._start = 0
+        self._len = n
+
+
+def to_epoch_ms(timestamp: datetime) -> int:
+    return int(round(timestamp.timestamp() * 1000))
+
+
+def from_epoch_ms(epoch_ms: int) -> datetime:
+    return datetime.fromtimestamp(epoch_ms / 1000)
 
 
 class Bitstream:
@@ -3021,11 +1927,11 @@ class Bitstream:
         
         self.reference_price = initial_price
         self.current_live_price = initial_price
-        self.last_price_update = datetime.now()
+        self.last_update_ms = to_epoch_ms(datetime.now())
         
         self._update_bands()
         
-        self.bits: deque = deque(maxlen=500)
+        self.bits = BitHistory()
         
         self.current_stasis = 0
         self.last_bit = None
@@ -3042,10 +1948,10 @@ class Bitstream:
         self.upper_band = self.reference_price + self.band_width
         self.lower_band = self.reference_price - self.band_width
     
-    def process_price(self, price: float, timestamp: datetime) -> List[int]:
+    def process_price(self, price: float, event_ms: int) -> List[int]:
         with self._lock:
             self.current_live_price = price
-            self.last_price_update = timestamp
+            self.last_update_ms = event_ms
             
             generated_bits = []
             
@@ -3057,58 +1963,113 @@ class Bitstream:
             
             x = int((price - self.reference_price) / self.band_width)
             
-            if x > 0:
-                for _ in range(x):
-                    self.bits.append(BitEntry(1, price, timestamp))
-                    generated_bits.append(1)
-                    self.total_bits += 1
-                self.reference_price = price
-                self._update_bands()
-            elif x < 0:
-                for _ in range(abs(x)):
-                    self.bits.append(BitEntry(0, price, timestamp))
-                    generated_bits.append(0)
-                    self.total_bits += 1
+            if x != 0:
+                bit = 1 if x > 0 else 0
+                self.bits.append(bit, price, event_ms, abs(x))
+                generated_bits = [bit] * abs(x)
+                self.total_bits += abs(x)
                 self.reference_price = price
                 self._update_bands()
             
             if generated_bits:
-                self._update_stasis(timestamp)
+                self._update_stasis(len(generated_bits))
             
             return generated_bits
     
-    def _update_stasis(self, timestamp: datetime):
-        if len(self.bits) < 2:
-            self.current_stasis = len(self.bits)
-            self.last_bit = self.bits[-1].bit if self.bits else None
+    def process_prices(self, prices: np.ndarray, timestamps: np.ndarray) -> int:
+        """
+        Batch equivalent of calling process_price for each (price, epoch-ms
+        timestamp) pair in order, with identical results. Returns the number
+        of bits generated.
+        """
+        with self._lock:
+            return self._process_batch(prices, timestamps)
+    
+    @staticmethod
+    def process_prices_multi(streams: List['Bitstream'], prices: np.ndarray, timestamps: np.ndarray,
+                             starts: Optional[List[int]] = None) -> int:
+        """
+        Replay one symbol's bars through several streams (typically one per
+        threshold), each from its own start index.
+        """
+        generated = 0
+        for k, stream in enumerate(streams):
+            start = starts[k] if starts is not None else 0
+            with stream._lock:
+                generated += stream._process_batch(prices[start:], timestamps[start:])
+        return generated
+    
+    def _process_batch(self, prices: np.ndarray, timestamps: np.ndarray) -> int:
+        """
+        Jump from one band exit to the next with a windowed NumPy search, so
+        only bars that generate bits are handled in Python. Caller holds _lock.
+        """
+        n = len(prices)
+        if n == 0:
+            return 0
+        
+        generated = 0
+        i = 0
+        window = 64
+        while i < n and self.band_width > 0:
+            segment = prices[i:i + window]
+            exits = np.flatnonzero((segment <= self.lower_band) | (segment >= self.upper_band))
+            if exits.size == 0:
+                i += len(segment)
+                window = min(window * 2, 8192)
+                continue
+            
+            j = i + int(exits[0])
+            i = j + 1
+            window = 64
+            
+            price = float(prices[j])
+            x = int((price - self.reference_price) / self.band_width)
+            if x == 0:
+                continue
+            
+            self.bits.append(1 if x > 0 else 0, price, int(timestamps[j]), abs(x))
+            self.total_bits += abs(x)
+            generated += abs(x)
+            self.reference_price = price
+            self._update_bands()
+            self._update_stasis(abs(x))
+        
+        self.current_live_price = float(prices[-1])
+        self.last_update_ms = int(timestamps[-1])
+        return generated
+    
+    def _update_stasis(self, new_bits: int = 1):
+        """
+        Extend the alternating run by the bits just appended. A single bit
+        opposite to the previous one extends it (up to the history length);
+        anything else restarts it at 1, so the cost is independent of history.
+        """
+        n = len(self.bits)
+        if n < 2:
+            self.current_stasis = n
+            self.last_bit = self.bits.bit(-1) if n else None
             self.direction = None
             self.signal_strength = None
             return
         
-        bits_list = list(self.bits)
-        
-        stasis_count = 1
-        stasis_start_idx = len(bits_list) - 1
-        
-        for i in range(len(bits_list) - 1, 0, -1):
-            if bits_list[i].bit != bits_list[i-1].bit:
-                stasis_count += 1
-                stasis_start_idx = i - 1
-            else:
-                break
+        last_bit = self.bits.bit(-1)
+        if new_bits == 1 and self.bits.bit(-2) != last_bit:
+            stasis_count = min(self.current_stasis + 1, n)
+        else:
+            stasis_count = 1
         
         prev_stasis = self.current_stasis
         self.current_stasis = stasis_count
-        self.last_bit = bits_list[-1].bit
+        self.last_bit = last_bit
         
         if prev_stasis < 2 and stasis_count >= 2:
-            if 0 <= stasis_start_idx < len(bits_list):
-                first_bit = bits_list[stasis_start_idx]
-                self.stasis_info = StasisInfo(
-                    start_time=first_bit.timestamp,
-                    start_price=first_bit.price,
-                    peak_stasis=stasis_count,
-                )
+            # The run starts at the bit before the one just appended
+            self.stasis_info = StasisInfo(
+                start_ms=self.bits.epoch_ms(-2),
+                start_price=self.bits.price(-2),
+                peak_stasis=stasis_count,
+            )
         elif stasis_count >= 2 and self.stasis_info is not None:
             if stasis_count > self.stasis_info.peak_stasis:
                 self.stasis_info.peak_stasis = stasis_count
@@ -3131,6 +2092,47 @@ class Bitstream:
             self.direction = None
             self.signal_strength = None
     
+    def export_state(self) -> Dict:
+        """Plain-value copy of everything needed to rebuild this stream."""
+        with self._lock:
+            return {
+                'symbol': self.symbol,
+                'threshold': self.threshold,
+                'initial_price': self.initial_price,
+                'volume': self.volume,
+                'reference_price': self.reference_price,
+                'current_live_price': self.current_live_price,
+                'last_update_ms': self.last_update_ms,
+                'current_stasis': self.current_stasis,
+                'last_bit': self.last_bit,
+                'direction': self.direction,
+                'signal_strength': self.signal_strength,
+                'stasis_info': (
+                    (self.stasis_info.start_ms, self.stasis_info.start_price, self.stasis_info.peak_stasis)
+                    if self.stasis_info is not None else None
+                ),
+                'total_bits': self.total_bits,
+                'bits': self.bits.to_arrays(),
+            }
+    
+    @classmethod
+    def from_state(cls, state: Dict) -> 'Bitstream':
+        stream = cls(state['symbol'], state['threshold'], state['initial_price'], state['volume'])
+        stream.reference_price = state['reference_price']
+        stream._update_bands()
+        stream.current_live_price = state['current_live_price']
+        stream.last_update_ms = state['last_update_ms']
+        stream.current_stasis = state['current_stasis']
+        stream.last_bit = state['last_bit']
+        stream.direction = state['direction']
+        stream.signal_strength = state['signal_strength']
+        if state['stasis_info'] is not None:
+            start_ms, start_price, peak = state['stasis_info']
+            stream.stasis_info = StasisInfo(start_ms, start_price, peak)
+        stream.total_bits = state['total_bits']
+        stream.bits.extend(*state['bits'])
+        return stream
+    
     def is_tradable(self) -> bool:
         with self._lock:
             return (
@@ -3139,93 +2141,135 @@ class Bitstream:
                 self.volume > 1.0
             )
     
-    def get_snapshot(self, live_price: Optional[float] = None) -> Dict:
+    def capture(self) -> 'StreamState':
+        """Consistent copy of everything build_snapshot reads, taken under the stream lock."""
         with self._lock:
-            current_price = live_price if live_price is not None else self.current_live_price
-            
-            anchor_price = None
-            stasis_start_str = "—"
-            stasis_duration_str = "—"
-            duration_seconds = 0
-            stasis_price_change_pct = None
-            
-            if self.stasis_info is not None:
-                anchor_price = self.stasis_info.start_price
-                stasis_start_str = self.stasis_info.get_start_date_str()
-                stasis_duration_str = self.stasis_info.get_duration_str()
-                duration_seconds = self.stasis_info.get_duration().total_seconds()
-                stasis_price_change_pct = self.stasis_info.get_price_change_pct(current_price)
-            
-            take_profit = None
-            stop_loss = None
-            risk_reward = None
-            distance_to_tp_pct = None
-            distance_to_sl_pct = None
-            
-            if self.direction is not None and self.current_stasis >= 2:
-                if self.direction == Direction.LONG:
-                    take_profit = self.upper_band
-                    stop_loss = self.lower_band
-                    reward = take_profit - current_price
-                    risk = current_price - stop_loss
-                else:
-                    take_profit = self.lower_band
-                    stop_loss = self.upper_band
-                    reward = current_price - take_profit
-                    risk = stop_loss - current_price
-                
-                if risk > 0 and reward > 0:
-                    risk_reward = reward / risk
-                elif risk > 0 and reward <= 0:
-                    risk_reward = 0.0
-                else:
-                    risk_reward = None
-                
-                if current_price > 0:
-                    distance_to_tp_pct = (abs(take_profit - current_price) / current_price) * 100
-                    distance_to_sl_pct = (abs(stop_loss - current_price) / current_price) * 100
-            
-            week52_percentile = calculate_52week_percentile(current_price, self.symbol)
-            recent_bits = [b.bit for b in list(self.bits)[-15:]]
-            
-            # Build base snapshot
-            snapshot = {
-                'symbol': self.symbol,
-                'threshold': self.threshold,
-                'threshold_pct': self.threshold * 100,
-                'stasis': self.current_stasis,
-                'total_bits': self.total_bits,
-                'recent_bits': recent_bits,
-                'current_price': current_price,
-                'anchor_price': anchor_price,
-                'direction': self.direction.value if self.direction else None,
-                'signal_strength': self.signal_strength.value if self.signal_strength else None,
-                'is_tradable': (
-                    self.current_stasis >= config.min_tradable_stasis and
-                    self.direction is not None and
-                    self.volume > 1.0
+            return StreamState(
+                symbol=self.symbol,
+                threshold=self.threshold,
+                current_live_price=self.current_live_price,
+                last_update_ms=self.last_update_ms,
+                upper_band=self.upper_band,
+                lower_band=self.lower_band,
+                current_stasis=self.current_stasis,
+                direction=self.direction,
+                signal_strength=self.signal_strength,
+                stasis_info=(
+                    StasisInfo(self.stasis_info.start_ms, self.stasis_info.start_price, self.stasis_info.peak_stasis)
+                    if self.stasis_info is not None else None
                 ),
-                'stasis_start_str': stasis_start_str,
-                'stasis_duration_str': stasis_duration_str,
-                'duration_seconds': duration_seconds,
-                'stasis_price_change_pct': stasis_price_change_pct,
-                'take_profit': take_profit,
-                'stop_loss': stop_loss,
-                'risk_reward': risk_reward,
-                'distance_to_tp_pct': distance_to_tp_pct,
-                'distance_to_sl_pct': distance_to_sl_pct,
-                'week52_percentile': week52_percentile,
-                'volume': self.volume,
-            }
-            
-            # Calculate merit scores
-            sms, fms, combined, slope_details = calculate_combined_merit_score(snapshot)
-            snapshot['stasis_merit_score'] = sms
-            snapshot['fundamental_merit_score'] = fms
-            snapshot['combined_merit_score'] = combined
-            snapshot['slope_details'] = slope_details
-            
-            return snapshot
+                total_bits=self.total_bits,
+                volume=self.volume,
+                recent_bits=self.bits.recent_bits(15),
+            )
+    
+
+
+@dataclass
+class StreamState:
+    """
+    Point-in-time copy of one Bitstream, so snapshots can be built (and
+    scored in batches) without holding the stream or manager locks.
+    """
+    symbol: str
+    threshold: float
+    current_live_price: float
+    last_update_ms: int
+    upper_band: float
+    lower_band: float
+    current_stasis: int
+    direction: Optional[Direction]
+    signal_strength: Optional[SignalStrength]
+    stasis_info: Optional[StasisInfo]
+    total_bits: int
+    volume: float
+    recent_bits: List[int]
+    
+    def build_snapshot(self, live_price: Optional[float] = None, now_ms: Optional[int] = None) -> Dict:
+        """
+        Display state for one stream without merit scores (the refresh cycle
+        scores its whole batch at once). Durations are measured to `now_ms`,
+        one clock reading shared by every stream in a refresh cycle (defaults
+        to this stream's last event time).
+        """
+        if now_ms is None:
+            now_ms = self.last_update_ms
+        current_price = live_price if live_price is not None else self.current_live_price
+        
+        anchor_price = None
+        stasis_start_str = "—"
+        duration_seconds = 0
+        stasis_price_change_pct = None
+        
+        if self.stasis_info is not None:
+            anchor_price = self.stasis_info.start_price
+            stasis_start_str = self.stasis_info.get_start_date_str()
+            duration_seconds = self.stasis_info.get_duration(now_ms)
+            stasis_price_change_pct = self.stasis_info.get_price_change_pct(current_price)
+        
+        take_profit = None
+        stop_loss = None
+        risk_reward = None
+        distance_to_tp_pct = None
+        distance_to_sl_pct = None
+        
+        if self.direction is not None and self.current_stasis >= 2:
+            if self.direction == Direction.LONG:
+                take_profit = self.upper_band
+                stop_loss = self.lower_band
+                reward = take_profit - current_price
+                risk = current_price - stop_loss
+            else:
+                take_profit = self.lower_band
+                stop_loss = self.upper_band
+                reward = current_price - take_profit
+                risk = stop_loss - current_price
+            
+            if risk > 0 and reward > 0:
+                risk_reward = reward / risk
+            elif risk > 0 and reward <= 0:
+                risk_reward = 0.0
+            else:
+                risk_reward = None
+            
+            if current_price > 0:
+                distance_to_tp_pct = (abs(take_profit - current_price) / current_price) * 100
+                distance_to_sl_pct = (abs(stop_loss - current_price) / current_price) * 100
+        
+        week52_percentile = calculate_52week_percentile(current_price, self.symbol)
+        
+        # Build base snapshot
+        snapshot = {
+            'symbol': self.symbol,
+            'threshold': self.threshold,
+            'threshold_pct': self.threshold * 100,
+            'stasis': self.current_stasis,
+            'total_bits': self.total_bits,
+            'recent_bits': self.recent_bits,
+            'current_price': current_price,
+            'anchor_price': anchor_price,
+            'direction': self.direction.value if self.direction else None,
+            'signal_strength': self.signal_strength.value if self.signal_strength else None,
+            'is_tradable': (
+                self.current_stasis >= config.min_tradable_stasis and
+                self.direction is not None and
+                self.volume > 1.0
+            ),
+            'stasis_start_ms': self.stasis_info.start_ms if self.stasis_info is not None else None,
+            'stasis_start_str': stasis_start_str,
+            # Duration when the row was scored; display strings use the published clock
+            'duration_seconds': duration_seconds,
+            'stasis_price_change_pct': stasis_price_change_pct,
+            'take_profit': take_profit,
+            'stop_loss': stop_loss,
+            'risk_reward': risk_reward,
+            'distance_to_tp_pct': distance_to_tp_pct,
+            'distance_to_sl_pct': distance_to_sl_pct,
+            'week52_percentile': week52_percentile,
+            'volume': self.volume,
+        }
+        
+        return snapshot
 
 
 # ============================================================================
@@ -3234,12 +2278,19 @@ class Bitstream:
 
 class PolygonPriceFeed:
     def __init__(self):
+        engine_registry.claim('price_feed', self)
         self.lock = threading.Lock()
         self.current_prices: Dict[str, float] = {}
         self.is_running = False
         self.ws = None
         self.ws_thread = None
         self.message_count = 0
+        self.symbol_set = set(config.symbols)
+        
+        # Every aggregate as (symbol, close, exchange start epoch ms), in arrival order.
+        # Aggregate start time is the event time base, same as the REST bars' 't'.
+        self.pending_ticks: List[Tuple[str, float, int]] = []
+        self.tick_event = threading.Event()
         
         for symbol in config.symbols:
             self.current_prices[symbol] = None
@@ -3305,10 +2356,13 @@ class PolygonPriceFeed:
         elif msg.get('ev') == 'A':
             symbol = msg.get('sym', '')
             price = msg.get('c') or msg.get('vw')
-            if price and symbol in config.symbols:
+            if price and symbol in self.symbol_set:
+                event_ms = int(msg.get('s') or msg.get('e') or time.time() * 1000)
                 with self.lock:
                     self.current_prices[symbol] = float(price)
+                    self.pending_ticks.append((symbol, float(price), event_ms))
                     self.message_count += 1
+                self.tick_event.set()
     
     def _subscribe(self):
         if self.ws:
@@ -3325,6 +2379,14 @@ class PolygonPriceFeed:
         with self.lock:
             return {k: v for k, v in self.current_prices.items() if v is not None}
     
+    def drain_ticks(self, timeout: float) -> List[Tuple[str, float, int]]:
+        """Wait up to `timeout` for ticks, then take everything queued since the last drain."""
+        self.tick_event.wait(timeout)
+        with self.lock:
+            self.tick_event.clear()
+            ticks, self.pending_ticks = self.pending_ticks, []
+        return ticks
+    
     def get_status(self) -> Dict:
         with self.lock:
             connected = sum(1 for v in self.current_prices.values() if v is not None)
@@ -3335,7 +2397,715 @@ class PolygonPriceFeed:
             }
 
 
-price_feed = PolygonPriceFeed()
+price_feed = engine_registry.get_or_create('price_feed', PolygonPriceFeed)
+
+
+# ============================================================================
+# BITSTREAM CHECKPOINTS (COMPACT NPZ)
+# ============================================================================
+
+DIRECTION_CODES = [Direction.LONG, Direction.SHORT]
+STRENGTH_CODES = list(SignalStrength)
+
+
+def write_checkpoint(path: str, states: List[Dict]):
+    """
+    Write exported Bitstream states as columnar arrays: one row per stream,
+    plus every stream's bit history concatenated (bits packed 8 per byte).
+    """
+    histories = [state['bits'] for state in states]
+    stasis = [state['stasis_info'] or (0, 0.0, 0) for state in states]
+    
+    arrays = {
+        'saved_at_ms': np.array([to_epoch_ms(datetime.now())], dtype=np.int64),
+        'symbols': np.array([state['symbol'] for state in states]),
+        'thresholds': np.array([state['threshold'] for state in states], dtype=np.float64),
+        'initial_prices': np.array([state['initial_price'] for state in states], dtype=np.float64),
+        'volumes': np.array([state['volume'] for state in states], dtype=np.float64),
+        'reference_prices': np.array([state['reference_price'] for state in states], dtype=np.float64),
+        'live_prices': np.array([state['current_live_price'] for state in states], dtype=np.float64),
+        'last_update_ms': np.array([state['last_update_ms'] for state in states], dtype=np.int64),
+        'stasis': np.array([state['current_stasis'] for state in states], dtype=np.int32),
+        'last_bits': np.array([-1 if state['last_bit'] is None else state['last_bit'] for state in states], dtype=np.int8),
+        'directions': np.array([-1 if state['direction'] is None else DIRECTION_CODES.index(state['direction'])
+                                for state in states], dtype=np.int8),
+        'strengths': np.array([-1 if state['signal_strength'] is None else STRENGTH_CODES.index(state['signal_strength'])
+                               for state in states], dtype=np.int8),
+        'has_stasis_info': np.array([state['stasis_info'] is not None for state in states], dtype=bool),
+        'stasis_start_ms': np.array([info[0] for info in stasis], dtype=np.int64),
+        'stasis_start_prices': np.array([info[1] for info in stasis], dtype=np.float64),
+        'stasis_peaks': np.array([info[2] for info in stasis], dtype=np.int32),
+        'total_bits': np.array([state['total_bits'] for state in states], dtype=np.int64),
+        'bit_counts': np.array([len(bits) for bits, _, _ in histories], dtype=np.int64),
+        'history_bits': np.packbits(np.concatenate([bits for bits, _, _ in histories] or [np.empty(0, dtype=np.uint8)])),
+        'history_prices': np.concatenate([prices for _, prices, _ in histories] or [np.empty(0)]),
+        'history_ms': np.concatenate([ms for _, _, ms in histories] or [np.empty(0, dtype=np.int64)]),
+    }
+    
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_path, path)
+
+
+def read_checkpoint(path: str) -> List[Dict]:
+    """Inverse of write_checkpoint: a list of Bitstream.from_state() inputs."""
+    with np.load(path) as data:
+        c = {key: data[key] for key in data.files}
+    
+    bit_counts = c['bit_counts']
+    offsets = np.concatenate([[0], np.cumsum(bit_counts)])
+    history_bits = np.unpackbits(c['history_bits'], count=int(offsets[-1]))
+    history_prices = c['history_prices']
+    history_ms = c['history_ms']
+    
+    columns = {key: c[key].tolist() for key in c if key not in ('history_bits', 'history_prices', 'history_ms')}
+    
+    states = []
+    for i in range(len(bit_counts)):
+        lo, hi = int(offsets[i]), int(offsets[i + 1])
+        states.append({
+            'symbol': columns['symbols'][i],
+            'threshold': columns['thresholds'][i],
+            'initial_price': columns['initial_prices'][i],
+            'volume': columns['volumes'][i],
+            'reference_price': columns['reference_prices'][i],
+            'current_live_price': columns['live_prices'][i],
+            'last_update_ms': columns['last_update_ms'][i],
+            'current_stasis': columns['stasis'][i],
+            'last_bit': None if columns['last_bits'][i] < 0 else columns['last_bits'][i],
+            'direction': None if columns['directions'][i] < 0 else DIRECTION_CODES[columns['directions'][i]],
+            'signal_strength': None if columns['strengths'][i] < 0 else STRENGTH_CODES[columns['strengths'][i]],
+            'stasis_info': (
+                (columns['stasis_start_ms'][i], columns['stasis_start_prices'][i], columns['stasis_peaks'][i])
+                if columns['has_stasis_info'][i] else None
+            ),
+            'total_bits': columns['total_bits'][i],
+            'bits': (history_bits[lo:hi], history_prices[lo:hi], history_ms[lo:hi]),
+        })
+    
+    return states
+
+
+# ============================================================================
+# STREAM ENGINES (config.stream_engine)
+# ============================================================================
+
+class BitstreamSet:
+    """
+    Default stream engine ('streams'): one Bitstream object per
+    (symbol, threshold). Callers hold the manager lock.
+    """
+    def __init__(self):
+        self.streams: Dict[Tuple[str, float], Bitstream] = {}
+    
+    def __contains__(self, key: Tuple[str, float]) -> bool:
+        return key in self.streams
+    
+    def __len__(self) -> int:
+        return len(self.streams)
+    
+    def keys(self) -> List[Tuple[str, float]]:
+        return list(self.streams)
+    
+    def replay(self, symbol: str, initial_price: float, volume: float,
+               bar_times: np.ndarray, bar_closes: np.ndarray):
+        """Create the symbol's missing streams; restored ones only replay bars after their last update."""
+        replay_from = {}
+        for threshold in config.thresholds:
+            stream = self.streams.get((symbol, threshold))
+            if stream is None:
+                self.streams[(symbol, threshold)] = Bitstream(symbol, threshold, initial_price, volume)
+                replay_from[threshold] = 0
+            else:
+                replay_from[threshold] = int(np.searchsorted(
+                    bar_times, stream.last_update_ms, side='right'
+                ))
+        
+        Bitstream.process_prices_multi(
+            [self.streams[(symbol, threshold)] for threshold in replay_from],
+            bar_closes, bar_times, list(replay_from.values()),
+        )
+    
+    def apply_ticks(self, symbols: List[str], prices: np.ndarray, times: np.ndarray):
+        """Run (symbol, price, epoch ms) ticks, in arrival order, through all their symbols' thresholds."""
+        positions: Dict[str, List[int]] = {}
+        for i, symbol in enumerate(symbols):
+            positions.setdefault(symbol, []).append(i)
+        for symbol, index in positions.items():
+            streams = [self.streams[(symbol, t)] for t in config.thresholds if (symbol, t) in self.streams]
+            Bitstream.process_prices_multi(streams, prices[index], times[index])
+    
+    def set_volumes(self, volumes: Dict[str, float]):
+        for (symbol, _), stream in self.streams.items():
+            stream.volume = volumes.get(symbol, 10.0)
+    
+    def tradable_count(self) -> int:
+        return sum(1 for stream in self.streams.values() if stream.is_tradable())
+    
+    def capture(self, key: Tuple[str, float]) -> 'StreamState':
+        return self.streams[key].capture()
+    
+    def copy(self) -> 'BitstreamSet':
+        """Shallow copy to export outside the manager lock (each stream still takes its own lock)."""
+        engine = BitstreamSet()
+        engine.streams = dict(self.streams)
+        return engine
+    
+    def export_states(self) -> List[Dict]:
+        return [stream.export_state() for stream in self.streams.values()]
+    
+    def load_states(self, states: List[Dict]):
+        for state in states:
+            self.streams[(state['symbol'], state['threshold'])] = Bitstream.from_state(state)
+
+
+class BitstreamBank:
+    """
+    Struct-of-arrays stream engine ('bank'): every (symbol, threshold)
+    stream is one row of contiguous NumPy arrays, so a batch of ticks moves
+    all the streams it touches in a few array operations per round (round r
+    is every symbol's r-th tick) instead of one Bitstream call per stream.
+    
+    Rows follow Bitstream's rules exactly and import/export the same state
+    dicts, so checkpoints are shared between the engines. Bit histories are
+    per-row rings in 2D arrays whose capacity doubles up to
+    BIT_HISTORY_MAXLEN. Long runs (backfill bars, a symbol with many ticks
+    in one batch) are replayed through the Bitstream batch kernel instead.
+    Callers hold the manager lock.
+    """
+    COLUMNS = {
+        'threshold': np.float64,
+        'initial_price': np.float64,
+        'volume': np.float64,
+        'reference_price': np.float64,
+        'band_width': np.float64,
+        'upper_band': np.float64,
+        'lower_band': np.float64,
+        'current_live_price': np.float64,
+        'last_update_ms': np.int64,
+        'current_stasis': np.int64,
+        'last_bit': np.int8,             # -1 before the first bit
+        'direction': np.int8,            # index into DIRECTION_CODES, -1 for none
+        'signal_strength': np.int8,      # index into STRENGTH_CODES, -1 for none
+        'has_stasis_info': bool,
+        'stasis_start_ms': np.int64,
+        'stasis_start_price': np.float64,
+        'stasis_peak': np.int64,
+        'total_bits': np.int64,
+        'history_start': np.int64,
+        'history_len': np.int64,
+    }
+    HISTORY = {'history_bits': np.uint8, 'history_prices': np.float64, 'history_ms': np.int64}
+    # A symbol with at least this many ticks in one batch goes through the Bitstream kernel
+    KERNEL_MIN_TICKS = 64
+    
+    def __init__(self):
+        self.size = 0
+        self.row_of: Dict[Tuple[str, float], int] = {}
+        self.keys_by_row: List[Tuple[str, float]] = []
+        # Rows of each symbol: symbol_rows[symbol_id] padded with -1
+        self.symbol_id: Dict[str, int] = {}
+        self.symbol_rows = np.full((0, 0), -1, dtype=np.int64)
+        for name, dtype in self.COLUMNS.items():
+            setattr(self, name, np.zeros(0, dtype=dtype))
+        self.history_capacity = 0
+        for name, dtype in self.HISTORY.items():
+            setattr(self, name, np.zeros((0, 0), dtype=dtype))
+    
+    def __contains__(self, key: Tuple[str, float]) -> bool:
+        return key in self.row_of
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def keys(self) -> List[Tuple[str, float]]:
+        return list(self.keys_by_row)
+    
+    # ---- rows and history storage ----
+    
+    def _add_row(self, key: Tuple[str, float]) -> int:
+        if self.size == len(self.threshold):
+            capacity = max(2 * self.size, 1024)
+            for name in self.COLUMNS:
+                column = getattr(self, name)
+                setattr(self, name, np.concatenate([column, np.zeros(capacity - len(column), dtype=column.dtype)]))
+            for name in self.HISTORY:
+                history = getattr(self, name)
+                grown = np.zeros((capacity, self.history_capacity), dtype=history.dtype)
+                grown[:len(history)] = history
+                setattr(self, name, grown)
+        
+        row = self.row_of[key] = self.size
+        self.keys_by_row.append(key)
+        self.size += 1
+        
+        symbol_id = self.symbol_id.setdefault(key[0], len(self.symbol_id))
+        if symbol_id == len(self.symbol_rows):
+            grown = np.full((max(2 * len(self.symbol_rows), 256), self.symbol_rows.shape[1]), -1, dtype=np.int64)
+            grown[:len(self.symbol_rows)] = self.symbol_rows
+            self.symbol_rows = grown
+        free = np.flatnonzero(self.symbol_rows[symbol_id] < 0)
+        if free.size == 0:
+            self.symbol_rows = np.hstack([self.symbol_rows, np.full((len(self.symbol_rows), 1), -1, dtype=np.int64)])
+            free = [self.symbol_rows.shape[1] - 1]
+        self.symbol_rows[symbol_id, free[0]] = row
+        return row
+    
+    def _grow_history(self, needed: int):
+        """Widen every row's ring to hold `needed` entries, unrolling each ring to start at 0."""
+        capacity = self.history_capacity
+        while capacity < needed:
+            capacity = min(max(capacity * 2, 16), BIT_HISTORY_MAXLEN)
+        
+        if self.history_capacity > 0:
+            order = (self.history_start[:, None] + np.arange(self.history_capacity)) % self.history_capacity
+        for name in self.HISTORY:
+            history = getattr(self, name)
+            grown = np.zeros((len(history), capacity), dtype=history.dtype)
+            if self.history_capacity > 0:
+                grown[:, :self.history_capacity] = np.take_along_axis(history, order, axis=1)
+            setattr(self, name, grown)
+        self.history_start[:] = 0
+        self.history_capacity = capacity
+    
+    def _slots(self, rows: np.ndarray, index: int) -> np.ndarray:
+        """Ring slots of history entry `index` (negative counts from the newest) for each row."""
+        return (self.history_start[rows] + self.history_len[rows] + index) % self.history_capacity
+    
+    def _append_history(self, rows: np.ndarray, bits: np.ndarray, prices: np.ndarray,
+                        times: np.ndarray, counts: np.ndarray):
+        """Append counts[i] copies of one entry to each row; the oldest drop off past BIT_HISTORY_MAXLEN."""
+        counts = np.minimum(counts, BIT_HISTORY_MAXLEN)
+        needed = min(int((self.history_len[rows] + counts).max()), BIT_HISTORY_MAXLEN)
+        if needed > self.history_capacity:
+            self._grow_history(needed)
+        capacity = self.history_capacity
+        
+        repeated = np.repeat(rows, counts)
+        copy_index = np.arange(len(repeated)) - np.repeat(np.cumsum(counts) - counts, counts)
+        slots = (self.history_start[repeated] + self.history_len[repeated] + copy_index) % capacity
+        self.history_bits[repeated, slots] = np.repeat(bits, counts)
+        self.history_prices[repeated, slots] = np.repeat(prices, counts)
+        self.history_ms[repeated, slots] = np.repeat(times, counts)
+        
+        total = self.history_len[rows] + counts
+        self.history_start[rows] = (self.history_start[rows] + np.maximum(total - capacity, 0)) % capacity
+        self.history_len[rows] = np.minimum(total, capacity)
+    
+    def _history(self, row: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(uint8 bits, float64 prices, int64 epoch ms) of one row, oldest first."""
+        n = int(self.history_len[row])
+        if n == 0:
+            return np.empty(0, dtype=np.uint8), np.empty(0, dtype=np.float64), np.empty(0, dtype=np.int64)
+        order = (int(self.history_start[row]) + np.arange(n)) % self.history_capacity
+        return (self.history_bits[row, order], self.history_prices[row, order], self.history_ms[row, order])
+    
+    # ---- vectorized Bitstream rules ----
+    
+    def _update_bands(self, rows: np.ndarray):
+        self.band_width[rows] = self.threshold[rows] * self.reference_price[rows]
+        self.upper_band[rows] = self.reference_price[rows] + self.band_width[rows]
+        self.lower_band[rows] = self.reference_price[rows] - self.band_width[rows]
+    
+    def _step(self, rows: np.ndarray, prices: np.ndarray, times: np.ndarray):
+        """Bitstream.process_price for one (price, time) per row; rows are distinct."""
+        self.current_live_price[rows] = prices
+        self.last_update_ms[rows] = times
+        
+        exits = ((prices <= self.lower_band[rows]) | (prices >= self.upper_band[rows])) & (self.band_width[rows] > 0)
+        rows, prices, times = rows[exits], prices[exits], times[exits]
+        if rows.size == 0:
+            return
+        
+        x = np.trunc((prices - self.reference_price[rows]) / self.band_width[rows]).astype(np.int64)
+        moved = x != 0
+        rows, prices, times, x = rows[moved], prices[moved], times[moved], x[moved]
+        if rows.size == 0:
+            return
+        
+        counts = np.abs(x)
+        self._append_history(rows, (x > 0).astype(np.uint8), prices, times, counts)
+        self.total_bits[rows] += counts
+        self.reference_price[rows] = prices
+        self._update_bands(rows)
+        self._update_stasis(rows, counts)
+    
+    def _update_stasis(self, rows: np.ndarray, new_bits: np.ndarray):
+        """Bitstream._update_stasis for rows that just appended new_bits[i] bits."""
+        n = self.history_len[rows]
+        last_bit = self.history_bits[rows, self._slots(rows, -1)].astype(np.int64)
+        prev_bit = self.history_bits[rows, self._slots(rows, -2)].astype(np.int64)
+        prev_stasis = self.current_stasis[rows]
+        
+        short = n < 2
+        alternating = (new_bits == 1) & (prev_bit != last_bit)
+        stasis = np.where(short, n, np.where(alternating, np.minimum(prev_stasis + 1, n), 1))
+        
+        # Stasis info is only touched once the history holds two bits
+        started = ~short & (prev_stasis < 2) & (stasis >= 2)
+        extended = ~short & ~started & (stasis >= 2) & self.has_stasis_info[rows]
+        ended = ~short & (prev_stasis >= 2) & (stasis < 2)
+        
+        start_rows = rows[started]
+        start_slots = self._slots(start_rows, -2)
+        self.has_stasis_info[start_rows] = True
+        self.stasis_start_ms[start_rows] = self.history_ms[start_rows, start_slots]
+        self.stasis_start_price[start_rows] = self.history_prices[start_rows, start_slots]
+        self.stasis_peak[start_rows] = stasis[started]
+        self.stasis_peak[rows[extended]] = np.maximum(self.stasis_peak[rows[extended]], stasis[extended])
+        self.has_stasis_info[rows[ended]] = False
+        
+        self.current_stasis[rows] = stasis
+        self.last_bit[rows] = last_bit
+        in_stasis = stasis >= 2
+        self.direction[rows] = np.where(
+            in_stasis, np.where(last_bit == 0, DIRECTION_CODES.index(Direction.LONG), DIRECTION_CODES.index(Direction.SHORT)), -1
+        )
+        self.signal_strength[rows] = np.select(
+            [in_stasis & (stasis >= 10), in_stasis & (stasis >= 7), in_stasis & (stasis >= 5), in_stasis & (stasis >= 3)],
+            [STRENGTH_CODES.index(SignalStrength.VERY_STRONG), STRENGTH_CODES.index(SignalStrength.STRONG),
+             STRENGTH_CODES.index(SignalStrength.MODERATE), STRENGTH_CODES.index(SignalStrength.WEAK)],
+            -1,
+        )
+    
+    # ---- engine interface (same as BitstreamSet) ----
+    
+    def replay(self, symbol: str, initial_price: float, volume: float,
+               bar_times: np.ndarray, bar_closes: np.ndarray):
+        """Create the symbol's missing streams; restored ones only replay bars after their last update."""
+        streams, starts = [], []
+        for threshold in config.thresholds:
+            row = self.row_of.get((symbol, threshold))
+            if row is None:
+                streams.append(Bitstream(symbol, threshold, initial_price, volume))
+                starts.append(0)
+            else:
+                streams.append(Bitstream.from_state(self._export_row(row)))
+                starts.append(int(np.searchsorted(bar_times, self.last_update_ms[row], side='right')))
+        
+        Bitstream.process_prices_multi(streams, bar_closes, bar_times, starts)
+        self.load_states([stream.export_state() for stream in streams])
+    
+    def apply_ticks(self, symbols: List[str], prices: np.ndarray, times: np.ndarray):
+        """Run (symbol, price, epoch ms) ticks, in arrival order, through all their symbols' thresholds."""
+        ids = np.fromiter((self.symbol_id.get(symbol, -1) for symbol in symbols), dtype=np.int64, count=len(symbols))
+        known = ids >= 0
+        ids, prices, times = ids[known], prices[known], times[known]
+        if ids.size == 0:
+            return
+        
+        # Position of each tick in its symbol's run; round r is every symbol's r-th tick
+        order = np.argsort(ids, kind='stable')
+        by_symbol = ids[order]
+        position = np.empty_like(order)
+        position[order] = np.arange(len(order)) - np.searchsorted(by_symbol, by_symbol)
+        
+        run_length = np.bincount(ids)[ids]
+        for symbol_id in np.unique(ids[run_length >= self.KERNEL_MIN_TICKS]).tolist():
+            own = ids == symbol_id
+            self._replay_rows(self.symbol_rows[symbol_id], prices[own], times[own])
+        short = run_length < self.KERNEL_MIN_TICKS
+        if not short.any():
+            return
+        ids, prices, times, position = ids[short], prices[short], times[short], position[short]
+        
+        # One entry per (tick, stream of its symbol)
+        width = self.symbol_rows.shape[1]
+        tick_rows = self.symbol_rows[ids].ravel()
+        present = tick_rows >= 0
+        tick_rows = tick_rows[present]
+        tick_prices = np.repeat(prices, width)[present]
+        tick_times = np.repeat(times, width)[present]
+        tick_round = np.repeat(position, width)[present]
+        
+        order = np.argsort(tick_round, kind='stable')
+        bounds = np.searchsorted(tick_round[order], np.arange(int(position.max()) + 2))
+        for lo, hi in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+            selected = order[lo:hi]
+            self._step(tick_rows[selected], tick_prices[selected], tick_times[selected])
+    
+    def _replay_rows(self, rows: np.ndarray, prices: np.ndarray, times: np.ndarray):
+        streams = [Bitstream.from_state(self._export_row(row)) for row in rows[rows >= 0].tolist()]
+        Bitstream.process_prices_multi(streams, prices, times)
+        self.load_states([stream.export_state() for stream in streams])
+    
+    def set_volumes(self, volumes: Dict[str, float]):
+        self.volume[:self.size] = [volumes.get(symbol, 10.0) for symbol, _ in self.keys_by_row]
+    
+    def tradable_count(self) -> int:
+        n = self.size
+        return int(np.count_nonzero(
+            (self.current_stasis[:n] >= config.min_tradable_stasis) &
+            (self.direction[:n] >= 0) &
+            (self.volume[:n] > 1.0)
+        ))
+    
+    def capture(self, key: Tuple[str, float]) -> 'StreamState':
+        row = self.row_of[key]
+        direction = int(self.direction[row])
+        strength = int(self.signal_strength[row])
+        bits, _, _ = self._history(row)
+        return StreamState(
+            symbol=key[0],
+            threshold=key[1],
+            current_live_price=float(self.current_live_price[row]),
+            last_update_ms=int(self.last_update_ms[row]),
+            upper_band=float(self.upper_band[row]),
+            lower_band=float(self.lower_band[row]),
+            current_stasis=int(self.current_stasis[row]),
+            direction=DIRECTION_CODES[direction] if direction >= 0 else None,
+            signal_strength=STRENGTH_CODES[strength] if strength >= 0 else None,
+            stasis_info=(
+                StasisInfo(int(self.stasis_start_ms[row]), float(self.stasis_start_price[row]), int(self.stasis_peak[row]))
+                if self.has_stasis_info[row] else None
+            ),
+            total_bits=int(self.total_bits[row]),
+            volume=float(self.volume[row]),
+            recent_bits=bits[-15:].tolist(),
+        )
+    
+    def copy(self) -> 'BitstreamBank':
+        """Copy of the live rows, to export outside the manager lock."""
+        bank = BitstreamBank()
+        bank.size = self.size
+        bank.row_of = dict(self.row_of)
+        bank.keys_by_row = list(self.keys_by_row)
+        bank.symbol_id = dict(self.symbol_id)
+        bank.symbol_rows = self.symbol_rows.copy()
+        for name in self.COLUMNS:
+            setattr(bank, name, getattr(self, name)[:self.size].copy())
+        bank.history_capacity = self.history_capacity
+        for name in self.HISTORY:
+            setattr(bank, name, getattr(self, name)[:self.size].copy())
+        return bank
+    
+    def _export_row(self, row: int) -> Dict:
+        """Bitstream.export_state() of one row."""
+        symbol, threshold = self.keys_by_row[row]
+        last_bit = int(self.last_bit[row])
+        direction = int(self.direction[row])
+        strength = int(self.signal_strength[row])
+        return {
+            'symbol': symbol,
+            'threshold': threshold,
+            'initial_price': float(self.initial_price[row]),
+            'volume': float(self.volume[row]),
+            'reference_price': float(self.reference_price[row]),
+            'current_live_price': float(self.current_live_price[row]),
+            'last_update_ms': int(self.last_update_ms[row]),
+            'current_stasis': int(self.current_stasis[row]),
+            'last_bit': last_bit if last_bit >= 0 else None,
+            'direction': DIRECTION_CODES[direction] if direction >= 0 else None,
+            'signal_strength': STRENGTH_CODES[strength] if strength >= 0 else None,
+            'stasis_info': (
+                (int(self.stasis_start_ms[row]), float(self.stasis_start_price[row]), int(self.stasis_peak[row]))
+                if self.has_stasis_info[row] else None
+            ),
+            'total_bits': int(self.total_bits[row]),
+            'bits': self._history(row),
+        }
+    
+    def export_states(self) -> List[Dict]:
+        return [self._export_row(row) for row in range(self.size)]
+    
+    def load_states(self, states: List[Dict]):
+        """Write exported Bitstream states into their rows (adding rows for new streams)."""
+        for state in states:
+            key = (state['symbol'], state['threshold'])
+            row = self.row_of.get(key)
+            if row is None:
+                row = self._add_row(key)
+            
+            self.threshold[row] = state['threshold']
+            self.initial_price[row] = state['initial_price']
+            self.volume[row] = state['volume']
+            self.reference_price[row] = state['reference_price']
+            self.current_live_price[row] = state['current_live_price']
+            self.last_update_ms[row] = state['last_update_ms']
+            self.current_stasis[row] = state['current_stasis']
+            self.last_bit[row] = -1 if state['last_bit'] is None else state['last_bit']
+            self.direction[row] = -1 if state['direction'] is None else DIRECTION_CODES.index(state['direction'])
+            self.signal_strength[row] = (
+                -1 if state['signal_strength'] is None else STRENGTH_CODES.index(state['signal_strength'])
+            )
+            self.has_stasis_info[row] = state['stasis_info'] is not None
+            if state['stasis_info'] is not None:
+                self.stasis_start_ms[row], self.stasis_start_price[row], self.stasis_peak[row] = state['stasis_info']
+            self.total_bits[row] = state['total_bits']
+            self._update_bands(np.array([row]))
+            
+            bits, prices, times = state['bits']
+            n = len(bits)
+            if n > self.history_capacity:
+                self._grow_history(n)
+            self.history_bits[row, :n] = bits
+            self.history_prices[row, :n] = prices
+            self.history_ms[row, :n] = times
+            self.history_start[row] = 0
+            self.history_len[row] = n
+
+
+STREAM_ENGINES = {'streams': BitstreamSet, 'bank': BitstreamBank}
+
+
+# ============================================================================
+# SIGNAL TABLE (COLUMNAR, MAINTAINED BY THE ENGINE)
+# ============================================================================
+
+class SignalTable:
+    """
+    Numeric columns of every stream's snapshot, one row per stream in the
+    same order as the published snapshot rows. The engine updates changed
+    rows in place; filters and sorts run on the arrays, and display strings
+    are only produced for the rows a request returns. `sms_due_ms` is the
+    event time at which a row's stasis duration next crosses an SMS edge,
+    so a moving clock only rescores the rows that reached one.
+    """
+    COLUMNS = {
+        'threshold': np.float64,
+        'stasis': np.int32,
+        'direction': np.int8,        # 0 = none, 1 = LONG, 2 = SHORT
+        'is_tradable': bool,
+        'w52': np.float64,           # -1 when unknown
+        'sms': np.int32,
+        'fms': np.int32,
+        'tms': np.int32,
+        'rev5': np.float64,          # -999 when unknown
+        'fcf5': np.float64,          # -999 when unknown
+        'stasis_start_ms': np.int64, # -1 when not in stasis
+        'sms_due_ms': np.int64,      # NO_DUE when no further duration edge
+    }
+    NO_DUE = np.iinfo(np.int64).max
+    DIRECTION_CODES = {None: 0, 'LONG': 1, 'SHORT': 2}
+    
+    def __init__(self):
+        self.size = 0
+        self.row_of: Dict[Tuple[str, float], int] = {}
+        # Engine side only (row -> key); published copies do not carry it
+        self.keys: List[Tuple[str, float]] = []
+        self.symbols = np.empty(0, dtype=object)
+        self.columns = {name: np.empty(0, dtype=dtype) for name, dtype in self.COLUMNS.items()}
+    
+    def _grow(self):
+        capacity = max(2 * len(self.symbols), 1024)
+        self.symbols = np.concatenate([self.symbols, np.empty(capacity - len(self.symbols), dtype=object)])
+        for name, column in self.columns.items():
+            self.columns[name] = np.concatenate([column, np.zeros(capacity - len(column), dtype=column.dtype)])
+    
+    def upsert(self, key: Tuple[str, float], snapshot: Mapping):
+        row = self.row_of.get(key)
+        if row is None:
+            if self.size == len(self.symbols):
+                self._grow()
+            row = self.row_of[key] = self.size
+            self.keys.append(key)
+            self.size += 1
+        
+        slopes = snapshot['slope_details']
+        w52 = snapshot['week52_percentile']
+        c = self.columns
+        self.symbols[row] = snapshot['symbol']
+        c['threshold'][row] = snapshot['threshold']
+        c['stasis'][row] = snapshot['stasis']
+        c['direction'][row] = self.DIRECTION_CODES[snapshot['direction']]
+        c['is_tradable'][row] = snapshot['is_tradable']
+        c['w52'][row] = w52 if w52 is not None else -1
+        c['sms'][row] = snapshot['stasis_merit_score']
+        c['fms'][row] = snapshot['fundamental_merit_score']
+        c['tms'][row] = snapshot['combined_merit_score']
+        c['rev5'][row] = slopes.get('Rev_5') if slopes.get('Rev_5') is not None else -999
+        c['fcf5'][row] = slopes.get('FCF_5') if slopes.get('FCF_5') is not None else -999
+        
+        start_ms = snapshot['stasis_start_ms']
+        c['stasis_start_ms'][row] = start_ms if start_ms is not None else -1
+        edge = bisect.bisect_right(DURATION_RULE.edges, snapshot['duration_seconds'])
+        if start_ms is None or edge == len(DURATION_RULE.edges):
+            c['sms_due_ms'][row] = self.NO_DUE
+        else:
+            c['sms_due_ms'][row] = start_ms + int(DURATION_RULE.edges[edge] * 1000)
+    
+    def due_for_rescore(self, now_ms: int) -> List[Tuple[str, float]]:
+        """Keys of rows whose stasis duration has crossed an SMS edge by now_ms."""
+        due = np.flatnonzero(self.columns['sms_due_ms'][:self.size] <= now_ms)
+        return [self.keys[row] for row in due.tolist()]
+    
+    def frozen(self) -> 'SignalTable':
+        """Read-only copy trimmed to the live rows, for publication."""
+        table = SignalTable()
+        table.size = self.size
+        table.symbols = self.symbols[:self.size].copy()
+        table.columns = {name: column[:self.size].copy() for name, column in self.columns.items()}
+        table.symbols.flags.writeable = False
+        for column in table.columns.values():
+            column.flags.writeable = False
+        return table
+    
+    SORTS = {
+        'tms': (('tms', False), ('fms', False)),
+        'fms': (('fms', False), ('tms', False)),
+        'sms': (('sms', False), ('tms', False)),
+        'rev': (('rev5', False), ('tms', False)),
+        'fcf': (('fcf5', False), ('tms', False)),
+        'stasis': (('stasis', False), ('tms', False)),
+        '52w': (('w52', True), ('tms', False)),
+    }
+    W52_RANGES = {'0-20': (0, 20), '20-40': (20, 40), '40-60': (40, 60)}
+    
+    def select(self, view_mode: str, symbol: str, min_stasis: Optional[int], direction: str,
+               fms_min: Optional[int], tms_min: Optional[int], w52: str, sort: str, limit: int) -> np.ndarray:
+        """Row indices matching the table filters, sorted, first `limit`."""
+        c = self.columns
+        mask = np.ones(self.size, dtype=bool)
+        if view_mode == 'tradable':
+            mask &= c['is_tradable']
+        if symbol != 'ALL':
+            mask &= self.symbols == symbol
+        if min_stasis and min_stasis > 0:
+            mask &= c['stasis'] >= min_stasis
+        if direction != 'ALL':
+            mask &= c['direction'] == self.DIRECTION_CODES.get(direction, -1)
+        if fms_min is not None and fms_min >= 0:
+            mask &= c['fms'] >= fms_min
+        if tms_min is not None and tms_min >= 0:
+            mask &= c['tms'] >= tms_min
+        if w52 in self.W52_RANGES:
+            lo, hi = self.W52_RANGES[w52]
+            mask &= (c['w52'] >= lo) & (c['w52'] <= hi)
+        
+        rows = np.flatnonzero(mask)
+        if sort in self.SORTS:
+            # lexsort is stable and takes the primary key last
+            keys = [c[name][rows] if ascending else -c[name][rows].astype(np.float64)
+                    for name, ascending in reversed(self.SORTS[sort])]
+            rows = rows[np.lexsort(keys)]
+        return rows[:limit]
+
+
+# ============================================================================
+# PUBLISHED SNAPSHOTS (IMMUTABLE, VERSIONED)
+# ============================================================================
+
+def freeze_snapshot(snapshot: Dict) -> Mapping:
+    """Read-only view of a snapshot (nested containers frozen too), safe to share between readers."""
+    frozen = dict(snapshot)
+    frozen['recent_bits'] = tuple(frozen['recent_bits'])
+    frozen['slope_details'] = types.MappingProxyType(dict(frozen['slope_details']))
+    return types.MappingProxyType(frozen)
+
+
+@dataclass(frozen=True)
+class SnapshotSet:
+    """
+    One published generation of snapshots. Never mutated after publication;
+    `version` increases with every publication that changed anything, so
+    readers can cache work per version. table.row i describes rows[i].
+    """
+    version: int
+    clock_ms: int
+    rows: Tuple[Mapping, ...]
+    table: SignalTable = field(default_factory=SignalTable)
 
 
 # ============================================================================
@@ -3344,80 +3114,208 @@ price_feed = PolygonPriceFeed()
 
 class BitstreamManager:
     def __init__(self):
+        engine_registry.claim('manager', self)
         self.lock = threading.Lock()
-        self.streams: Dict[Tuple[str, float], Bitstream] = {}
+        # Stream engine chosen by config.stream_engine; only used under self.lock
+        self.streams = STREAM_ENGINES[config.stream_engine]()
         self.is_running = False
         
-        self.cached_data: List[Dict] = []
-        self.cache_lock = threading.Lock()
+        # Readers only ever see a complete SnapshotSet; publishing swaps the reference
+        self.published = SnapshotSet(version=0, clock_ms=0, rows=())
+        # Streams whose snapshot must be rebuilt on the next cache cycle
+        self.dirty: Set[Tuple[str, float]] = set()
+        self.snapshots: Dict[Tuple[str, float], Mapping] = {}
+        self.table = SignalTable()
+        self.snapshot_clock_ms: Optional[int] = None
         
         self.initialized = False
         self.backfill_complete = False
         self.backfill_progress = 0
+        self.symbol_status: Dict[str, str] = {}
+        # Set once the daily stage has delivered real volumes
+        self.volumes_loaded = False
+        # Live ticks for symbols still backfilling, applied once they go live
+        self.held_ticks: Dict[str, List[Tuple[float, int]]] = {}
+        # Latest exchange event time processed; the clock snapshots measure durations against
+        self.event_clock_ms = 0
+        # Longest time tick processing waited for self.lock, in ms
+        self.max_process_stall_ms = 0.0
+        
+        self.checkpoint_path = os.path.join(config.cache_dir, "bitstreams.npz")
     
     def backfill(self):
+        """
+        Fetch history for every symbol on the ingestion pool and bring each
+        symbol live as soon as its own bars arrive, instead of waiting for
+        the whole universe.
+        """
         print("\n" + "=" * 60)
         print("📜 BACKFILLING HISTORICAL DATA")
         print("=" * 60)
         
-        historical_data = {}
+        with self.lock:
+            for symbol in config.symbols:
+                if self.symbol_status.get(symbol) != 'live':
+                    self.symbol_status[symbol] = 'pending'
         
-        for i, symbol in enumerate(config.symbols):
-            bars = fetch_historical_bars(symbol, config.history_days)
-            if bars:
-                historical_data[symbol] = bars
-            
-            self.backfill_progress = int((i + 1) / len(config.symbols) * 100)
+        def on_result(symbol: str, bars: Optional[Tuple[np.ndarray, np.ndarray]], completed: int):
+            if bars is not None and len(bars[0]) > 0:
+                self._go_live(symbol, *bars)
+            else:
+                with self.lock:
+                    self.symbol_status[symbol] = 'no_data'
+                    self.held_ticks.pop(symbol, None)
             
-            if (i + 1) % 25 == 0:
-                print(f"   📊 {i + 1}/{len(config.symbols)} ({self.backfill_progress}%)")
+            self.backfill_progress = int(completed / len(config.symbols) * 100)
             
-            time.sleep(0.12)
+            if completed % 25 == 0:
+                print(f"   📊 {completed}/{len(config.symbols)} ({self.backfill_progress}%)")
         
-        print(f"\n✅ Historical data: {len(historical_data)} symbols")
+        ingestion.map(lambda s: sync_minute_bars(s, config.history_days), config.symbols, on_result)
         
-        with self.lock:
-            for symbol, bars in historical_data.items():
-                if not bars:
-                    continue
-                
-                initial_price = bars[0]['close']
-                volume = config.volumes.get(symbol, 10.0)
-                
-                for threshold in config.thresholds:
-                    key = (symbol, threshold)
-                    self.streams[key] = Bitstream(symbol, threshold, initial_price, volume)
-                    
-                    for bar in bars:
-                        self.streams[key].process_price(bar['close'], bar['timestamp'])
-        
-        self.initialized = True
         self.backfill_complete = True
         
-        tradable = sum(1 for s in self.streams.values() if s.is_tradable())
+        status = self.get_status()
+        with self.lock:
+            tradable = self.streams.tradable_count()
+        print(f"\n✅ Historical data: {status['live']} symbols")
         print(f"✅ Bitstreams: {len(self.streams)} | Tradable: {tradable}")
         print("=" * 60 + "\n")
+        
+        self.save_checkpoint()
+    
+    def _go_live(self, symbol: str, bar_times: np.ndarray, bar_closes: np.ndarray):
+        """Create (or catch up restored) streams for one symbol, then let it consume live prices."""
+        initial_price = float(bar_closes[0])
+        
+        with self.lock:
+            # Until the daily stage reports real volumes a stream is kept non-tradable
+            volume = config.volumes.get(symbol, 10.0) if self.volumes_loaded else 0.0
+            self.streams.replay(symbol, initial_price, volume, bar_times, bar_closes)
+            
+            self.event_clock_ms = max(self.event_clock_ms, int(bar_times[-1]))
+            self._mark_symbol_dirty(symbol)
+            
+            # Ticks that arrived during the backfill and start after the last stored minute bar
+            bars_end_ms = int(bar_times[-1]) + 60_000
+            held = [(price, ms) for price, ms in self.held_ticks.pop(symbol, []) if ms >= bars_end_ms]
+            if held:
+                self._apply_ticks([(symbol, price, ms) for price, ms in held])
+            
+            self.symbol_status[symbol] = 'live'
+            self.initialized = True
+    
+    def update_volumes(self, volumes: Dict[str, float]):
+        """Apply the daily stage's volumes; every stream is rebuilt (52W data arrives with them)."""
+        with self.lock:
+            self.volumes_loaded = True
+            self.streams.set_volumes(volumes)
+            self.dirty.update(self.streams.keys())
+    
+    def _mark_symbol_dirty(self, symbol: str):
+        """Caller holds self.lock."""
+        for threshold in config.thresholds:
+            if (symbol, threshold) in self.streams:
+                self.dirty.add((symbol, threshold))
+    
+    def mark_dirty(self, symbols: Iterable[str]):
+        """Rebuild these symbols' snapshots next cycle (e.g. after their fundamentals change)."""
+        with self.lock:
+            for symbol in symbols:
+                self._mark_symbol_dirty(symbol)
+    
+    def get_status(self) -> Dict:
+        """Per-symbol readiness: 'pending', 'restored', 'live' or 'no_data'."""
+        with self.lock:
+            symbols = dict(self.symbol_status)
+        counts = {state: 0 for state in ('pending', 'restored', 'live', 'no_data')}
+        for state in symbols.values():
+            counts[state] += 1
+        return {
+            'total': len(config.symbols),
+            'progress': self.backfill_progress,
+            'backfill_complete': self.backfill_complete,
+            **counts,
+            'max_process_stall_ms': round(self.max_process_stall_ms, 3),
+            'symbols': symbols,
+        }
+    
+    def save_checkpoint(self):
+        with self.lock:
+            if not len(self.streams):
+                return
+            streams = self.streams.copy()
+        write_checkpoint(self.checkpoint_path, streams.export_states())
+    
+    def restore_checkpoint(self) -> int:
+        """Rebuild streams from the last checkpoint. Returns how many were restored."""
+        try:
+            states = read_checkpoint(self.checkpoint_path)
+        except (OSError, ValueError, KeyError):
+            return 0
+        
+        symbols = set(config.symbols)
+        thresholds = set(config.thresholds)
+        restored = [
+            state for state in states
+            if state['symbol'] in symbols and state['threshold'] in thresholds
+        ]
+        
+        with self.lock:
+            self.streams.load_states(restored)
+            for state in restored:
+                self.symbol_status[state['symbol']] = 'restored'
+                self.event_clock_ms = max(self.event_clock_ms, state['last_update_ms'])
+                self.dirty.add((state['symbol'], state['threshold']))
+        
+        if restored:
+            self.initialized = True
+            print(f"♻️  Restored {len(restored)} bitstreams from checkpoint")
+        return len(restored)
     
     def start(self):
+        if self.is_running:
+            return
         self.is_running = True
         threading.Thread(target=self._process_loop, daemon=True).start()
         threading.Thread(target=self._cache_loop, daemon=True).start()
+        threading.Thread(target=self._checkpoint_loop, daemon=True).start()
     
     def _process_loop(self):
+        """
+        Drain the feed's tick queue in batches and run every aggregate, in
+        order, through the streams of the symbols that received data.
+        """
         while self.is_running:
-            time.sleep(0.1)
-            if not self.backfill_complete:
+            ticks = price_feed.drain_ticks(timeout=0.1)
+            if not ticks:
                 continue
             
-            prices = price_feed.get_all_prices()
-            timestamp = datetime.now()
+            by_symbol: Dict[str, List[Tuple[float, int]]] = {}
+            for symbol, price, event_ms in ticks:
+                by_symbol.setdefault(symbol, []).append((price, event_ms))
             
+            wait_start = time.perf_counter()
             with self.lock:
-                for symbol, price in prices.items():
-                    for threshold in config.thresholds:
-                        key = (symbol, threshold)
-                        if key in self.streams:
-                            self.streams[key].process_price(price, timestamp)
+                stall_ms = (time.perf_counter() - wait_start) * 1000
+                self.max_process_stall_ms = max(self.max_process_stall_ms, stall_ms)
+                live = set()
+                for symbol, symbol_ticks in by_symbol.items():
+                    self._mark_symbol_dirty(symbol)
+                    status = self.symbol_status.get(symbol)
+                    if status == 'live':
+                        live.add(symbol)
+                    elif status != 'no_data':
+                        self.held_ticks.setdefault(symbol, []).extend(symbol_ticks)
+                if live:
+                    self._apply_ticks([tick for tick in ticks if tick[0] in live])
+    
+    def _apply_ticks(self, ticks: List[Tuple[str, float, int]]):
+        """Run (symbol, price, epoch ms) ticks, in order, through the stream engine. Caller holds self.lock."""
+        prices = np.fromiter((price for _, price, _ in ticks), dtype=np.float64, count=len(ticks))
+        times = np.fromiter((ms for _, _, ms in ticks), dtype=np.int64, count=len(ticks))
+        self.streams.apply_ticks([symbol for symbol, _, _ in ticks], prices, times)
+        self.event_clock_ms = max(self.event_clock_ms, int(times.max()))
     
     def _cache_loop(self):
         while self.is_running:
@@ -3425,23 +3323,81 @@ class BitstreamManager:
             if not self.initialized:
                 continue
             
-            live_prices = price_feed.get_all_prices()
-            snapshots = []
-            
-            with self.lock:
-                for stream in self.streams.values():
-                    live_price = live_prices.get(stream.symbol)
-                    snapshots.append(stream.get_snapshot(live_price))
-            
-            with self.cache_lock:
-                self.cached_data = snapshots
+            self.refresh_snapshots()
+    
+    def refresh_snapshots(self):
+        """
+        Rebuild snapshots only for streams marked dirty since the last cycle.
+        The rest are carried over: durations are shown against the published
+        clock, and a moving clock only rescores the rows whose duration
+        crossed an SMS edge (SignalTable.due_for_rescore).
+        
+        Only capturing the dirty streams' state happens under self.lock (one
+        consistent engine epoch); snapshots are built from those copies into
+        the back buffer (self.snapshots) and published as a new immutable
+        SnapshotSet, so tick processing never waits on the build. Every row
+        rebuilt in a cycle is merit-scored in one vectorized batch.
+        """
+        live_prices = price_feed.get_all_prices()
+        
+        with self.lock:
+            now_ms = self.event_clock_ms
+            dirty, self.dirty = self.dirty, set()
+            captured = [(key, self.streams.capture(key)) for key in dirty if key in self.streams]
+        
+        rebuilt = {key: state.build_snapshot(live_prices.get(state.symbol), now_ms) for key, state in captured}
+        
+        clock_moved = now_ms != self.snapshot_clock_ms
+        if clock_moved:
+            for key in self.table.due_for_rescore(now_ms):
+                if key not in rebuilt:
+                    rebuilt[key] = self._with_duration(self.snapshots[key], now_ms)
+            self.snapshot_clock_ms = now_ms
+        
+        if rebuilt:
+            batch = list(rebuilt.values())
+            apply_merit_scores(batch)
+            for key, snapshot in zip(rebuilt, batch):
+                self.snapshots[key] = freeze_snapshot(snapshot)
+                self.table.upsert(key, self.snapshots[key])
+            self.published = SnapshotSet(
+                version=self.published.version + 1,
+                clock_ms=now_ms,
+                rows=tuple(self.snapshots.values()),
+                table=self.table.frozen(),
+            )
+        elif clock_moved:
+            # Only the display clock moved: the rows and table are shared as they are
+            self.published = SnapshotSet(
+                version=self.published.version + 1,
+                clock_ms=now_ms,
+                rows=self.published.rows,
+                table=self.published.table,
+            )
+    
+    @staticmethod
+    def _with_duration(snapshot: Mapping, now_ms: int) -> Dict:
+        """Copy of a snapshot with its duration measured to now_ms, to be rescored."""
+        refreshed = dict(snapshot)
+        refreshed['duration_seconds'] = StasisInfo(snapshot['stasis_start_ms'], snapshot['anchor_price']).get_duration(now_ms)
+        return refreshed
+    
+    def _checkpoint_loop(self):
+        while self.is_running:
+            time.sleep(config.checkpoint_interval)
+            if not self.backfill_complete:
+                continue
+            try:
+                self.save_checkpoint()
+            except Exception as e:
+                print(f"❌ Checkpoint error: {e}")
     
-    def get_data(self) -> List[Dict]:
-        with self.cache_lock:
-            return copy.deepcopy(self.cached_data)
+    def get_data(self) -> Tuple[Mapping, ...]:
+        """Latest published snapshots, shared read-only (no copy)."""
+        return self.published.rows
 
 
-manager = BitstreamManager()
+manager = engine_registry.get_or_create('manager', BitstreamManager)
 
 
 # ============================================================================
@@ -3467,61 +3423,49 @@ def format_slope(slope: Optional[float]) -> str:
     return f"{sign}{slope*100:.1f}%"
 
 
-def get_table_data() -> pd.DataFrame:
-    data = manager.get_data()
-    if not data:
-        return pd.DataFrame()
-    
-    rows = []
-    for d in data:
-        chg_str = "—"
-        if d['stasis_price_change_pct'] is not None:
-            sign = "+" if d['stasis_price_change_pct'] >= 0 else ""
-            chg_str = f"{sign}{d['stasis_price_change_pct']:.2f}%"
-        
-        w52_str = "—"
-        if d['week52_percentile'] is not None:
-            w52_str = f"{d['week52_percentile']:.0f}%"
-        
-        # Get slope details
-        slopes = d.get('slope_details', {})
-        
-        rows.append({
-            'Symbol': d['symbol'],
-            'Band': f"{d['threshold_pct']:.2f}%",
-            'Band_Val': d['threshold'],
-            'Stasis': d['stasis'],
-            'Dir': d['direction'] or '—',
-            'Str': d['signal_strength'] or '—',
-            'Current': f"${d['current_price']:.2f}" if d['current_price'] else "—",
-            'Current_Val': d['current_price'] or 0,
-            'Anchor': f"${d['anchor_price']:.2f}" if d['anchor_price'] else "—",
-            'TP': f"${d['take_profit']:.2f}" if d['take_profit'] else "—",
-            'SL': f"${d['stop_loss']:.2f}" if d['stop_loss'] else "—",
-            'R:R': format_rr(d['risk_reward']),
-            'RR_Val': d['risk_reward'] if d['risk_reward'] is not None else -1,
-            'Started': d['stasis_start_str'],
-            'Duration': d['stasis_duration_str'],
-            'Dur_Val': d['duration_seconds'],
-            'Chg': chg_str,
-            '52W': w52_str,
-            '52W_Val': d['week52_percentile'] if d['week52_percentile'] is not None else -1,
-            # Merit Scores
-            'SMS': d.get('stasis_merit_score', 0),
-            'FMS': d.get('fundamental_merit_score', 0),
-            'TMS': d.get('combined_merit_score', 0),
-            # Key Slopes for display
-            'Rev5': format_slope(slopes.get('Rev_5')),
-            'Rev5_Val': slopes.get('Rev_5') if slopes.get('Rev_5') is not None else -999,
-            'FCF5': format_slope(slopes.get('FCF_5')),
-            'FCF5_Val': slopes.get('FCF_5') if slopes.get('FCF_5') is not None else -999,
-            'ROE5': format_slope(slopes.get('ROE_5')),
-            'FCFY': f"{slopes.get('FCFY', 0)*100:.1f}%" if slopes.get('FCFY') else "—",
-            'Tradable': '✅' if d['is_tradable'] else '',
-            'Is_Tradable': d['is_tradable'],
-        })
-    
-    return pd.DataFrame(rows)
+def format_table_row(d: Mapping, now_ms: int) -> Dict:
+    """Display strings for one snapshot row of the main table, durations measured to now_ms."""
+    duration_str = "—"
+    if d['stasis_start_ms'] is not None:
+        duration_str = StasisInfo(d['stasis_start_ms'], d['anchor_price']).get_duration_str(now_ms)
+    
+    chg_str = "—"
+    if d['stasis_price_change_pct'] is not None:
+        sign = "+" if d['stasis_price_change_pct'] >= 0 else ""
+        chg_str = f"{sign}{d['stasis_price_change_pct']:.2f}%"
+    
+    w52_str = "—"
+    if d['week52_percentile'] is not None:
+        w52_str = f"{d['week52_percentile']:.0f}%"
+    
+    # Get slope details
+    slopes = d.get('slope_details', {})
+    
+    return {
+        'Symbol': d['symbol'],
+        'Band': f"{d['threshold_pct']:.2f}%",
+        'Stasis': d['stasis'],
+        'Dir': d['direction'] or '—',
+        'Str': d['signal_strength'] or '—',
+        'Current': f"${d['current_price']:.2f}" if d['current_price'] else "—",
+        'TP': f"${d['take_profit']:.2f}" if d['take_profit'] else "—",
+        'SL': f"${d['stop_loss']:.2f}" if d['stop_loss'] else "—",
+        'R:R': format_rr(d['risk_reward']),
+        'Started': d['stasis_start_str'],
+        'Duration': duration_str,
+        'Chg': chg_str,
+        '52W': w52_str,
+        # Merit Scores
+        'SMS': d.get('stasis_merit_score', 0),
+        'FMS': d.get('fundamental_merit_score', 0),
+        'TMS': d.get('combined_merit_score', 0),
+        # Key Slopes for display
+        'Rev5': format_slope(slopes.get('Rev_5')),
+        'FCF5': format_slope(slopes.get('FCF_5')),
+        'ROE5': format_slope(slopes.get('ROE_5')),
+        'FCFY': f"{slopes.get('FCFY', 0)*100:.1f}%" if slopes.get('FCFY') else "—",
+        'Tradable': '✅' if d['is_tradable'] else '',
+    }
 
 
 # ============================================================================
@@ -3561,6 +3505,13 @@ td, input, .form-control, pre, code {
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.CYBORG])
 app.title = "Beyond Price & Time"
 server = app.server
+print(f"🔗 Web app attached to engine {engine_registry.attach_app(server)}")
+
+
+@server.route('/engine')
+def engine_info():
+    """Which engine this web app is attached to, and its components."""
+    return jsonify(engine_registry.describe())
 
 app.index_string = '''
 <!DOCTYPE html>
@@ -3826,41 +3777,58 @@ def toggle_view(n1, n2, current):
     Input('refresh-interval', 'n_intervals')
 )
 def update_status(n):
-    if not manager.backfill_complete:
+    engine_status = manager.get_status()
+    if engine_status['live'] == 0 and not manager.initialized:
         return html.Span(f"⏳ LOADING... {manager.backfill_progress}%", className="text-warning")
     
     status = price_feed.get_status()
     fund_count = len(config.fundamental_slopes)
+    warming = "" if manager.backfill_complete else f" | ⏳ {engine_status['live']}/{engine_status['total']} READY"
     
     if status['connected'] == 0:
-        return html.Span(f"🔴 CONNECTING... | 📊 {fund_count} fundamentals", className="text-warning")
-    return html.Span(f"🟢 LIVE {status['connected']}/{status['total']} | 📊 {fund_count} fundamentals", 
+        return html.Span(f"🔴 CONNECTING...{warming} | 📊 {fund_count} fundamentals", className="text-warning")
+    return html.Span(f"🟢 LIVE {status['connected']}/{status['total']}{warming} | 📊 {fund_count} fundamentals", 
                     className="text-success data-font")
 
 
+_stats_cache = {'version': None, 'stats': None}
+
+
+def get_tradable_stats(published: SnapshotSet) -> Tuple[int, int, int, float, float, int]:
+    """Header stats for one published version; rescanned only when a new version is published."""
+    if _stats_cache['version'] == published.version:
+        return _stats_cache['stats']
+    
+    tradable = [d for d in published.rows if d['is_tradable']]
+    long_count = sum(1 for d in tradable if d['direction'] == 'LONG')
+    short_count = sum(1 for d in tradable if d['direction'] == 'SHORT')
+    
+    avg_fms = np.mean([d.get('fundamental_merit_score', 0) for d in tradable]) if tradable else 0
+    avg_tms = np.mean([d.get('combined_merit_score', 0) for d in tradable]) if tradable else 0
+    max_tms = max([d.get('combined_merit_score', 0) for d in tradable]) if tradable else 0
+    
+    stats = (len(tradable), long_count, short_count, avg_fms, avg_tms, max_tms)
+    _stats_cache['version'], _stats_cache['stats'] = published.version, stats
+    return stats
+
+
 @app.callback(
     Output('stats-display', 'children'),
     Input('refresh-interval', 'n_intervals')
 )
 def update_stats(n):
-    if not manager.backfill_complete:
+    if not manager.initialized:
         return html.Span(f"⏳ LOADING... {manager.backfill_progress}%", className="text-warning title-font")
     
-    data = manager.get_data()
-    if not data:
+    published = manager.published
+    if not published.rows:
         return html.Span("LOADING...", className="text-muted title-font")
     
-    tradable = [d for d in data if d['is_tradable']]
-    long_count = sum(1 for d in tradable if d['direction'] == 'LONG')
-    short_count = sum(1 for d in tradable if d['direction'] == 'SHORT')
-    
-    avg_fms = np.mean([d.get('fundamental_merit_score', 0) for d in tradable]) if tradable else 0
-    avg_tms = np.mean([d.get('combined_merit_score', 0) for d in tradable]) if tradable else 0
-    max_tms = max([d.get('combined_merit_score', 0) for d in tradable]) if tradable else 0
+    tradable_count, long_count, short_count, avg_fms, avg_tms, max_tms = get_tradable_stats(published)
     
     return html.Div([
         html.Span("🎯 TRADABLE: ", className="title-font", style={'fontSize': '11px'}),
-        html.Span(f"{len(tradable)}", className="data-font text-success", style={'fontSize': '12px', 'fontWeight': '600'}),
+        html.Span(f"{tradable_count}", className="data-font text-success", style={'fontSize': '12px', 'fontWeight': '600'}),
         html.Span("  📈 LONG: ", className="title-font ms-2", style={'fontSize': '11px'}),
         html.Span(f"{long_count}", className="data-font text-success", style={'fontSize': '12px'}),
         html.Span("  📉 SHORT: ", className="title-font ms-2", style={'fontSize': '11px'}),
@@ -3888,104 +3856,80 @@ def update_stats(n):
      Input('filter-sort', 'value')]
 )
 def update_table(n, view_mode, sym, stasis, direction, fms_min, tms_min, w52, rows, sort):
-    df = get_table_data()
-    if df.empty:
-        return []
-    
-    if view_mode == 'tradable':
-        df = df[df['Is_Tradable'] == True]
-    
-    if sym != 'ALL':
-        df = df[df['Symbol'] == sym]
-    if stasis and stasis > 0:
-        df = df[df['Stasis'] >= stasis]
-    if direction != 'ALL':
-        df = df[df['Dir'] == direction]
-    if fms_min is not None and fms_min >= 0:
-        df = df[df['FMS'] >= fms_min]
-    if tms_min is not None and tms_min >= 0:
-        df = df[df['TMS'] >= tms_min]
-    if w52 != 'ALL':
-        ranges = {'0-20': (0, 20), '20-40': (20, 40), '40-60': (40, 60)}
-        if w52 in ranges:
-            lo, hi = ranges[w52]
-            df = df[(df['52W_Val'] >= lo) & (df['52W_Val'] <= hi)]
-    
-    # Sorting
-    if sort == 'tms':
-        df = df.sort_values(['TMS', 'FMS'], ascending=[False, False])
-    elif sort == 'fms':
-        df = df.sort_values(['FMS', 'TMS'], ascending=[False, False])
-    elif sort == 'sms':
-        df = df.sort_values(['SMS', 'TMS'], ascending=[False, False])
-    elif sort == 'rev':
-        df = df.sort_values(['Rev5_Val', 'TMS'], ascending=[False, False])
-    elif sort == 'fcf':
-        df = df.sort_values(['FCF5_Val', 'TMS'], ascending=[False, False])
-    elif sort == 'stasis':
-        df = df.sort_values(['Stasis', 'TMS'], ascending=[False, False])
-    elif sort == '52w':
-        df = df.sort_values(['52W_Val', 'TMS'], ascending=[True, False], na_position='last')
-    
-    df = df.head(rows)
-    
-    drop_cols = ['Band_Val', 'Current_Val', 'RR_Val', 'Dur_Val', '52W_Val', 
-                 'Is_Tradable', 'Rev5_Val', 'FCF5_Val', 'Anchor']
-    df = df.drop(columns=drop_cols, errors='ignore')
-    
-    return df.to_dict('records')
+    published = manager.published
+    selected = published.table.select(view_mode, sym, stasis, direction, fms_min, tms_min, w52, sort, rows)
+    return [format_table_row(published.rows[i], published.clock_ms) for i in selected.tolist()]
 
 
 # ============================================================================
 # INITIALIZATION
 # ============================================================================
 
-_initialized = False
-_init_lock = threading.Lock()
+def load_daily_data():
+    """Fetch daily bars once for both 52-week and volume data."""
+    print("\n📅 FETCHING 52-WEEK + VOLUME DATA...")
+    if config.daily_data_mode == 'grouped':
+        config.week52_data, config.volumes = fetch_daily_data_grouped()
+    else:
+        config.week52_data, config.volumes = fetch_daily_data()
+    manager.update_volumes(config.volumes)
+    price_reference.update_from_week52(config.week52_data)
 
 
 def initialize_app():
-    global _initialized
-    
-    with _init_lock:
-        if _initialized:
+    with engine_registry.lock:
+        if engine_registry.started:
             return
-        
-        print("=" * 70)
-        print("  BEYOND PRICE AND TIME")
-        print("  WITH FUNDAMENTAL SLOPE MERIT SCORING")
-        print("  © 2026 Truth Communications LLC")
-        print("=" * 70)
-        
-        print(f"\n🎯 Stocks: {len(config.symbols)}")
-        
-        # Fetch 52-week data
-        print("\n📅 FETCHING 52-WEEK DATA...")
-        config.week52_data = fetch_52_week_data()
-        
-        # Fetch volume data
-        print("📊 FETCHING VOLUME DATA...")
-        config.volumes = fetch_volume_data()
-        
-        # Fetch fundamental data and calculate slopes
-        fetch_all_fundamental_data()
-        
-        # Backfill historical price data
-        manager.backfill()
-        
-        # Start price feed and manager
-        price_feed.start()
-        manager.start()
-        
-        print("\n✅ Initialization complete!")
-        print(f"📊 Fundamental slopes calculated for {len(config.fundamental_slopes)} symbols")
-        print("=" * 70)
-        
-        _initialized = True
+        engine_registry.started = True
+    
+    print("=" * 70)
+    print("  BEYOND PRICE AND TIME")
+    print("  WITH FUNDAMENTAL SLOPE MERIT SCORING")
+    print("  © 2026 Truth Communications LLC")
+    print("=" * 70)
+    
+    print(f"\n🎯 Stocks: {len(config.symbols)}")
+    
+    # Warm start: serve checkpointed streams while the gap is replayed
+    manager.restore_checkpoint()
+    
+    # Start price feed and manager first; each symbol goes live
+    # as soon as its own history has been replayed
+    price_feed.start()
+    manager.start()
+    
+    # 52-week + volume data loads alongside the backfill on the shared pool
+    daily_thread = threading.Thread(target=load_daily_data, daemon=True)
+    daily_thread.start()
+    
+    # Backfill historical price data
+    manager.backfill()
+    daily_thread.join()
+    
+    # Fetch fundamental data and calculate slopes; cache-loaded symbols
+    # need their snapshots rebuilt too, not just the refetched ones
+    fetch_all_fundamental_data()
+    manager.mark_dirty(config.fundamental_slopes)
+    
+    polygon_session.print_latency_report()
+    
+    print("\n✅ Initialization complete!")
+    print(f"📊 Fundamental slopes calculated for {len(config.fundamental_slopes)} symbols")
+    print("=" * 70)
 
 
-_init_thread = threading.Thread(target=initialize_app, daemon=True)
-_init_thread.start()
+def start_engine() -> threading.Thread:
+    """
+    Explicit engine entry point: runs initialize_app (REST fetches, websocket,
+    bitstream threads) in the background, once per process. Importing this
+    module never does; callers are the CLI below and the gunicorn post_fork
+    hook in gunicorn.conf.py. Later calls return the same thread.
+    """
+    with engine_registry.lock:
+        if engine_registry.init_thread is None:
+            engine_registry.init_thread = threading.Thread(target=initialize_app, daemon=True)
+            engine_registry.init_thread.start()
+        return engine_registry.init_thread
 
 
 # ============================================================================
@@ -3993,17 +3937,24 @@ _init_thread.start()
 # ============================================================================
 
 if __name__ == '__main__':
-    import os
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Beyond Price and Time dashboard")
+    parser.add_argument('--port', type=int, default=int(os.environ.get('PORT', 8050)))
+    parser.add_argument('--no-browser', action='store_true', help="don't open a browser tab")
+    args = parser.parse_args()
     
-    _init_thread.join()
+    # Serve right away; /engine and the status callbacks show progress
+    # while backfill, daily data and fundamentals load in the background
+    start_engine()
     
-    print("\n✅ Server: http://127.0.0.1:8050")
+    print(f"\n✅ Server: http://127.0.0.1:{args.port}")
     
-    threading.Thread(
-        target=lambda: (time.sleep(2), webbrowser.open('http://127.0.0.1:8050')), 
-        daemon=True
-    ).start()
+    if not args.no_browser:
+        threading.Thread(
+            target=lambda: (time.sleep(2), webbrowser.open(f'http://127.0.0.1:{args.port}')), 
+            daemon=True
+        ).start()
     
-    port = int(os.environ.get('PORT', 8050))
-    app.run(debug=False, host='0.0.0.0', port=port)
+    app.run(debug=False, host='0.0.0.0', port=args.port)
 
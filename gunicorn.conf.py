@@ -0,0 +1,14 @@
+"""
+Gunicorn configuration.
+
+Importing app only builds the Dash server; the engine (REST backfill,
+websocket feed, bitstream threads) is started explicitly here, inside the
+worker after fork, so the threads belong to the process that serves requests.
+"""
+
+
+def post_fork(server, worker):
+    import app
+    
+    app.start_engine()
+    server.log.info("Engine %s started in worker %s", app.engine_registry.engine_id, worker.pid)
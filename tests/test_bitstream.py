@@ -0,0 +1,81 @@
+"""
+The batch kernel (process_prices / process_prices_multi) must leave a
+Bitstream in exactly the state the scalar process_price path does.
+"""
+
+import numpy as np
+import pytest
+
+from app import Bitstream
+
+THRESHOLDS = [0.000625, 0.00125, 0.0025, 0.005, 0.01]
+
+
+def random_walk(seed: int, n: int = 3000):
+    rng = np.random.default_rng(seed)
+    steps = rng.normal(0.0, 0.002, n)
+    # Occasional gaps large enough to cross several bands in one bar
+    jumps = rng.random(n) < 0.01
+    steps[jumps] += rng.normal(0.0, 0.03, int(jumps.sum()))
+    prices = 100.0 * np.exp(np.cumsum(steps))
+    timestamps = 1_700_000_000_000 + 60_000 * np.arange(n, dtype=np.int64)
+    return prices, timestamps
+
+
+def scalar_replay(threshold: float, prices: np.ndarray, timestamps: np.ndarray) -> Bitstream:
+    stream = Bitstream('TEST', threshold, float(prices[0]), 5.0)
+    for price, ms in zip(prices.tolist(), timestamps.tolist()):
+        stream.process_price(price, ms)
+    return stream
+
+
+def assert_same_state(a: Bitstream, b: Bitstream):
+    sa, sb = a.export_state(), b.export_state()
+    bits_a, bits_b = sa.pop('bits'), sb.pop('bits')
+    assert sa == sb
+    for col_a, col_b in zip(bits_a, bits_b):
+        assert col_a.dtype == col_b.dtype
+        assert np.array_equal(col_a, col_b)
+
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('threshold', THRESHOLDS)
+def test_process_prices_matches_scalar(seed, threshold):
+    prices, timestamps = random_walk(seed)
+    expected = scalar_replay(threshold, prices, timestamps)
+    
+    stream = Bitstream('TEST', threshold, float(prices[0]), 5.0)
+    generated = stream.process_prices(prices, timestamps)
+    
+    assert generated == expected.total_bits
+    assert_same_state(stream, expected)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_process_prices_multi_matches_scalar(seed):
+    prices, timestamps = random_walk(seed)
+    starts = [0, 1, 17, 500, len(prices) - 1]
+    
+    streams = [Bitstream('TEST', t, float(prices[s]), 5.0) for t, s in zip(THRESHOLDS, starts)]
+    generated = Bitstream.process_prices_multi(streams, prices, timestamps, starts)
+    
+    expected = [scalar_replay(t, prices[s:], timestamps[s:]) for t, s in zip(THRESHOLDS, starts)]
+    assert generated == sum(e.total_bits for e in expected)
+    for stream, exp in zip(streams, expected):
+        assert_same_state(stream, exp)
+
+
+def test_process_prices_continues_scalar_state():
+    prices, timestamps = random_walk(7)
+    expected = scalar_replay(0.0025, prices, timestamps)
+    
+    stream = scalar_replay(0.0025, prices[:1000], timestamps[:1000])
+    stream.process_prices(prices[1000:], timestamps[1000:])
+    assert_same_state(stream, expected)
+
+
+def test_process_prices_empty():
+    stream = Bitstream('TEST', 0.0025, 100.0, 5.0)
+    before = stream.export_state()
+    assert stream.process_prices(np.empty(0), np.empty(0, dtype=np.int64)) == 0
+    assert stream.export_state()['last_update_ms'] == before['last_update_ms']
@@ -0,0 +1,149 @@
+"""
+BitstreamBank (config.stream_engine = 'bank') must keep every stream in
+exactly the state the per-object BitstreamSet engine does.
+"""
+
+import numpy as np
+import pytest
+
+import app
+from app import BitstreamBank, BitstreamSet, read_checkpoint, write_checkpoint
+
+THRESHOLDS = [0.000625, 0.00125, 0.0025, 0.005]
+SYMBOLS = ['AAA', 'BBB', 'CCC', 'DDD', 'EEE']
+
+
+@pytest.fixture(autouse=True)
+def small_thresholds(monkeypatch):
+    monkeypatch.setattr(app.config, 'thresholds', THRESHOLDS)
+
+
+def random_walk(seed: int, n: int):
+    rng = np.random.default_rng(seed)
+    # Mean-reverting log price, so alternating runs (stasis) build up
+    noise = rng.normal(0.0, 0.002, n)
+    log_price = np.zeros(n)
+    for i in range(1, n):
+        log_price[i] = 0.9 * log_price[i - 1] + noise[i]
+    # Occasional gaps large enough to cross several bands in one tick
+    jumps = rng.random(n) < 0.01
+    log_price[jumps] += rng.normal(0.0, 0.03, int(jumps.sum()))
+    # A flat zigzag one band wide at the smallest threshold: stasis past the history length
+    log_price[400:1100] = log_price[399] + 0.0009 * (np.arange(700) % 2)
+    prices = 50.0 * (seed + 1) * np.exp(log_price)
+    timestamps = 1_700_000_000_000 + 1_000 * np.arange(n, dtype=np.int64)
+    return prices, timestamps
+
+
+def assert_same_engines(bank: BitstreamBank, streams: BitstreamSet):
+    assert sorted(bank.keys()) == sorted(streams.keys())
+    expected = {(s['symbol'], s['threshold']): s for s in streams.export_states()}
+    for state in bank.export_states():
+        key = (state['symbol'], state['threshold'])
+        other = dict(expected[key])
+        state = dict(state)
+        bits, other_bits = state.pop('bits'), other.pop('bits')
+        assert state == other, key
+        for col, other_col in zip(bits, other_bits):
+            assert col.dtype == other_col.dtype
+            assert np.array_equal(col, other_col)
+        assert bank.capture(key) == streams.capture(key)
+    assert bank.tradable_count() == streams.tradable_count()
+
+
+def apply_batch(engines, batch):
+    """Apply {symbol: (prices, times)} to every engine, symbols' ticks interleaved in arrival order."""
+    ticks = sorted(
+        ((position, symbol, price, ms)
+         for symbol, (prices, times) in batch.items()
+         for position, (price, ms) in enumerate(zip(prices.tolist(), times.tolist()))),
+        key=lambda tick: tick[0],
+    )
+    symbols = [symbol for _, symbol, _, _ in ticks]
+    prices = np.array([price for _, _, price, _ in ticks], dtype=np.float64)
+    times = np.array([ms for _, _, _, ms in ticks], dtype=np.int64)
+    for engine in engines:
+        engine.apply_ticks(symbols, prices, times)
+
+
+def feed_both(engines, walks, rng, batches: int):
+    """
+    Feed every engine the same batches (a random subset of symbols, 1-3
+    ticks each). Returns the highest stasis the first engine reached.
+    """
+    cursor = {symbol: 300 for symbol in walks}
+    peak = 0
+    for _ in range(batches):
+        batch = {}
+        for symbol in rng.choice(SYMBOLS, size=rng.integers(1, len(SYMBOLS) + 1), replace=False):
+            prices, times = walks[symbol]
+            lo = cursor[symbol]
+            hi = min(lo + int(rng.integers(1, 4)), len(prices))
+            if lo < hi:
+                batch[symbol] = (prices[lo:hi], times[lo:hi])
+                cursor[symbol] = hi
+        apply_batch(engines, batch)
+        peak = max(peak, max(engines[0].capture(key).current_stasis for key in engines[0].keys()))
+    return peak
+
+
+def backfilled_engines(walks):
+    bank, streams = BitstreamBank(), BitstreamSet()
+    for engine in (bank, streams):
+        for symbol, (prices, times) in walks.items():
+            engine.replay(symbol, float(prices[0]), 5.0, times[:300], prices[:300])
+    return bank, streams
+
+
+def test_ticks_match_per_object_engine():
+    walks = {symbol: random_walk(seed, 2000) for seed, symbol in enumerate(SYMBOLS)}
+    bank, streams = backfilled_engines(walks)
+    assert_same_engines(bank, streams)
+
+    peak = feed_both((bank, streams), walks, np.random.default_rng(0), batches=900)
+    assert_same_engines(bank, streams)
+    assert peak == app.BIT_HISTORY_MAXLEN
+
+
+def test_long_runs_and_history_wrap():
+    walks = {symbol: random_walk(seed, 6000) for seed, symbol in enumerate(SYMBOLS)}
+    bank, streams = backfilled_engines(walks)
+
+    # Above KERNEL_MIN_TICKS for one symbol, single ticks for the rest
+    batch = {'AAA': (walks['AAA'][0][300:3000], walks['AAA'][1][300:3000])}
+    batch.update({symbol: (walks[symbol][0][300:301], walks[symbol][1][300:301]) for symbol in SYMBOLS[1:]})
+    apply_batch((bank, streams), batch)
+    assert_same_engines(bank, streams)
+    assert bank.history_capacity == app.BIT_HISTORY_MAXLEN
+
+    for start in range(301, 2000, 2):
+        batch = {symbol: (walks[symbol][0][start:start + 2], walks[symbol][1][start:start + 2])
+                 for symbol in SYMBOLS[1:]}
+        apply_batch((bank, streams), batch)
+    assert_same_engines(bank, streams)
+
+
+def test_checkpoint_and_catch_up_across_engines(tmp_path):
+    walks = {symbol: random_walk(seed, 3000) for seed, symbol in enumerate(SYMBOLS)}
+    bank, streams = backfilled_engines(walks)
+    feed_both((bank, streams), walks, np.random.default_rng(1), batches=200)
+    # Ticks for a symbol with no streams are ignored
+    apply_batch((bank, streams), {'ZZZ': (np.array([10.0]), np.array([1_700_000_000_000]))})
+
+    path = str(tmp_path / "bitstreams.npz")
+    write_checkpoint(path, bank.copy().export_states())
+    restored_bank, restored_streams = BitstreamBank(), BitstreamSet()
+    restored_bank.load_states(read_checkpoint(path))
+    restored_streams.load_states(read_checkpoint(path))
+    assert_same_engines(restored_bank, streams)
+    assert_same_engines(restored_bank, restored_streams)
+
+    # Restored streams only replay the bars after their own last update
+    for engine in (restored_bank, restored_streams):
+        for symbol, (prices, times) in walks.items():
+            engine.replay(symbol, float(prices[0]), 5.0, times, prices)
+    assert_same_engines(restored_bank, restored_streams)
+
+    restored_bank.set_volumes({'AAA': 0.5})
+    restored_streams.set_volumes({'AAA': 0.5})
+    assert_same_engines(restored_bank, restored_streams)
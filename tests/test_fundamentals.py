@@ -0,0 +1,101 @@
+"""
+FundamentalsPanel ratios must match the original per-quarter ratio loop,
+frozen below, for every symbol of a mixed-length universe.
+"""
+
+import random
+
+import numpy as np
+
+from app import FundamentalsPanel, calculate_financial_ratios
+
+
+def legacy_financial_ratios(fundamentals, current_price, market_cap):
+    ratios = {
+        'pe_ratio': [], 'current_ratio': [], 'roe': [], 'roa': [], 'net_profit_margin': [],
+        'debt_to_equity': [], 'price_to_book': [], 'price_to_sales': [], 'asset_turnover': [], 'fcfy': [],
+    }
+    
+    n = len(fundamentals.get('revenue', []))
+    
+    for i in range(n):
+        try:
+            revenue = fundamentals['revenue'][i]
+            net_income = fundamentals['net_income'][i]
+            total_assets = fundamentals['total_assets'][i]
+            equity = fundamentals['shareholders_equity'][i]
+            current_assets = fundamentals['current_assets'][i]
+            current_liabilities = fundamentals['current_liabilities'][i]
+            total_debt = fundamentals['total_debt'][i]
+            eps = fundamentals['eps'][i]
+            
+            ratios['pe_ratio'].append(current_price / eps if eps and eps > 0 else None)
+            ratios['current_ratio'].append(current_assets / current_liabilities if current_liabilities else None)
+            ratios['roe'].append(net_income / equity if equity and equity > 0 else None)
+            ratios['roa'].append(net_income / total_assets if total_assets else None)
+            ratios['net_profit_margin'].append(net_income / revenue if revenue else None)
+            ratios['debt_to_equity'].append(total_debt / equity if equity and equity > 0 else None)
+            
+            book_value_per_share = equity / (market_cap / current_price) if current_price and market_cap else None
+            ratios['price_to_book'].append(
+                current_price / book_value_per_share if book_value_per_share and book_value_per_share > 0 else None
+            )
+            
+            annual_revenue = revenue * 4
+            ratios['price_to_sales'].append(market_cap / annual_revenue if annual_revenue else None)
+            ratios['asset_turnover'].append(revenue / total_assets if total_assets else None)
+            
+            if i >= 3:
+                annual_fcf = sum(fundamentals['fcf'][max(0, i-3):i+1])
+                fcfy = annual_fcf / market_cap if market_cap else None
+            else:
+                fcfy = None
+            ratios['fcfy'].append(fcfy)
+            
+        except Exception:
+            for key in ratios:
+                ratios[key].append(None)
+    
+    return ratios
+
+
+def random_fundamentals(rng, quarters):
+    return {
+        metric: [rng.choice([0.0, -rng.uniform(1e6, 5e9), rng.uniform(1e6, 1e10), rng.uniform(0.01, 20)])
+                 for _ in range(quarters)]
+        for metric in FundamentalsPanel.RATIO_INPUTS
+    }
+
+
+def assert_same_ratios(actual, expected):
+    assert actual.keys() == expected.keys()
+    for name in expected:
+        assert len(actual[name]) == len(expected[name]), name
+        for a, e in zip(actual[name], expected[name]):
+            assert (a is None) == (e is None), name
+            if e is not None:
+                assert a == e, (name, a, e)
+
+
+def test_universe_panel_matches_legacy_loop():
+    rng = random.Random(0)
+    for _ in range(20):
+        symbols = [f"S{k}" for k in range(50)]
+        fundamentals = {s: random_fundamentals(rng, rng.randrange(0, 25)) for s in symbols}
+        prices = [rng.choice([0.0, rng.uniform(1, 500)]) for _ in symbols]
+        market_caps = [rng.choice([0.0, 1e9, rng.uniform(1e8, 1e12)]) for _ in symbols]
+        
+        panel = FundamentalsPanel(symbols, fundamentals)
+        ratios = panel.ratios(np.array(prices), np.array(market_caps))
+        
+        for row, symbol in enumerate(symbols):
+            expected = legacy_financial_ratios(fundamentals[symbol], prices[row], market_caps[row])
+            assert_same_ratios(panel.ratio_lists(ratios, row), expected)
+            assert_same_ratios(calculate_financial_ratios(fundamentals[symbol], prices[row], market_caps[row]),
+                               expected)
+
+
+def test_empty_panel():
+    panel = FundamentalsPanel([], {})
+    ratios = panel.ratios(np.empty(0), np.empty(0))
+    assert all(values.shape == (0, 0) for values in ratios.values())
@@ -0,0 +1,25 @@
+from app import IngestionEngine
+
+
+def test_map_survives_failing_jobs_and_callbacks():
+    engine = IngestionEngine(max_workers=4, rate=1000.0, burst=100)
+    keys = [str(i) for i in range(20)]
+    seen = []
+    
+    def job(key):
+        if key == '3':
+            raise ValueError("job failed")
+        return int(key)
+    
+    def on_result(key, result, completed):
+        if key == '5':
+            raise KeyError('h')
+        seen.append((key, result))
+    
+    results = engine.map(job, keys, on_result)
+    
+    assert set(results) == set(keys)
+    assert results['3'] is None
+    assert results['5'] == 5
+    assert len(seen) == 19
+    assert ('3', None) in seen
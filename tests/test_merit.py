@@ -0,0 +1,268 @@
+"""
+The breakpoint tables, the scalar scorers and the vectorized batch scorer
+must all agree with the original if/elif scoring ladders, frozen below.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+import app
+from app import (FUNDAMENTAL_MERIT_RULES, STASIS_MERIT_RULES, WEEK52_RULE, apply_merit_scores,
+                 calculate_fundamental_merit_score, calculate_stasis_merit_score, fms_cache, score_snapshots)
+
+
+@pytest.fixture(autouse=True)
+def fresh_fms_cache():
+    # Each test installs its own fundamental_slopes under the same symbol names
+    fms_cache.invalidate()
+    yield
+    fms_cache.invalidate()
+
+
+def legacy_stasis_merit(snapshot):
+    merit_score = 0
+    
+    stasis = snapshot.get('stasis', 0)
+    if stasis >= 15: merit_score += 10
+    elif stasis >= 12: merit_score += 9
+    elif stasis >= 10: merit_score += 8
+    elif stasis >= 8: merit_score += 7
+    elif stasis >= 7: merit_score += 6
+    elif stasis >= 6: merit_score += 5
+    elif stasis >= 5: merit_score += 4
+    elif stasis >= 4: merit_score += 3
+    elif stasis >= 3: merit_score += 2
+    elif stasis >= 2: merit_score += 1
+    
+    rr = snapshot.get('risk_reward')
+    if rr is not None:
+        if rr >= 3: merit_score += 5
+        elif rr >= 2.5: merit_score += 4
+        elif rr >= 2: merit_score += 3
+        elif rr >= 1.5: merit_score += 2
+        elif rr >= 1: merit_score += 1
+    
+    strength = snapshot.get('signal_strength')
+    if strength == 'VERY_STRONG': merit_score += 4
+    elif strength == 'STRONG': merit_score += 3
+    elif strength == 'MODERATE': merit_score += 2
+    elif strength == 'WEAK': merit_score += 1
+    
+    duration_seconds = snapshot.get('duration_seconds', 0)
+    if duration_seconds >= 3600: merit_score += 3
+    elif duration_seconds >= 1800: merit_score += 2
+    elif duration_seconds >= 900: merit_score += 1
+    
+    return merit_score
+
+
+def legacy_week52_merit(week52_percentile):
+    if week52_percentile is None: return 0
+    if week52_percentile <= 5: return 8
+    if week52_percentile <= 15: return 7
+    if week52_percentile <= 25: return 6
+    if week52_percentile <= 35: return 5
+    if week52_percentile <= 45: return 4
+    if week52_percentile <= 55: return 3
+    if week52_percentile <= 65: return 2
+    if week52_percentile <= 75: return 1
+    return 0
+
+
+def legacy_fundamental_merit(slopes, week52_percentile):
+    if not slopes:
+        return legacy_week52_merit(week52_percentile)
+    
+    merit_score = 0
+    
+    v = slopes.get('Rev_Slope_5')
+    if v is not None:
+        if v >= 0.30: merit_score += 4
+        elif v >= 0.20: merit_score += 3
+        elif v >= 0.10: merit_score += 2
+        elif v >= 0.05: merit_score += 1
+    v = slopes.get('Rev_Slope_20')
+    if v is not None:
+        if v >= 0.20: merit_score += 3
+        elif v >= 0.10: merit_score += 2
+        elif v >= 0.05: merit_score += 1
+    
+    v = slopes.get('FCF_Slope_5')
+    if v is not None:
+        if v >= 0.40: merit_score += 4
+        elif v >= 0.25: merit_score += 3
+        elif v >= 0.10: merit_score += 2
+        elif v >= 0.05: merit_score += 1
+    v = slopes.get('FCF_Slope_20')
+    if v is not None:
+        if v >= 0.25: merit_score += 3
+        elif v >= 0.15: merit_score += 2
+        elif v >= 0.05: merit_score += 1
+    
+    v = slopes.get('Return on Equity_Slope_5')
+    if v is not None:
+        if v >= 0.20: merit_score += 2
+        elif v >= 0.10: merit_score += 1
+    v = slopes.get('Return on Equity_Slope_20')
+    if v is not None:
+        if v >= 0.15: merit_score += 2
+        elif v >= 0.08: merit_score += 1
+    
+    v = slopes.get('Return on Assets_Slope_5')
+    if v is not None:
+        if v >= 0.15: merit_score += 2
+        elif v >= 0.08: merit_score += 1
+    
+    v = slopes.get('Net Profit Margin_Slope_5')
+    if v is not None:
+        if v >= 0.20: merit_score += 2
+        elif v >= 0.10: merit_score += 1
+    v = slopes.get('Net Profit Margin_Slope_20')
+    if v is not None:
+        if v >= 0.15: merit_score += 2
+        elif v >= 0.08: merit_score += 1
+    
+    v = slopes.get('Asset Turnover_Slope_5')
+    if v is not None and v >= 0.10: merit_score += 1
+    v = slopes.get('Current Ratio_Slope_5')
+    if v is not None and v >= 0.10: merit_score += 1
+    
+    v = slopes.get('P/E Ratio_Slope_5')
+    if v is not None:
+        if v <= -0.25: merit_score += 3
+        elif v <= -0.15: merit_score += 2
+        elif v <= -0.05: merit_score += 1
+    v = slopes.get('P/E Ratio_Slope_20')
+    if v is not None:
+        if v <= -0.20: merit_score += 2
+        elif v <= -0.10: merit_score += 1
+    
+    v = slopes.get('Debt to Equity Ratio_Slope_5')
+    if v is not None:
+        if v <= -0.20: merit_score += 2
+        elif v <= -0.10: merit_score += 1
+    v = slopes.get('Debt to Equity Ratio_Slope_20')
+    if v is not None:
+        if v <= -0.15: merit_score += 2
+        elif v <= -0.08: merit_score += 1
+    
+    v = slopes.get('Price to Book Ratio_Slope_5')
+    if v is not None and v <= -0.20: merit_score += 1
+    v = slopes.get('Price to Sales Ratio_Slope_5')
+    if v is not None and v <= -0.20: merit_score += 1
+    
+    merit_score += legacy_week52_merit(week52_percentile)
+    
+    v = slopes.get('FCFY')
+    if v is not None:
+        if v >= 0.15: merit_score += 3
+        elif v >= 0.10: merit_score += 2
+        elif v >= 0.05: merit_score += 1
+    
+    return merit_score
+
+
+def edge_values(rule, rng):
+    """Every edge, values just either side of it, beyond both ends, and missing."""
+    values = [None, rule.edges[0] - 1.0, rule.edges[-1] + 1.0]
+    for edge in rule.edges:
+        values += [edge, np.nextafter(edge, -np.inf), np.nextafter(edge, np.inf)]
+    return values + [rng.uniform(rule.edges[0] - 0.5, rule.edges[-1] + 0.5) for _ in range(5)]
+
+
+def random_universe(seed, n_symbols=60, n_rows=1500):
+    rng = random.Random(seed)
+    
+    fundamental_slopes = {}
+    for k in range(n_symbols):
+        if k % 7 == 0:
+            continue  # no fundamentals: 52W percentile only
+        slopes = {}
+        for rule in FUNDAMENTAL_MERIT_RULES:
+            if rng.random() < 0.1:
+                continue
+            slopes[rule.field] = rng.choice(edge_values(rule, rng)[1:])
+        fundamental_slopes[f"S{k}"] = slopes
+    
+    strengths = [None, 'WEAK', 'MODERATE', 'STRONG', 'VERY_STRONG']
+    rules = {rule.field: rule for rule in STASIS_MERIT_RULES}
+    snapshots = []
+    for _ in range(n_rows):
+        snapshots.append({
+            'symbol': f"S{rng.randrange(n_symbols + 5)}",
+            'stasis': int(rng.choice(edge_values(rules['stasis'], rng)[1:])) if rng.random() < 0.5 else rng.randrange(0, 25),
+            'risk_reward': rng.choice(edge_values(rules['risk_reward'], rng)),
+            'signal_strength': rng.choice(strengths),
+            'duration_seconds': rng.choice([0, 899, 900, 901, 1799, 1800, 3599, 3600, 86400, rng.randrange(0, 7200)]),
+            'week52_percentile': rng.choice(edge_values(WEEK52_RULE, rng)),
+        })
+    return fundamental_slopes, snapshots
+
+
+@pytest.mark.parametrize('rule', STASIS_MERIT_RULES + FUNDAMENTAL_MERIT_RULES + [WEEK52_RULE],
+                         ids=lambda rule: rule.field)
+def test_score_array_matches_score(rule):
+    values = edge_values(rule, random.Random(0))
+    expected = [rule.score(v) for v in values]
+    column = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    assert rule.score_array(column).tolist() == expected
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_scalar_scores_match_legacy_ladders(seed, monkeypatch):
+    fundamental_slopes, snapshots = random_universe(seed)
+    monkeypatch.setattr(app.config, 'fundamental_slopes', fundamental_slopes)
+    
+    for snapshot in snapshots:
+        assert calculate_stasis_merit_score(snapshot) == legacy_stasis_merit(snapshot)
+        fms, _ = calculate_fundamental_merit_score(snapshot['symbol'], snapshot['week52_percentile'])
+        assert fms == legacy_fundamental_merit(fundamental_slopes.get(snapshot['symbol']),
+                                               snapshot['week52_percentile'])
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_batch_scores_match_legacy_ladders(seed, monkeypatch):
+    fundamental_slopes, snapshots = random_universe(seed)
+    monkeypatch.setattr(app.config, 'fundamental_slopes', fundamental_slopes)
+    
+    sms, fms, combined, _ = score_snapshots(snapshots)
+    expected_sms = [legacy_stasis_merit(d) for d in snapshots]
+    expected_fms = [legacy_fundamental_merit(fundamental_slopes.get(d['symbol']), d['week52_percentile'])
+                    for d in snapshots]
+    assert sms.tolist() == expected_sms
+    assert fms.tolist() == expected_fms
+    assert combined.tolist() == [s + f for s, f in zip(expected_sms, expected_fms)]
+    
+    apply_merit_scores(snapshots)
+    for d in snapshots:
+        _, slope_details = calculate_fundamental_merit_score(d['symbol'], d['week52_percentile'])
+        assert d['slope_details'] == slope_details
+        assert type(d['combined_merit_score']) is int
+
+
+def test_fms_cache_reuses_and_invalidates(monkeypatch):
+    fundamental_slopes, snapshots = random_universe(0)
+    monkeypatch.setattr(app.config, 'fundamental_slopes', fundamental_slopes)
+    
+    _, first, _, _ = score_snapshots(snapshots)
+    cached = {symbol: dict(buckets) for symbol, buckets in fms_cache.entries.items()}
+    assert cached
+    _, second, _, _ = score_snapshots(snapshots)
+    assert second.tolist() == first.tolist()
+    assert fms_cache.entries == cached
+    
+    # Replaced slopes are only picked up after invalidation
+    symbol = next(iter(fundamental_slopes))
+    fundamental_slopes[symbol] = {rule.field: 1.0 for rule in FUNDAMENTAL_MERIT_RULES}
+    fms_cache.invalidate([symbol])
+    _, third, _, _ = score_snapshots(snapshots)
+    expected = [legacy_fundamental_merit(fundamental_slopes.get(d['symbol']), d['week52_percentile'])
+                for d in snapshots]
+    assert third.tolist() == expected
+
+
+def test_batch_scores_empty():
+    sms, fms, combined, slope_details = score_snapshots([])
+    assert len(sms) == len(fms) == len(combined) == len(slope_details) == 0
@@ -0,0 +1,38 @@
+import json
+
+import numpy as np
+
+from app import parse_minute_bars
+
+# Shape of a Polygon /v2/aggs/ticker/.../range/1/minute response
+RESPONSE = {
+    "ticker": "AAPL",
+    "queryCount": 3,
+    "resultsCount": 3,
+    "adjusted": True,
+    "results": [
+        {"v": 1523.0, "vw": 189.9812, "o": 189.95, "c": 190.01, "h": 190.05, "l": 189.94,
+         "t": 1717579800000, "n": 42},
+        {"v": 980, "vw": 190.02, "o": 190.01, "c": 190, "h": 190.04, "l": 189.99,
+         "t": 1717579860000, "n": 17},
+        {"v": 2.1e3, "vw": 189.7, "o": 190.0, "c": 1.8967e2, "h": 190.0, "l": 189.6,
+         "t": 1717579920000, "n": 31, "otc": False},
+    ],
+    "status": "OK",
+    "request_id": "6a7e466379af0a71039d60cc78e72282",
+    "count": 3,
+}
+
+
+def test_parse_minute_bars():
+    timestamps, closes = parse_minute_bars(json.dumps(RESPONSE).encode())
+    assert timestamps.dtype == np.int64 and closes.dtype == np.float64
+    assert timestamps.tolist() == [1717579800000, 1717579860000, 1717579920000]
+    assert closes.tolist() == [190.01, 190.0, 189.67]
+
+
+def test_parse_minute_bars_no_results():
+    body = json.dumps({"ticker": "AAPL", "queryCount": 0, "resultsCount": 0, "status": "OK"}).encode()
+    timestamps, closes = parse_minute_bars(body)
+    assert len(timestamps) == 0 and len(closes) == 0
+    assert timestamps.dtype == np.int64 and closes.dtype == np.float64
@@ -0,0 +1,52 @@
+import numpy as np
+
+from app import MinuteBarStore
+
+
+def bars(start_ms, n):
+    timestamps = start_ms + 60_000 * np.arange(n, dtype=np.int64)
+    closes = 100.0 + np.arange(n, dtype=np.float64) / 8
+    return timestamps, closes
+
+
+def test_round_trip(tmp_path):
+    store = MinuteBarStore(str(tmp_path))
+    t, c = bars(1_700_000_000_000, 100)
+    store.append('AAPL', t, c, keep_from_ms=0)
+    
+    loaded_t, loaded_c = store.load('AAPL')
+    assert loaded_t.dtype == np.int64 and loaded_c.dtype == np.float32
+    assert np.array_equal(loaded_t, t)
+    assert np.array_equal(loaded_c, c.astype(np.float32))
+    
+    window_t, window_c = store.window('AAPL', int(t[40]))
+    assert np.array_equal(window_t, t[40:])
+    assert np.array_equal(window_c, c[40:].astype(np.float32))
+
+
+def test_append_only_newer_and_trim(tmp_path):
+    store = MinuteBarStore(str(tmp_path))
+    t, c = bars(1_700_000_000_000, 100)
+    store.append('AAPL', t[:60], c[:60], keep_from_ms=0)
+    # Overlapping fetch: bars already stored are skipped, old ones trimmed
+    store.append('AAPL', t[50:], c[50:], keep_from_ms=int(t[10]))
+    
+    loaded_t, loaded_c = store.load('AAPL')
+    assert np.array_equal(loaded_t, t[10:])
+    assert np.array_equal(loaded_c, c[10:].astype(np.float32))
+
+
+def test_window_is_not_mapped(tmp_path):
+    store = MinuteBarStore(str(tmp_path))
+    t, c = bars(1_700_000_000_000, 10)
+    store.append('AAPL', t, c, keep_from_ms=0)
+    
+    window_t, window_c = store.window('AAPL', 0)
+    assert not isinstance(window_t, np.memmap) and window_t.base is None
+    assert not isinstance(window_c, np.memmap) and window_c.base is None
+
+
+def test_missing_symbol(tmp_path):
+    store = MinuteBarStore(str(tmp_path))
+    window_t, window_c = store.window('NOPE', 0)
+    assert len(window_t) == 0 and len(window_c) == 0